@@ -0,0 +1,213 @@
+"""Load test of the network layer against the bundled fake mojang server
+
+Sweeps concurrency, cache warmth and error rates for ``Player.initialize`` and ``fetch_skin``
+and reports throughput, latency percentiles, connection counts and memory per scenario.
+The fake server runs on its own thread, timings and requests / newly opened connections
+are taken from an untraced pass, the peak memory from a second, traced one.
+Warm scenarios run once with the in-memory caches only and once with a ``DiskTextureCache``
+as well, so textures don't have to be downloaded again either.
+
+Usage::
+
+    python benchmarks/network.py --players 500 --concurrency 1 10 50 200 --output results.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+
+import minepi
+from minepi.fake_server import FakeMojangServer
+
+
+def clear_caches():
+    minepi.name_cache.clear()
+    minepi.profile_cache.clear()
+    minepi.skin_interner.clear()
+
+
+async def initialize(uuid: str, client: minepi.MinePIClient):
+    await minepi.Player(uuid=uuid, client=client).initialize()
+
+
+async def fetch_skin(uuid: str, client: minepi.MinePIClient):
+    await minepi.fetch_skin(uuid=uuid, client=client)
+
+
+OPERATIONS = {
+    "initialize": initialize,
+    "fetch_skin": fetch_skin,
+}
+
+
+async def run_pass(operation, uuids: list, client: minepi.MinePIClient, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+
+    async def run(uuid: str):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await operation(uuid, client)
+            except Exception:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[run(uuid) for uuid in uuids])
+    return time.perf_counter() - start, latencies, errors
+
+
+class ServerThread:
+    """Runs a FakeMojangServer on its own event loop, so serving doesn't compete with the measured client"""
+
+    def __init__(self, **kwargs):
+        self.server = FakeMojangServer(**kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    async def call(self, func, *args):
+        """Run ``func(*args)`` (a coroutine function) on the server loop"""
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(func(*args), self._loop))
+
+    async def stats(self) -> tuple:
+        async def read():
+            return sum(self.server.hits.values()), self.server.connections
+        return await self.call(read)
+
+    async def reset_stats(self):
+        async def reset():
+            self.server.reset_stats()
+        await self.call(reset)
+
+    async def __aenter__(self):
+        self._thread.start()
+        await self.call(self.server.start)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.call(self.server.close)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+async def measure(operation: str, uuids: list, concurrency: int, warm: bool, disk: bool, server: ServerThread, args, trace: bool):
+    """One timed pass with fresh caches. With ``trace`` set, the peak traced memory is returned instead of timings"""
+    clear_caches()
+    with tempfile.TemporaryDirectory() as path:
+        texture_cache = minepi.DiskTextureCache(path) if disk else None
+        async with minepi.MinePIClient(
+                endpoints=server.server.endpoints,
+                limit=args.limit,
+                texture_cache=texture_cache,
+        ) as client:
+            if warm:
+                await run_pass(OPERATIONS[operation], uuids, client, concurrency)
+
+            await server.reset_stats()
+            if trace:
+                tracemalloc.start()
+                await run_pass(OPERATIONS[operation], uuids, client, concurrency)
+                _, peak_memory = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                return peak_memory
+
+            duration, latencies, errors = await run_pass(OPERATIONS[operation], uuids, client, concurrency)
+            requests, connections = await server.stats()
+            return duration, latencies, errors, requests, connections
+
+
+async def run_scenario(
+        operation: str,
+        players: int,
+        concurrency: int,
+        warm: bool,
+        disk: bool,
+        error_rate: float,
+        args,
+) -> dict:
+    uuids = [f"{i:032x}" for i in range(players)]
+
+    async with ServerThread(
+            latency=args.latency,
+            error_rate=error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            retry_after=args.retry_after,
+            skin_variety=args.skin_variety,
+            seed=args.seed,
+    ) as server:
+        # tracing slows everything down, so memory is measured in a separate pass
+        duration, latencies, errors, requests, connections = await measure(
+            operation, uuids, concurrency, warm, disk, server, args, trace=False
+        )
+        peak_memory = await measure(operation, uuids, concurrency, warm, disk, server, args, trace=True)
+
+    percentiles = np.percentile(latencies, [50, 95, 99]) * 1000 if latencies else [None] * 3
+    return {
+        "operation": operation,
+        "players": players,
+        "concurrency": concurrency,
+        "warm": warm,
+        "texture_cache": disk,
+        "error_rate": error_rate,
+        "duration_s": duration,
+        "throughput_per_s": len(latencies) / duration,
+        "errors": errors,
+        "latency_ms": {"p50": percentiles[0], "p95": percentiles[1], "p99": percentiles[2]},
+        "requests": requests,
+        "connections": connections,
+        "peak_traced_memory_bytes": peak_memory,
+        "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+async def main(args):
+    results = []
+    for operation in args.operations:
+        for error_rate in args.error_rates:
+            for warm, disk in ((False, False), (True, False), (True, True)):
+                for concurrency in args.concurrency:
+                    result = await run_scenario(operation, args.players, concurrency, warm, disk, error_rate, args)
+                    results.append(result)
+                    print(
+                        f"{operation:>10} errors={error_rate:<4} warm={warm!s:<5} disk={disk!s:<5} concurrency={concurrency:<4} "
+                        f"{result['throughput_per_s']:8.1f}/s  p50={result['latency_ms']['p50'] or 0:7.1f}ms  "
+                        f"p99={result['latency_ms']['p99'] or 0:7.1f}ms  failed={result['errors']:<4} requests={result['requests']:<5} "
+                        f"connections={result['connections']}"
+                    )
+
+    report = {
+        "python": platform.python_version(),
+        "settings": vars(args),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=200, help="players per scenario")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50, 200])
+    parser.add_argument("--error-rates", type=float, nargs="+", default=[0, 0.05])
+    parser.add_argument("--operations", nargs="+", default=list(OPERATIONS), choices=list(OPERATIONS))
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds the fake server delays each response")
+    parser.add_argument("--rate-limit-rate", type=float, default=0, help="share of 429 responses")
+    parser.add_argument("--retry-after", type=float, default=0.1)
+    parser.add_argument("--skin-variety", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=100, help="connection limit of the client")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,15 @@
+import asyncio
+import minepi
+
+async def main():
+    async with minepi.MinePIClient() as client:  # one pooled session reused by all requests
+        uuids = [
+            "1cb4b37f6a1a4f8a9c4ee1a3a8d5b8a0",
+            "069a79f444e94726a5befca90e38aaf5",
+        ]
+
+        # initializes at most 50 players at the same time and yields them once they're ready
+        async for player in minepi.load_players(uuids, client=client, concurrency=50):
+            print(player)
+
+asyncio.run(main())
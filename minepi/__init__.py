@@ -1,15 +1,26 @@
+from .client import MinePIClient, DEFAULT_ENDPOINTS, get_default_client, close_default_client
+from .transport import Transport, AiohttpTransport
+from .ratelimit import RateLimiter
+from .singleflight import SingleFlight, single_flight
 from .player import Player
-from .skin import Skin
+from .skin import Skin, LazySkin
+from .store import SkinStore
+from .pipeline import render_pipeline
+from .cache import SkinInterner, skin_interner, NameCache, name_cache, ProfileCache, profile_cache, DiskTextureCache, CapeCache, cape_cache
 
 from .utils import (
     uuid_to_dashed,
     uuid_to_undashed,
+    texture_hash,
+    register_texture_host,
     name_to_uuid,
     uuid_to_name,
+    fetch_profile,
     fetch_skin,
     fetch_optifine_cape,
     fetch_labymod_cape,
     fetch_5zig_cape,
     fetch_minecraftcapes_cape,
     get_players_by_name,
+    load_players,
 )
@@ -0,0 +1,596 @@
+import asyncio
+import os
+import tempfile
+import time
+import weakref
+
+from PIL import Image
+from typing import Optional, Dict, Tuple, Any, Hashable
+
+from .skin import texture_hash
+
+
+__all__ = [
+    "SkinInterner",
+    "skin_interner",
+    "NameCache",
+    "name_cache",
+    "ProfileCache",
+    "profile_cache",
+    "DiskTextureCache",
+    "CapeCache",
+    "cape_cache",
+]
+
+
+MISSING = object()
+
+
+class _TTLDict:
+    """Dict with expiring entries, dropping the oldest ones once it is full"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable):
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        expiry, value = entry
+        if expiry < time.monotonic():
+            del self._entries[key]
+            return MISSING
+        return value
+
+    def set(self, key: Hashable, value, ttl: float):
+        self._entries.pop(key, None)  # re-inserting keeps the dict ordered by age
+        self._entries[key] = (time.monotonic() + ttl, value)
+        while len(self._entries) > self.maxsize:
+            del self._entries[next(iter(self._entries))]
+
+    def pop(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+def _uuid_key(uuid: str) -> str:
+    return uuid.replace("-", "").lower()
+
+
+def _image_bytes(image: Optional[Image.Image]) -> int:
+    if image is None:
+        return 0
+    return image.width * image.height * len(image.getbands())
+
+
+class SkinInterner:
+    """Deduplicates identical textures in memory
+
+    Textures are keyed by their mojang texture hash (or url for other providers).
+    Only weak references are kept, so entries vanish as soon as no player uses them anymore.
+    Every player still gets its own :class:`minepi.Skin`, only the pixel data is shared.
+
+    Warning
+    -------
+    Interned images are shared between players and must not be modified.
+    """
+
+    def __init__(self):
+        self._images = weakref.WeakValueDictionary()
+        self._hits: int = 0
+        self._saved_bytes: int = 0
+
+    def __repr__(self):
+        return f"<SkinInterner (images={len(self._images)}) (hits={self._hits})>"
+
+    @staticmethod
+    def _image_key(url: str) -> str:
+        return texture_hash(url) or url
+
+    def get_image(self, url: Optional[str]) -> Optional[Image.Image]:
+        """Get an already interned texture by its url
+
+        Parameters
+        ----------
+        url: Optional[str]
+            The texture url
+
+        Returns
+        -------
+        Optional[PIL.Image.Image]
+            None if the texture is not interned
+        """
+        if url is None:
+            return None
+        image = self._images.get(self._image_key(url))
+        if image is not None:
+            self._hits += 1
+            self._saved_bytes += _image_bytes(image)
+        return image
+
+    def intern_image(self, url: str, image: Image.Image) -> Image.Image:
+        """Intern a texture
+
+        Parameters
+        ----------
+        url: str
+            The url the texture has been downloaded from
+        image: PIL.Image.Image
+            The texture
+
+        Returns
+        -------
+        PIL.Image.Image
+            The shared texture. Might be a different object than the one passed
+        """
+        key = self._image_key(url)
+        existing = self._images.get(key)
+        if existing is not None:
+            self._hits += 1
+            self._saved_bytes += _image_bytes(image)
+            return existing
+        self._images[key] = image
+        return image
+
+    @property
+    def hits(self) -> int:
+        """How often an already interned texture has been reused"""
+        return self._hits
+
+    @property
+    def saved_bytes(self) -> int:
+        """Approximate amount of pixel memory saved by deduplication"""
+        return self._saved_bytes
+
+    def stats(self) -> dict:
+        """Current number of interned images, hits and saved bytes"""
+        return {
+            "images": len(self._images),
+            "hits": self._hits,
+            "saved_bytes": self._saved_bytes,
+        }
+
+    def clear(self):
+        """Forget all interned textures"""
+        self._images.clear()
+
+
+skin_interner = SkinInterner()
+
+
+class NameCache:
+    """TTL cache for the resolution of names to UUIDs and back
+
+    Names are case insensitive. Unknown names and UUIDs are cached as well (for a shorter time),
+    so repeated lookups of invalid players don't hit the API either.
+    Entries are kept apart by a ``scope``, so clients using other endpoints (e.g. a test server)
+    don't share their results with clients using the real API.
+
+    Tip
+    ----
+    Use :py:attr:`MISSING` to tell apart an uncached entry from a cached unknown player::
+
+        uuid = name_cache.get_uuid(name)
+        if uuid is NameCache.MISSING:
+            ...  # not cached, ask the API
+
+    Parameters
+    ----------
+    ttl: float
+        Seconds a known name/UUID pair is cached for
+    negative_ttl: float
+        Seconds an unknown name or UUID is cached for
+    maxsize: int
+        Maximum number of names (and UUIDs) kept. The oldest entries are dropped first
+    """
+
+    MISSING = MISSING
+
+    def __init__(self, ttl: float = 600, negative_ttl: float = 60, maxsize: int = 10000):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._uuids = _TTLDict(maxsize)  # (scope, lowercase name) -> uuid
+        self._names = _TTLDict(maxsize)  # (scope, undashed uuid) -> name
+
+    def __repr__(self):
+        return f"<NameCache (names={len(self._uuids)}) (uuids={len(self._names)}) (ttl={self.ttl})>"
+
+    def get_uuid(self, name: str, scope: str = ""):
+        """Get the cached UUID of a name
+
+        Parameters
+        ----------
+        name: str
+            The minecraft name (case insensitive)
+        scope: str
+            Separates entries of different endpoints, see :py:meth:`minepi.MinePIClient.cache_scope`
+
+        Returns
+        -------
+        Optional[str]
+            None if the name is known to be invalid, :py:attr:`MISSING` if it is not cached
+        """
+        return self._uuids.get((scope, name.lower()))
+
+    def get_name(self, uuid: str, scope: str = ""):
+        """Get the cached name of a UUID
+
+        Parameters
+        ----------
+        uuid: str
+            The UUID (dashed or not)
+        scope: str
+            Separates entries of different endpoints, see :py:meth:`minepi.MinePIClient.cache_scope`
+
+        Returns
+        -------
+        Optional[str]
+            None if the UUID is known to be invalid, :py:attr:`MISSING` if it is not cached
+        """
+        return self._names.get((scope, _uuid_key(uuid)))
+
+    def put(self, name: str, uuid: str, scope: str = ""):
+        """Remember a name/UUID pair
+
+        Parameters
+        ----------
+        name: str
+            The minecraft name
+        uuid: str
+            The UUID belonging to the name
+        scope: str
+            Separates entries of different endpoints, see :py:meth:`minepi.MinePIClient.cache_scope`
+        """
+        uuid = _uuid_key(uuid)
+        self._uuids.set((scope, name.lower()), uuid, self.ttl)
+        self._names.set((scope, uuid), name, self.ttl)
+
+    def put_missing_name(self, name: str, scope: str = ""):
+        """Remember that a name does not belong to any player"""
+        self._uuids.set((scope, name.lower()), None, self.negative_ttl)
+
+    def put_missing_uuid(self, uuid: str, scope: str = ""):
+        """Remember that a UUID does not belong to any player"""
+        self._names.set((scope, _uuid_key(uuid)), None, self.negative_ttl)
+
+    def clear(self):
+        """Forget all cached names and UUIDs"""
+        self._uuids.clear()
+        self._names.clear()
+
+
+class ProfileCache:
+    """TTL cache for parsed session server profiles
+
+    A profile is a dict containing the players ``uuid``, ``name``, ``skin_url``, ``cape_url``
+    and skin ``model`` (``"classic"`` or ``"slim"``). Invalid UUIDs are cached as None.
+    Like in :py:class:`NameCache`, entries are kept apart by a ``scope``.
+
+    Note
+    ----
+    The session server itself caches profiles for about a minute, so longer TTLs mostly
+    delay noticing skin changes.
+
+    Parameters
+    ----------
+    ttl: float
+        Seconds a profile is cached for
+    negative_ttl: float
+        Seconds an invalid UUID is cached for
+    maxsize: int
+        Maximum number of profiles kept. The oldest ones are dropped first
+    """
+
+    MISSING = MISSING
+
+    def __init__(self, ttl: float = 120, negative_ttl: float = 60, maxsize: int = 10000):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._profiles = _TTLDict(maxsize)
+
+    def __repr__(self):
+        return f"<ProfileCache (profiles={len(self._profiles)}) (ttl={self.ttl})>"
+
+    def get(self, uuid: str, scope: str = ""):
+        """Get the cached profile of a UUID
+
+        Parameters
+        ----------
+        uuid: str
+            The UUID (dashed or not)
+        scope: str
+            Separates entries of different endpoints, see :py:meth:`minepi.MinePIClient.cache_scope`
+
+        Returns
+        -------
+        Optional[dict]
+            None if the UUID is known to be invalid, :py:attr:`MISSING` if it is not cached
+        """
+        return self._profiles.get((scope, _uuid_key(uuid)))
+
+    def put(self, profile: dict, scope: str = ""):
+        """Remember a parsed profile"""
+        self._profiles.set((scope, _uuid_key(profile["uuid"])), profile, self.ttl)
+
+    def put_missing(self, uuid: str, scope: str = ""):
+        """Remember that a UUID does not belong to any player"""
+        self._profiles.set((scope, _uuid_key(uuid)), None, self.negative_ttl)
+
+    def clear(self):
+        """Forget all cached profiles"""
+        self._profiles.clear()
+
+
+class DiskTextureCache:
+    """Persistent cache for mojang textures
+
+    Textures on textures.minecraft.net (or a registered texture host) never change, their url
+    contains the hash of the image. They are stored as the downloaded PNG files named by that hash,
+    so a restarted process doesn't need to download them again. Other urls are not cached.
+    Files are written atomically and all file access happens in the default executor.
+
+    Tip
+    ----
+    Pass it to a :py:class:`minepi.MinePIClient` to use it for all texture downloads::
+
+        client = MinePIClient(texture_cache=DiskTextureCache("textures"))
+
+    Parameters
+    ----------
+    path: str
+        Directory of the cache. Created if it does not exist
+    max_bytes: int
+        Size budget of the cache. The least recently used textures are deleted once it is exceeded
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024):
+        self._path = path
+        self.max_bytes = max_bytes
+        self._sizes: Dict[str, int] = {}  # texture hash -> file size, least recently used first
+        self._total: int = 0
+
+        os.makedirs(path, exist_ok=True)
+        files = []
+        for entry in os.scandir(path):
+            if entry.name.endswith(".tmp"):
+                os.remove(entry.path)  # left behind by an interrupted write
+            elif entry.name.endswith(".png"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+        for _, key, size in sorted(files):
+            self._sizes[key] = size
+            self._total += size
+
+    def __repr__(self):
+        return f"<DiskTextureCache (path={self._path}) (textures={len(self)}) (bytes={self._total})>"
+
+    def __len__(self):
+        return len(self._sizes)
+
+    def __contains__(self, url: str):
+        return texture_hash(url) in self._sizes
+
+    @property
+    def size(self) -> int:
+        """Total size of all cached textures in bytes"""
+        return self._total
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self._path, f"{key}.png")
+
+    def _read(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self._file(key), "rb") as f:
+                data = f.read()
+            os.utime(self._file(key))  # the modification time orders the cache after a restart
+            return data
+        except FileNotFoundError:
+            return None
+
+    def _write(self, key: str, data: bytes):
+        fd, tmp = tempfile.mkstemp(dir=self._path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._file(key))
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    def _remove(self, keys: list):
+        for key in keys:
+            try:
+                os.remove(self._file(key))
+            except FileNotFoundError:
+                pass
+
+    async def get(self, url: str) -> Optional[bytes]:
+        """Get the PNG data of a cached texture
+
+        Parameters
+        ----------
+        url: str
+            The texture url
+
+        Returns
+        -------
+        Optional[bytes]
+            None if the texture is not cached
+        """
+        key = texture_hash(url)
+        if key not in self._sizes:
+            return None
+
+        data = await asyncio.get_event_loop().run_in_executor(None, self._read, key)
+        if data is None:  # deleted by someone else
+            self._total -= self._sizes.pop(key, 0)
+        elif key in self._sizes:
+            self._sizes[key] = self._sizes.pop(key)
+        return data
+
+    async def put(self, url: str, data: bytes):
+        """Store the PNG data of a texture
+
+        Parameters
+        ----------
+        url: str
+            The texture url. Ignored if it does not contain a texture hash
+        data: bytes
+            The downloaded PNG file
+        """
+        key = texture_hash(url)
+        if key is None or key in self._sizes or len(data) > self.max_bytes:
+            return
+
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self._write, key, data)
+        if key in self._sizes:  # written concurrently
+            return
+        self._sizes[key] = len(data)
+        self._total += len(data)
+
+        evicted = []
+        while self._total > self.max_bytes:
+            old = next(iter(self._sizes))
+            self._total -= self._sizes.pop(old)
+            evicted.append(old)
+        if evicted:
+            await loop.run_in_executor(None, self._remove, evicted)
+
+    async def clear(self):
+        """Delete all cached textures"""
+        keys = list(self._sizes)
+        self._sizes.clear()
+        self._total = 0
+        await asyncio.get_event_loop().run_in_executor(None, self._remove, keys)
+
+
+class CapeCache:
+    """Cache for capes of third party providers (optifine, labymod, ...)
+
+    Those capes can change at any time, so they are revalidated on every lookup: downloaded
+    capes are stored together with their ``ETag`` / ``Last-Modified`` validators and
+    an unchanged cape (304 response) is reused without downloading or decoding it again.
+
+    Most players don't have a cape at those providers. These results are remembered
+    per provider and player for :py:attr:`negative_ttl` seconds, so asking again costs no request.
+    Like in :py:class:`NameCache`, entries are kept apart by a ``scope``.
+
+    Parameters
+    ----------
+    ttl: float
+        Seconds a downloaded cape and its validators are kept
+    negative_ttl: float
+        Seconds a player is remembered to have no cape at a provider
+    maxsize: int
+        Maximum number of entries kept. The oldest ones are dropped first
+    """
+
+    MISSING = MISSING
+
+    def __init__(self, ttl: float = 86400, negative_ttl: float = 600, maxsize: int = 10000):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries = _TTLDict(maxsize)  # key -> None or (cape, etag, last modified)
+
+    def __repr__(self):
+        return f"<CapeCache (entries={len(self._entries)}) (ttl={self.ttl}) (negative_ttl={self.negative_ttl})>"
+
+    @staticmethod
+    def _key(provider: str, identity: str, scope: str) -> tuple:
+        return scope, provider, _uuid_key(identity)
+
+    def get(self, provider: str, identity: str, scope: str = ""):
+        """Get the cached cape of a player
+
+        Parameters
+        ----------
+        provider: str
+            The cape provider, e.g. ``"optifine"``
+        identity: str
+            Name or UUID of the player, whichever the provider uses
+        scope: str
+            Separates entries of different endpoints, see :py:meth:`minepi.MinePIClient.cache_scope`
+
+        Returns
+        -------
+        Optional[PIL.Image.Image]
+            None if the player is known to have no cape, :py:attr:`MISSING` if nothing is cached
+        """
+        entry = self._entries.get(self._key(provider, identity, scope))
+        if entry is MISSING or entry is None:
+            return entry
+        return entry[0]
+
+    def validators(self, provider: str, identity: str, scope: str = "") -> Dict[str, str]:
+        """Headers to revalidate the cached cape of a player with
+
+        Returns
+        -------
+        Dict[str, str]
+            ``If-None-Match`` and/or ``If-Modified-Since``. Empty if no cape is cached
+        """
+        entry = self._entries.get(self._key(provider, identity, scope))
+        if entry is MISSING or entry is None:
+            return {}
+
+        headers = {}
+        _, etag, last_modified = entry
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def put(
+            self,
+            provider: str,
+            identity: str,
+            cape: Image.Image,
+            etag: str = None,
+            last_modified: str = None,
+            scope: str = "",
+    ):
+        """Remember a downloaded cape
+
+        Capes without any validator are not stored since they couldn't be revalidated,
+        a previously cached cape of the player is dropped in that case
+
+        Parameters
+        ----------
+        provider: str
+            The cape provider
+        identity: str
+            Name or UUID of the player
+        cape: PIL.Image.Image
+            The decoded cape
+        etag: str
+            The ``ETag`` header of the response
+        last_modified: str
+            The ``Last-Modified`` header of the response
+        scope: str
+            Separates entries of different endpoints, see :py:meth:`minepi.MinePIClient.cache_scope`
+        """
+        if etag is None and last_modified is None:
+            self._entries.pop(self._key(provider, identity, scope))  # outdated, no matter what
+            return
+        self._entries.set(self._key(provider, identity, scope), (cape, etag, last_modified), self.ttl)
+
+    def put_missing(self, provider: str, identity: str, scope: str = ""):
+        """Remember that a player has no cape at the given provider"""
+        self._entries.set(self._key(provider, identity, scope), None, self.negative_ttl)
+
+    def clear(self):
+        """Forget all cached capes"""
+        self._entries.clear()
+
+
+name_cache = NameCache()
+profile_cache = ProfileCache()
+cape_cache = CapeCache()
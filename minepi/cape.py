@@ -0,0 +1,93 @@
+from math import ceil
+
+from PIL import Image
+from typing import List
+
+
+__all__ = [
+    "NormalizedCape",
+    "normalize_cape",
+]
+
+
+class NormalizedCape:
+    """A cape converted to the canonical mojang layout
+
+    Every frame uses the 64x32 layout of mojang capes multiplied by :py:attr:`scale`.
+
+    Parameters
+    ----------
+    frames: List[PIL.Image.Image]
+        The RGBA frames of the cape. Static capes only have one
+    scale: int
+        Resolution of the cape compared to a 64x32 cape
+    """
+
+    def __init__(self, frames: List[Image.Image], scale: int):
+        self._frames: List[Image.Image] = frames
+        self._scale: int = scale
+
+    def __repr__(self):
+        return f"<NormalizedCape (scale={self.scale}) (frames={len(self.frames)})>"
+
+    @property
+    def frames(self):
+        """All frames of the cape"""
+        return self._frames
+
+    @property
+    def texture(self):
+        """The first (or only) frame of the cape"""
+        return self._frames[0]
+
+    @property
+    def scale(self):
+        """Resolution of the cape compared to a 64x32 cape"""
+        return self._scale
+
+    @property
+    def is_animated(self):
+        """Whether the cape has more than one frame"""
+        return len(self._frames) > 1
+
+
+def normalize_cape(cape: Image.Image) -> NormalizedCape:
+    """Converts a cape of any supported provider format to the canonical layout
+
+    Supported are mojang capes in any resolution, animated sprite strips (MinecraftCapes,
+    TLauncher) with one 64x32 frame below the other and cropped layouts like LabyMod (22x17)
+    or OptiFine (46x22, 92x44).
+
+    Parameters
+    ----------
+    cape: PIL.Image.Image
+        The raw cape image
+
+    Returns
+    -------
+    NormalizedCape
+    """
+    if cape.mode != "RGBA":
+        cape = cape.convert(mode="RGBA")
+    width, height = cape.size
+
+    if width >= 64 and width % 64 == 0 and height > width // 2 and height % (width // 2) == 0:
+        # animated sprite strip
+        scale = width // 64
+        frame_height = 32 * scale
+        frames = [cape.crop((0, i * frame_height, width, (i + 1) * frame_height)) for i in range(height // frame_height)]
+        return NormalizedCape(frames, scale)
+
+    if width == 2 * height:
+        if width % 64 == 0:
+            return NormalizedCape([cape], width // 64)
+
+        # wrongly scaled, snap to the closest resolution
+        scale = max(1, round(width / 64))
+        return NormalizedCape([cape.resize((64 * scale, 32 * scale), resample=Image.NEAREST)], scale)
+
+    # cropped layouts only contain the top left part of the texture
+    scale = max(1, ceil(width / 64), ceil(height / 32))
+    canvas = Image.new("RGBA", (64 * scale, 32 * scale), (0, 0, 0, 0))
+    canvas.paste(cape.crop((0, 0, min(width, 64 * scale), min(height, 32 * scale))), (0, 0))
+    return NormalizedCape([canvas], scale)
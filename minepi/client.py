@@ -0,0 +1,250 @@
+import asyncio
+
+import aiohttp
+from contextlib import asynccontextmanager
+from typing import Optional, Dict
+
+from .cache import DiskTextureCache
+from .ratelimit import RateLimiter, default_rate_limiter, parse_retry_after, backoff_delay
+from .skin import register_texture_host
+from .transport import Transport, AiohttpTransport
+
+
+__all__ = [
+    "DEFAULT_ENDPOINTS",
+    "MinePIClient",
+    "get_default_client",
+    "close_default_client",
+]
+
+
+DEFAULT_ENDPOINTS: Dict[str, str] = {
+    "api": "https://api.mojang.com",
+    "sessionserver": "https://sessionserver.mojang.com",
+    "textures": "http://textures.minecraft.net",
+    "optifine": "http://s.optifine.net",
+    "labymod": "https://dl.labymod.net",
+    "5zig": "https://textures.5zigreborn.eu",
+    "minecraftcapes": "https://minecraftcapes.net",
+    "tlauncher": "https://auth.tlauncher.org",
+}
+
+
+class MinePIClient:
+    """Long-lived HTTP client used for all requests of this library
+
+    Owns a single pooled :py:class:`aiohttp.ClientSession` with keep-alive connections,
+    per-host connection limits and DNS caching, so consecutive requests don't need new
+    TCP and TLS handshakes. Pass it to any fetch function or :py:class:`minepi.Player` using
+    the ``client`` parameter. Functions called without a client or session share a default one.
+
+    Tip
+    ----
+    Use it as an async context manager to close the session once you're done::
+
+        async with MinePIClient() as client:
+            skin = await minepi.fetch_skin(name="sucr_kolli", client=client)
+
+    Parameters
+    ----------
+    session: aiohttp.ClientSession
+        Use an existing session instead of creating one. It is not closed by this client
+    limit: int
+        Maximum number of simultaneous connections
+    limit_per_host: int
+        Maximum number of simultaneous connections to a single host
+    dns_cache_ttl: int
+        Seconds DNS lookups are cached for
+    keepalive_timeout: float
+        Seconds idle connections are kept open
+    timeout: float
+        Total timeout of a single request in seconds
+    rate_limiter: RateLimiter
+        Limits the request rate per endpoint. Defaults to a limiter shared by all clients
+    max_retries: int
+        How often a request is retried after a 429 (Too Many Requests) response
+    texture_cache: DiskTextureCache
+        Persistent cache for downloaded mojang textures. Disabled by default
+    endpoints: Dict[str, str]
+        Base urls replacing the ones of :py:data:`DEFAULT_ENDPOINTS`, e.g. ``{"api": "http://localhost:8080"}``
+    transport: Transport
+        Sends the requests. Defaults to an :py:class:`AiohttpTransport` using the parameters above
+    """
+
+    def __init__(
+            self,
+            session: aiohttp.ClientSession = None,
+            limit: int = 100,
+            limit_per_host: int = 20,
+            dns_cache_ttl: int = 300,
+            keepalive_timeout: float = 30,
+            timeout: float = 30,
+            rate_limiter: RateLimiter = None,
+            max_retries: int = 3,
+            texture_cache: DiskTextureCache = None,
+            endpoints: Dict[str, str] = None,
+            transport: Transport = None,
+    ):
+        if transport is None:
+            transport = AiohttpTransport(
+                session=session,
+                limit=limit,
+                limit_per_host=limit_per_host,
+                dns_cache_ttl=dns_cache_ttl,
+                keepalive_timeout=keepalive_timeout,
+                timeout=timeout,
+            )
+        self._transport: Transport = transport
+
+        self.endpoints: Dict[str, str] = {**DEFAULT_ENDPOINTS, **(endpoints or {})}
+        register_texture_host(self.endpoints["textures"])
+        self.rate_limiter: RateLimiter = rate_limiter if rate_limiter is not None else default_rate_limiter
+        self.max_retries = max_retries
+        self.texture_cache: Optional[DiskTextureCache] = texture_cache
+
+    def __repr__(self):
+        return f"<MinePIClient (transport={self._transport}) (closed={self.closed})>"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def transport(self) -> Transport:
+        """The transport sending the requests"""
+        return self._transport
+
+    @property
+    def session(self) -> Optional[aiohttp.ClientSession]:
+        """The underlying session. None if the transport doesn't use one"""
+        return getattr(self._transport, "session", None)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the transport has been closed"""
+        return self._transport.closed
+
+    def url(self, endpoint: str, path: str) -> str:
+        """Build the url of a request
+
+        Parameters
+        ----------
+        endpoint: str
+            Name of the endpoint, one of the keys of :py:data:`DEFAULT_ENDPOINTS`
+        path: str
+            The path, starting with a slash
+
+        Returns
+        -------
+        str
+        """
+        return self.endpoints[endpoint].rstrip("/") + path
+
+    def cache_scope(self, *endpoints: str) -> str:
+        """Scope of cached results and shared lookups of the given endpoints
+
+        Clients using the default endpoints share one scope, clients using other base urls
+        (e.g. a :py:class:`minepi.fake_server.FakeMojangServer`) get their own one.
+
+        Parameters
+        ----------
+        endpoints: str
+            Names of the endpoints, keys of :py:data:`DEFAULT_ENDPOINTS`
+
+        Returns
+        -------
+        str
+            Empty for the default endpoints
+        """
+        return "|".join(
+            f"{endpoint}={self.endpoints[endpoint]}" for endpoint in endpoints
+            if self.endpoints[endpoint] != DEFAULT_ENDPOINTS.get(endpoint)
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests currently waiting for the rate limiter"""
+        return self.rate_limiter.queue_depth()
+
+    def get(self, url: str, **kwargs):
+        """Send a GET request. Use as ``async with client.get(url) as resp:``"""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        """Send a POST request. Use as ``async with client.post(url, json=...) as resp:``"""
+        return self.request("POST", url, **kwargs)
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, **kwargs):
+        """Send a request through the transport
+
+        Waits for the rate limiter of the endpoint first. 429 responses are retried
+        after the time given in their Retry-After header or a jittered backoff."""
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire(url)
+            resp = await self._transport.request(method, url, **kwargs)
+            if resp.status != 429 or attempt >= self.max_retries:
+                break
+
+            delay = parse_retry_after(resp.headers.get("Retry-After"))
+            if delay is None:
+                delay = backoff_delay(attempt)
+            resp.release()
+            self.rate_limiter.pause(url, delay)  # other requests to this endpoint back off as well
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        try:
+            yield resp
+        finally:
+            resp.release()
+
+    async def close(self):
+        """Closes the transport. A session passed to this client is not closed
+
+        The client can't be used anymore afterwards, requests raise a :py:exc:`RuntimeError`."""
+        await self._transport.close()
+
+
+_default_client: Optional[MinePIClient] = None
+
+
+def get_default_client() -> MinePIClient:
+    """The client shared by all functions which are called without a client or session
+
+    A new one is created once it has been closed.
+
+    Returns
+    -------
+    MinePIClient
+    """
+    global _default_client
+    if _default_client is None or _default_client.closed:
+        _default_client = MinePIClient()
+    return _default_client
+
+
+async def close_default_client():
+    """Closes the client shared by all functions which are called without a client or session
+
+    Call it before your event loop shuts down to release its connections.
+    """
+    global _default_client
+    if _default_client is not None:
+        client, _default_client = _default_client, None
+        await client.close()
+
+
+def resolve_client(session: aiohttp.ClientSession = None, client: MinePIClient = None) -> MinePIClient:
+    """Picks the client to use for a request
+
+    An explicit client wins, a passed session is wrapped (without taking ownership),
+    otherwise the default client is used."""
+    if client is not None:
+        return client
+    if session is not None:
+        return MinePIClient(session=session)
+    return get_default_client()
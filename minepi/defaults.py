@@ -0,0 +1,63 @@
+from PIL import Image
+from typing import Optional, Dict
+
+from .skin import texture_hash
+
+
+__all__ = [
+    "default_texture",
+    "register_default_texture",
+    "is_default_texture",
+]
+
+
+_default_textures: Dict[str, Image.Image] = {}
+
+
+def register_default_texture(texture: str, image: Image.Image):
+    """Register a texture which is known locally and never has to be downloaded
+
+    Useful for the default skins (e.g. Steve or Alex) which are used by a lot of players.
+
+    Parameters
+    ----------
+    texture: str
+        The texture url or texture hash
+    image: PIL.Image.Image
+        The texture
+    """
+    _default_textures[(texture_hash(texture) or texture).lower()] = image
+
+
+def is_default_texture(url: Optional[str]) -> bool:
+    """Whether the given texture url belongs to a registered default texture
+
+    Parameters
+    ----------
+    url: Optional[str]
+        The texture url
+
+    Returns
+    -------
+    bool
+    """
+    key = texture_hash(url)
+    return key is not None and key in _default_textures
+
+
+def default_texture(url: Optional[str]) -> Optional[Image.Image]:
+    """Get a registered default texture without downloading it
+
+    Parameters
+    ----------
+    url: Optional[str]
+        The texture url
+
+    Returns
+    -------
+    Optional[PIL.Image.Image]
+        None if the url does not belong to a registered default texture
+    """
+    if not is_default_texture(url):
+        return None
+    return _default_textures[texture_hash(url)]
@@ -0,0 +1,269 @@
+import asyncio
+import base64
+import hashlib
+import json
+import random
+
+import numpy as np
+from aiohttp import web
+from io import BytesIO
+from PIL import Image
+from typing import Dict, Optional
+
+from .client import DEFAULT_ENDPOINTS
+
+
+__all__ = [
+    "FakeMojangServer",
+]
+
+
+def _synthetic_texture(seed: str, size: tuple) -> bytes:
+    rng = np.random.default_rng(int(hashlib.md5(seed.encode()).hexdigest()[:8], 16))
+    pixels = rng.integers(0, 256, (size[1], size[0], 4), dtype=np.uint8)
+    pixels[..., 3] = 255
+    buffer = BytesIO()
+    Image.fromarray(pixels, "RGBA").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class FakeMojangServer:
+    """Local stand-in for the mojang API and all cape providers
+
+    Serves synthetic but consistent players: every name exists (unless it starts with
+    ``invalid``), its UUID is derived from the lowercase name and skins, capes and models
+    are picked from a fixed amount of textures. Latency, server errors and 429 responses
+    can be injected to benchmark or test a client offline.
+
+    Tip
+    ----
+    ::
+
+        async with FakeMojangServer(latency=0.05, rate_limit_rate=0.01) as server:
+            async with MinePIClient(endpoints=server.endpoints) as client:
+                players = await minepi.get_players_by_name(["a", "b"], client=client)
+
+    Parameters
+    ----------
+    latency: float
+        Seconds every response is delayed by
+    error_rate: float
+        Share of requests answered with 500
+    rate_limit_rate: float
+        Share of requests answered with 429
+    retry_after: float
+        Value of the Retry-After header of 429 responses
+    cape_rate: float
+        Share of players having a cape (at every provider)
+    skin_variety: int
+        Number of different skins handed out, so identical skins occur like in reality
+    seed: int
+        Seed of the injected errors
+    """
+
+    def __init__(
+            self,
+            latency: float = 0,
+            error_rate: float = 0,
+            rate_limit_rate: float = 0,
+            retry_after: float = 1,
+            cape_rate: float = 0.1,
+            skin_variety: int = 1000,
+            seed: int = None,
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.cape_rate = cape_rate
+        self.skin_variety = skin_variety
+
+        self._random = random.Random(seed)
+        self._names: Dict[str, str] = {}  # uuid -> name
+        self._textures: Dict[str, bytes] = {}
+        self._hashes: Dict[str, str] = {}  # texture hash -> texture key
+        self._hits: Dict[str, int] = {}
+        self._connections: int = 0
+        self._runner: Optional[web.AppRunner] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._url: Optional[str] = None
+
+    def __repr__(self):
+        return f"<FakeMojangServer (url={self._url}) (hits={sum(self._hits.values())})>"
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def url(self) -> Optional[str]:
+        """Base url of the running server"""
+        return self._url
+
+    @property
+    def endpoints(self) -> Dict[str, str]:
+        """Endpoints to pass to :py:class:`minepi.MinePIClient` to use this server"""
+        return {endpoint: f"{self._url}/{endpoint}" for endpoint in DEFAULT_ENDPOINTS}
+
+    @property
+    def hits(self) -> Dict[str, int]:
+        """Number of requests by route"""
+        return dict(self._hits)
+
+    @property
+    def connections(self) -> int:
+        """Number of TCP connections accepted"""
+        return self._connections
+
+    def reset_stats(self):
+        """Reset :py:attr:`hits` and :py:attr:`connections`, e.g. between two benchmark passes"""
+        self._hits.clear()
+        self._connections = 0
+
+    def _uuid(self, name: str) -> str:
+        uuid = hashlib.md5(name.lower().encode()).hexdigest()
+        self._names.setdefault(uuid, name)
+        return uuid
+
+    def _name(self, uuid: str) -> str:
+        return self._names.get(uuid, f"P_{uuid[:14]}")
+
+    def _has_cape(self, uuid: str) -> bool:
+        return int(uuid[-4:], 16) / 0xffff < self.cape_rate
+
+    def _texture(self, key: str) -> bytes:
+        if key not in self._textures:
+            size = (64, 32) if key.startswith("cape") else (64, 64)
+            self._textures[key] = _synthetic_texture(key, size)
+            self._hashes[hashlib.sha256(self._textures[key]).hexdigest()] = key
+        return self._textures[key]
+
+    def _texture_url(self, key: str) -> str:
+        # named by the hash of the image like on textures.minecraft.net
+        return f"{self._url}/textures/texture/{hashlib.sha256(self._texture(key)).hexdigest()}"
+
+    def _profile(self, uuid: str) -> dict:
+        number = int(uuid, 16)
+        textures = {"SKIN": {"url": self._texture_url(f"skin{number % self.skin_variety}")}}
+        if number % 2:
+            textures["SKIN"]["metadata"] = {"model": "slim"}
+        if self._has_cape(uuid):
+            textures["CAPE"] = {"url": self._texture_url(f"cape{number % 16}")}
+        value = {"profileId": uuid, "profileName": self._name(uuid), "textures": textures}
+        return {
+            "id": uuid,
+            "name": self._name(uuid),
+            "properties": [{"name": "textures", "value": base64.b64encode(json.dumps(value).encode()).decode()}],
+        }
+
+    @web.middleware
+    async def _inject(self, request: web.Request, handler):
+        route = request.match_info.route.resource.canonical if request.match_info.route.resource else "unknown"
+        self._hits[route] = self._hits.get(route, 0) + 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        roll = self._random.random()
+        if roll < self.rate_limit_rate:
+            return web.Response(status=429, headers={"Retry-After": str(self.retry_after)})
+        if roll < self.rate_limit_rate + self.error_rate:
+            return web.Response(status=500)
+        return await handler(request)
+
+    async def _name_to_uuid(self, request: web.Request):
+        name = request.match_info["name"]
+        if name.lower().startswith("invalid"):
+            return web.Response(status=404)
+        return web.json_response({"id": self._uuid(name), "name": name})
+
+    async def _names_to_uuids(self, request: web.Request):
+        names = await request.json()
+        if len(names) > 10:
+            return web.json_response({"error": "Not more than 10 profile name per call is allowed."}, status=400)
+        return web.json_response([
+            {"id": self._uuid(name), "name": name} for name in names if not name.lower().startswith("invalid")
+        ])
+
+    async def _session_profile(self, request: web.Request):
+        uuid = request.match_info["uuid"].replace("-", "").lower()
+        if len(uuid) != 32:
+            return web.Response(status=400)
+        return web.json_response(self._profile(uuid))
+
+    async def _texture_file(self, request: web.Request):
+        key = self._hashes.get(request.match_info["hash"].lower())
+        if key is None:
+            return web.Response(status=404)
+        return web.Response(body=self._texture(key), content_type="image/png")
+
+    def _cape(self, request: web.Request, uuid: Optional[str]) -> web.Response:
+        if uuid is None or not self._has_cape(uuid):
+            return web.Response(status=404)
+        key = f"cape{int(uuid, 16) % 16}"
+        etag = f'"{key}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(body=self._texture(key), content_type="image/png", headers={"ETag": etag})
+
+    async def _cape_by_name(self, request: web.Request):
+        return self._cape(request, self._uuid(request.match_info["name"]))
+
+    async def _cape_by_uuid(self, request: web.Request):
+        return self._cape(request, request.match_info["uuid"].replace("-", "").lower())
+
+    async def _tlauncher(self, request: web.Request):
+        uuid = self._uuid(request.match_info["name"])
+        if not self._has_cape(uuid):
+            return web.json_response({})
+        # tlauncher hosts its capes itself, urls on the textures endpoint are mojang capes
+        url = self._texture_url(f"cape{int(uuid, 16) % 16}").replace("/textures/texture/", "/tlauncher/texture/")
+        return web.json_response({"CAPE": {"url": url}})
+
+    def app(self) -> web.Application:
+        """The aiohttp application, e.g. to run it with :py:func:`aiohttp.web.run_app`"""
+        app = web.Application(middlewares=[self._inject])
+        app.router.add_get("/api/users/profiles/minecraft/{name}", self._name_to_uuid)
+        app.router.add_post("/api/profiles/minecraft", self._names_to_uuids)
+        app.router.add_get("/sessionserver/session/minecraft/profile/{uuid}", self._session_profile)
+        app.router.add_get("/textures/texture/{hash}", self._texture_file)
+        app.router.add_get("/optifine/capes/{name}.png", self._cape_by_name)
+        app.router.add_get("/labymod/capes/{uuid}", self._cape_by_uuid)
+        app.router.add_get("/5zig/profile/{uuid}", self._cape_by_uuid)
+        app.router.add_get("/minecraftcapes/profile/{uuid}/cape", self._cape_by_uuid)
+        app.router.add_get("/tlauncher/skin/profile/texture/login/{name}", self._tlauncher)
+        app.router.add_get("/tlauncher/texture/{hash}", self._texture_file)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0):
+        """Start serving
+
+        Parameters
+        ----------
+        host: str
+            The host to bind to
+        port: int
+            The port to bind to. 0 picks a free one
+        """
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+
+        def accept():
+            self._connections += 1
+            return self._runner.server()
+
+        self._server = await asyncio.get_running_loop().create_server(accept, host, port)
+        port = self._server.sockets[0].getsockname()[1]
+        self._url = f"http://{host}:{port}"
+
+    async def close(self):
+        """Stop serving"""
+        if self._server is not None:
+            self._server.close()  # stop accepting, open connections are closed by the runner
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
@@ -0,0 +1,164 @@
+import asyncio
+import re
+
+import aiohttp
+from PIL import Image
+from typing import AsyncIterator, AsyncIterable, Iterable, Tuple, Union
+
+from .client import MinePIClient, resolve_client
+from .errors import InvalidPlayer
+from .player import Player
+
+
+__all__ = [
+    "render_pipeline",
+]
+
+
+_UUID_RE = re.compile(r"^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$")
+_DONE = object()
+
+
+async def _iterate(identities: Union[Iterable[str], AsyncIterable[str]]) -> AsyncIterator[str]:
+    if hasattr(identities, "__aiter__"):
+        async for identity in identities:
+            yield identity
+    else:
+        for identity in identities:
+            yield identity
+
+
+async def render_pipeline(
+        identities: Union[Iterable[str], AsyncIterable[str]],
+        render: str = "head",
+        render_kwargs: dict = None,
+        session: aiohttp.ClientSession = None,
+        client: MinePIClient = None,
+        fetch_concurrency: int = 20,
+        render_concurrency: int = 4,
+        queue_size: int = 64,
+) -> AsyncIterator[Tuple[Player, Image.Image]]:
+    """Fetch and render many players as a stream
+
+    Fetching (name resolution, profile and textures) and rendering run as separate stages,
+    each with its own amount of workers. The stages are connected by bounded queues, so a slow
+    stage makes the previous ones wait instead of piling up players in memory.
+    Results are yielded as soon as they are rendered, so not necessarily in the given order.
+    Invalid names and UUIDs are skipped, so are players whose requests fail or whose textures are broken.
+
+    Tip
+    ----
+    ::
+
+        async with minepi.MinePIClient() as client:
+            async for player, im in render_pipeline(uuids, render_kwargs={"ratio": 6}, client=client):
+                im.save(f"{player.uuid}.png")
+
+    Parameters
+    ----------
+    identities: Union[Iterable[str], AsyncIterable[str]]
+        Names and/or UUIDs of the players. Consumed lazily
+    render: str
+        What to render: ``"head"`` (:py:func:`Skin.render_head`) or ``"skin"`` (:py:func:`Skin.render_skin`)
+    render_kwargs: dict
+        Keyword arguments passed to the render function
+    session: aiohttp.ClientSession
+        The ClientSession to use for requests
+    client: MinePIClient
+        The client to use for requests
+        Defaults to a shared client with pooled connections
+    fetch_concurrency: int
+        Number of players fetched at the same time
+    render_concurrency: int
+        Number of players rendered at the same time
+    queue_size: int
+        Maximum number of items waiting between two stages
+
+    Yields
+    ------
+    Tuple[Player, PIL.Image.Image]
+        The player and its render
+
+    Raises
+    ------
+    ValueError
+        An unknown render type has been passed
+    """
+    if render not in ("head", "skin"):
+        raise ValueError(f"Unknown render type: {render}")
+    render_kwargs = render_kwargs or {}
+    client = resolve_client(session, client)
+
+    identities_queue = asyncio.Queue(queue_size)
+    players_queue = asyncio.Queue(queue_size)
+    results_queue = asyncio.Queue(queue_size)
+
+    tasks = []
+
+    def start(coro) -> asyncio.Task:
+        async def guard():
+            try:
+                await coro
+            except Exception as e:  # handed to the consumer, which raises it
+                await results_queue.put(e)
+
+        task = asyncio.ensure_future(guard())
+        tasks.append(task)
+        return task
+
+    async def feed():
+        async for identity in _iterate(identities):
+            await identities_queue.put(identity)
+        for _ in range(fetch_concurrency):
+            await identities_queue.put(_DONE)
+
+    async def fetch():
+        while True:
+            identity = await identities_queue.get()
+            if identity is _DONE:
+                break
+            if _UUID_RE.match(identity):
+                player = Player(uuid=identity, client=client)
+            else:
+                player = Player(name=identity, client=client)
+            try:
+                await player.initialize()
+            except (InvalidPlayer, aiohttp.ClientError, asyncio.TimeoutError, OSError, ValueError):
+                continue  # one failed player must not end the stream
+            if player.skin is not None:
+                await players_queue.put(player)
+
+    async def render_player():
+        while True:
+            player = await players_queue.get()
+            if player is _DONE:
+                break
+            if render == "head":
+                im = await player.skin.render_head(**render_kwargs)
+            else:
+                im = await player.skin.render_skin(**render_kwargs)
+            await results_queue.put((player, im))
+
+    async def close_stage(workers: list, queue: asyncio.Queue, count: int):
+        # tells the workers of the next stage to stop once all workers of a stage are done
+        await asyncio.wait(workers)
+        for _ in range(count):
+            await queue.put(_DONE)
+
+    fetchers = [start(feed())] + [start(fetch()) for _ in range(fetch_concurrency)]
+    renderers = [start(render_player()) for _ in range(render_concurrency)]
+    start(close_stage(fetchers, players_queue, render_concurrency))
+    start(close_stage(renderers, results_queue, 1))
+
+    try:
+        while True:
+            result = await results_queue.get()
+            if result is _DONE:
+                break
+            if isinstance(result, Exception):
+                raise result
+            yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,12 +1,11 @@
 import asyncio
-import base64
-import json
-from io import BytesIO
-from typing import Optional
+from typing import Optional, Iterable
 
 import aiohttp
 from PIL import Image
 
+from .client import MinePIClient, resolve_client
+from .singleflight import single_flight
 from .skin import Skin
 from .utils import (
     fetch_optifine_cape,
@@ -14,12 +13,25 @@ from .utils import (
     fetch_5zig_cape,
     fetch_minecraftcapes_cape,
     fetch_tlauncher_cape,
+    fetch_profile,
     name_to_uuid,
+    uuid_to_name,
     uuid_to_undashed,
+    _fetch_texture,
+    _none,
 )
 from .errors import InvalidPlayer
 
 
+_CAPE_PROVIDERS = {
+    "optifine": fetch_optifine_cape,
+    "labymod": fetch_labymod_cape,
+    "5zig": fetch_5zig_cape,
+    "minecraftcapes": fetch_minecraftcapes_cape,
+    "tlauncher": fetch_tlauncher_cape,
+}
+
+
 class Player:
     """Class representing a minecraft player
     This has to be created before a skin can be rendered
@@ -36,6 +48,8 @@ class Player:
         Raw cape image of the player (64x32px)
     session: aiohttp.ClientSession
         ClientSession to use for requests
+    client: MinePIClient
+        Client to use for requests. Defaults to a shared client with pooled connections
     """
     def __init__(
             self,
@@ -43,7 +57,8 @@ class Player:
             name: str = None,
             raw_skin: Image.Image = None,
             raw_cape: Image.Image = None,
-            session: aiohttp.ClientSession = None
+            session: aiohttp.ClientSession = None,
+            client: MinePIClient = None,
     ):
         if uuid is None and name is None:
             raise ValueError("Pass a username or UUID")
@@ -63,8 +78,9 @@ class Player:
             "tlauncher": None,
         }
 
-        self._session: Optional[aiohttp.ClientSession] = session
-        self._close_session: bool = False
+        self._client: Optional[MinePIClient] = client
+        if client is None and session is not None:
+            self._client = MinePIClient(session=session)
 
         self._ready: asyncio.Event = asyncio.Event()
         if self._uuid:
@@ -152,55 +168,57 @@ class Player:
             -> 2. Get the players profile\n
             -> (3.) Get the players skin (Only if no skin is given)\n
             -> (4.) Get the players cape (Only if the player actually has a cape)\n
+        Names, profiles and textures are cached, so initializing a known player again costs less.
+        Concurrent lookups of the same player share their requests.
         Rate limits of the API are unknown but expected to be somewhere close to 6000 requests per 10 minutes.
+        Requests are throttled by the :py:class:`RateLimiter` of the client and retried on 429 responses.
 
         Raises
         ------
         errors.InvalidPlayer
-            Player does not seem to be valid
+            Player does not seem to be valid or its skin could not be downloaded
         """
-        if not self._session:
-            self._session = aiohttp.ClientSession()
-            self._close_session = True
+        # concurrent calls on the same player share one initialization
+        await single_flight.do(("player", id(self)), self._initialize)
+
+    async def _initialize(self):
+        client = resolve_client(client=self._client)
 
         if self._uuid is None:
-            uuid = await name_to_uuid(self._username, self._session)
+            uuid = await name_to_uuid(self._username, client=client)
             if uuid:
                 self._uuid = uuid_to_undashed(uuid)
 
-        textures = None
+        profile = None
         if self._uuid is not None and (self._raw_skin is None or self._raw_capes["default"] is None):
-            async with self._session.get(
-                f"https://sessionserver.mojang.com/session/minecraft/profile/{self._uuid}"
-            ) as resp:
-                if resp.status == 200:
-                    resp_dict = await resp.json()
-
-                    self._username = resp_dict["name"] if self._username is None else self._username
-
-                    for p in resp_dict["properties"]:
-                        if p["name"] == "textures":
-                            textures = json.loads(base64.b64decode(p["value"]))["textures"]
-                            break
-
-                    else:
-                        raise InvalidPlayer()
-
-        if textures is not None:
-            _raw_skin_url = textures["SKIN"]["url"]
-            _raw_cape_url = textures["CAPE"]["url"] if "CAPE" in textures.keys() else None
-
-            if not self._raw_skin:
-                async with self._session.get(_raw_skin_url) as resp:
-                    self._raw_skin = Image.open(BytesIO(await resp.read()))
-
-            if not self._raw_capes["default"]:
-                if _raw_cape_url is not None:
-                    async with self._session.get(_raw_cape_url) as resp:
-                        self._raw_capes["default"] = Image.open(BytesIO(await resp.read()))
-                        self._raw_capes["mojang"] = self._raw_capes["default"]
-                else:
-                    self._raw_capes["default"] = None
+            profile = await fetch_profile(self._uuid, client=client)
+            if profile is not None:
+                self._username = profile["name"] if self._username is None else self._username
+                if profile["skin_url"] is None:
+                    raise InvalidPlayer()
+
+        if profile is not None:
+            _raw_skin_url = profile["skin_url"]
+            _raw_cape_url = profile["cape_url"]
+
+            # skin and cape are downloaded at the same time, identical textures are shared
+            # between players but every player gets its own Skin
+            fetch_skin = not self._raw_skin
+            fetch_cape = not self._raw_capes["default"] and _raw_cape_url is not None
+            skin, cape = await asyncio.gather(
+                _fetch_texture(_raw_skin_url, client) if fetch_skin else _none(),
+                _fetch_texture(_raw_cape_url, client) if fetch_cape else _none(),
+            )
+
+            if fetch_skin:
+                if skin is None:
+                    raise InvalidPlayer()  # the skin texture could not be downloaded
+                self._raw_skin = skin
+            if fetch_cape:
+                self._raw_capes["default"] = cape
+                self._raw_capes["mojang"] = cape
+            elif not self._raw_capes["default"]:
+                self._raw_capes["default"] = None
 
             self._skin = Skin(
                 raw_skin=self._raw_skin,
@@ -209,9 +227,6 @@ class Player:
                 raw_cape_url=_raw_cape_url
             )
 
-        if self._close_session:
-            await self._session.close()
-
         self._ready.set()
 
     async def wait_for_fully_constructed(self):
@@ -227,7 +242,7 @@ class Player:
         """Fetches the players optifine cape and stores it to :py:attr:`Player.optifine_cape`
         
         This is basically just an alias for :py:func:`utils.fetch_optifine_cape`"""
-        cape = await fetch_optifine_cape(self)
+        cape = await fetch_optifine_cape(self, client=self._client)
         if cape is not None:
             self._raw_capes["optifine"] = cape
 
@@ -235,7 +250,7 @@ class Player:
         """Fetches the players labymod cape and stores it to :py:attr:`Player.labymod_cape`
 
         This is basically just an alias for :py:func:`utils.fetch_labymod_cape`"""
-        cape = await fetch_labymod_cape(self)
+        cape = await fetch_labymod_cape(self, client=self._client)
         if cape is not None:
             self._raw_capes["labymod"] = cape
 
@@ -243,7 +258,7 @@ class Player:
         """Fetches the players MinecraftCapes cape and stores it to :py:attr:`Player.minecraftcapes_cape`
 
         This is basically just an alias for :py:func:`utils.fetch_minecraftcapes_cape`"""
-        cape = await fetch_minecraftcapes_cape(self)
+        cape = await fetch_minecraftcapes_cape(self, client=self._client)
         if cape is not None:
             self._raw_capes["minecraftcapes"] = cape
 
@@ -251,7 +266,7 @@ class Player:
         """Fetches the players 5Zig cape and stores it to :py:attr:`Player.zig_cape`
 
         This is basically just an alias for :py:func:`utils.fetch_5zig_cape`"""
-        cape = await fetch_5zig_cape(self)
+        cape = await fetch_5zig_cape(self, client=self._client)
         if cape is not None:
             self._raw_capes["5zig"] = cape
 
@@ -259,6 +274,58 @@ class Player:
         """Fetches the players TLauncher cape and stores it to :py:attr:`Player.tlauncher_cape`
 
         This is basically just an alias for :py:func:`utils.fetch_tlauncher_cape`"""
-        cape = await fetch_tlauncher_cape()
+        cape = await fetch_tlauncher_cape(self, client=self._client)
         if cape is not None:
             self._raw_capes["tlauncher"] = cape
+
+    async def fetch_all_capes(self, providers: Iterable[str] = None, timeout: float = 10) -> dict:
+        """Fetches the players capes of all (or the given) providers at the same time
+
+        The name and UUID are resolved once up front. Providers which fail, answer with something
+        unexpected or don't answer in time are skipped, the fetched capes are stored to :py:attr:`Player.capes`.
+
+        Parameters
+        ----------
+        providers: Iterable[str]
+            Names of the providers to query: ``"optifine"``, ``"labymod"``, ``"5zig"``,
+            ``"minecraftcapes"`` and ``"tlauncher"``. Defaults to all of them
+        timeout: float
+            Seconds each provider has to answer
+
+        Returns
+        -------
+        dict
+            :py:attr:`Player.capes`
+
+        Raises
+        ------
+        ValueError
+            An unknown provider has been passed
+        """
+        providers = list(_CAPE_PROVIDERS) if providers is None else list(providers)
+        for provider in providers:
+            if provider not in _CAPE_PROVIDERS:
+                raise ValueError(f"Unknown cape provider: {provider}")
+
+        client = resolve_client(client=self._client)
+        if self._uuid is None:
+            uuid = await name_to_uuid(self._username, client=client)
+            if uuid:
+                self._uuid = uuid_to_undashed(uuid)
+        if self._username is None and self._uuid is not None:
+            self._username = await uuid_to_name(self._uuid, client=client)
+
+        async def fetch(provider: str):
+            try:
+                return await asyncio.wait_for(_CAPE_PROVIDERS[provider](self, client=client), timeout)
+            except (asyncio.TimeoutError, aiohttp.ClientError):
+                return None
+            except (OSError, ValueError):
+                # undecodable images (PIL.UnidentifiedImageError) or unexpected responses of a provider
+                return None
+
+        capes = await asyncio.gather(*[fetch(provider) for provider in providers])
+        for provider, cape in zip(providers, capes):
+            if cape is not None:
+                self._raw_capes[provider] = cape
+        return self._raw_capes
@@ -0,0 +1,172 @@
+import asyncio
+import random
+import time
+
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Tuple
+from urllib.parse import urlsplit
+
+
+__all__ = [
+    "TokenBucket",
+    "RateLimiter",
+    "default_rate_limiter",
+    "parse_retry_after",
+    "backoff_delay",
+]
+
+
+class TokenBucket:
+    """Token bucket limiting the request rate to a single endpoint
+
+    Callers reserve their token up front, so waiting requests are served in order
+    and no locking is required.
+
+    Parameters
+    ----------
+    rate: float
+        Tokens refilled per second (sustained requests per second)
+    capacity: int
+        Maximum amount of tokens (burst size)
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens: float = capacity
+        self._updated: float = time.monotonic()
+        self._paused_until: float = 0
+        self._waiting: int = 0
+
+    def __repr__(self):
+        return f"<TokenBucket (rate={self.rate}) (capacity={self.capacity}) (waiting={self.waiting})>"
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests currently waiting for a token"""
+        return self._waiting
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Waits until a request may be sent"""
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens -= 1  # negative tokens are reservations of waiting callers
+        delay = max(-self._tokens / self.rate, self._paused_until - now)
+        if delay <= 0:
+            return
+
+        self._waiting += 1
+        try:
+            await asyncio.sleep(delay)
+            # the endpoint might have asked us to back off while we were waiting
+            while self._paused_until > time.monotonic():
+                await asyncio.sleep(self._paused_until - time.monotonic())
+        finally:
+            self._waiting -= 1
+
+    def pause(self, seconds: float):
+        """Stops handing out tokens for the given amount of seconds, e.g. after a 429 response"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class RateLimiter:
+    """Per-host rate limiter for the endpoints used by this library
+
+    Hosts without a configured limit are not limited.
+
+    Parameters
+    ----------
+    limits: Dict[str, Tuple[float, int]]
+        Requests per second and burst size by host. Defaults to :py:attr:`DEFAULT_LIMITS`
+    """
+
+    # the mojang API is said to allow ~6000 requests per 10 minutes
+    DEFAULT_LIMITS: Dict[str, Tuple[float, int]] = {
+        "api.mojang.com": (10, 10),
+        "sessionserver.mojang.com": (10, 10),
+        "textures.minecraft.net": (50, 50),
+    }
+
+    def __init__(self, limits: Dict[str, Tuple[float, int]] = None):
+        limits = self.DEFAULT_LIMITS if limits is None else limits
+        self._buckets: Dict[str, TokenBucket] = {
+            host: TokenBucket(rate, capacity) for host, (rate, capacity) in limits.items()
+        }
+
+    def __repr__(self):
+        return f"<RateLimiter (hosts={list(self._buckets)}) (waiting={self.queue_depth()})>"
+
+    def set_limit(self, host: str, rate: float, capacity: int):
+        """Set or replace the limit of a host
+
+        Parameters
+        ----------
+        host: str
+            The host name, e.g. ``api.mojang.com``
+        rate: float
+            Requests per second
+        capacity: int
+            Burst size
+        """
+        self._buckets[host] = TokenBucket(rate, capacity)
+
+    def bucket(self, url: str) -> Optional[TokenBucket]:
+        """The bucket responsible for the given url or host. None if it is not limited"""
+        host = urlsplit(url).hostname if "/" in url else url
+        return self._buckets.get(host)
+
+    async def acquire(self, url: str):
+        """Waits until a request to the given url may be sent"""
+        bucket = self.bucket(url)
+        if bucket is not None:
+            await bucket.acquire()
+
+    def pause(self, url: str, seconds: float):
+        """Pauses all requests to the host of the given url"""
+        bucket = self.bucket(url)
+        if bucket is not None:
+            bucket.pause(seconds)
+
+    def queue_depth(self, host: str = None) -> int:
+        """Number of requests waiting for the given host or for all hosts
+
+        Parameters
+        ----------
+        host: str
+            The host name. Defaults to all hosts
+
+        Returns
+        -------
+        int
+        """
+        if host is not None:
+            bucket = self._buckets.get(host)
+            return bucket.waiting if bucket is not None else 0
+        return sum(bucket.waiting for bucket in self._buckets.values())
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header (seconds or HTTP date) into seconds"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float = 0.5, maximum: float = 30) -> float:
+    """Exponential backoff with jitter for the given (zero based) retry attempt"""
+    delay = min(maximum, base * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+default_rate_limiter = RateLimiter()
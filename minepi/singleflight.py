@@ -0,0 +1,80 @@
+import asyncio
+
+from typing import Awaitable, Callable, Dict, Hashable
+
+
+__all__ = [
+    "SingleFlight",
+    "single_flight",
+]
+
+
+class SingleFlight:
+    """Coalesces concurrent identical lookups into a single one
+
+    The first caller for a key starts the lookup, everyone else asking for the same key while
+    it is running awaits the same task. Results and exceptions are passed to all of them.
+    Once the lookup has finished, the next call starts a new one.
+
+    Note
+    ----
+    Cancelling one caller does not cancel the shared lookup of the others.
+    The lookup itself is cancelled once no caller is waiting for it anymore.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._loops: Dict[Hashable, asyncio.AbstractEventLoop] = {}  # Task.get_loop() needs Python 3.8
+        self._waiters: Dict[asyncio.Task, int] = {}
+
+    def __repr__(self):
+        return f"<SingleFlight (in_flight={len(self._tasks)})>"
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def __contains__(self, key: Hashable):
+        return key in self._tasks
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+            del self._loops[key]
+        if not task.cancelled():
+            task.exception()  # retrieved, even if every caller has gone away in the meantime
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable], *args, **kwargs):
+        """Run ``func(*args, **kwargs)`` unless a call with the same key is already running
+
+        Parameters
+        ----------
+        key: Hashable
+            Identifies the lookup, e.g. ``("profile", uuid)``
+        func: Callable[..., Awaitable]
+            The coroutine function doing the lookup
+
+        Returns
+        -------
+        Any
+            The result of the (possibly shared) call
+        """
+        loop = asyncio.get_running_loop()
+        task = self._tasks.get(key)
+        if task is None or self._loops[key] is not loop:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._tasks[key] = task
+            self._loops[key] = loop
+            task.add_done_callback(lambda t: self._forget(key, t))
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done():
+                    task.cancel()  # every caller has been cancelled, nobody needs the result
+
+
+single_flight = SingleFlight()
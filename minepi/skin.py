@@ -1,12 +1,131 @@
+import asyncio
 import base64
+import hashlib
+import re
+import struct
+import zlib
 
-from typing import Optional
+from typing import Optional, Dict, Iterable, List, Union
+import numpy as np
 from PIL import Image, ImageOps
 from io import BytesIO
 
-from .skin_render import Render
+from .cape import NormalizedCape, normalize_cape
+from .skin_render import Render, mip_chain
 from .errors import NoRenderedSkin
 
+# Binary format: header, length prefixed utf-8 strings (skin url, cape url, name), then the RGBA planes
+_BINARY_MAGIC = b"MPSK"
+_BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct("<4sBBHHHH")  # magic, version, flags, skin w/h, cape w/h
+_BINARY_FLAG_CAPE = 1
+_BINARY_FLAG_ZLIB = 2
+_BINARY_FLAG_SLIM = 4
+
+_TEXTURE_URL_RE = re.compile(r"^https?://(.+)/texture/([0-9a-fA-F]{1,64})$")
+_texture_hosts = {"textures.minecraft.net"}
+
+
+def register_texture_host(url: str):
+    """Treat urls of another texture server like the ones of textures.minecraft.net
+
+    :py:class:`minepi.MinePIClient` registers its ``textures`` endpoint automatically.
+
+    Parameters
+    ----------
+    url: str
+        Base url of the server, textures are expected at ``<url>/texture/<hash>``
+    """
+    _texture_hosts.add(re.sub(r"^https?://", "", url).rstrip("/").lower())
+
+
+def texture_hash(url: Optional[str]) -> Optional[str]:
+    """Extracts the texture hash from a textures.minecraft.net url
+
+    Urls of hosts added with :py:func:`register_texture_host` are accepted as well.
+
+    Parameters
+    ----------
+    url: Optional[str]
+        The texture url
+
+    Returns
+    -------
+    Optional[str]
+        The lowercase texture hash. None if the url is not a texture url
+    """
+    if url is None:
+        return None
+    match = _TEXTURE_URL_RE.match(url)
+    if match is None or match.group(1).lower() not in _texture_hosts:
+        return None
+    return match.group(2).lower()
+
+
+def _pixel_hash(image: Image.Image) -> str:
+    """SHA-256 over the size and RGBA pixels, ignoring the color of fully transparent pixels"""
+    pixels = np.array(image.convert("RGBA"))
+    pixels[pixels[..., 3] == 0] = 0
+    digest = hashlib.sha256(f"{image.width}x{image.height};".encode())
+    digest.update(pixels.tobytes())
+    return digest.hexdigest()
+
+
+def _read_binary_header(view: memoryview):
+    """Parses the header of the binary skin format
+
+    Returns the flags, the skin and cape size, the skin url, cape url and name and the offset of the pixel data"""
+    try:
+        magic, version, flags, skin_w, skin_h, cape_w, cape_h = _BINARY_HEADER.unpack_from(view)
+        if version != _BINARY_VERSION:
+            raise ValueError(f"Unsupported skin format version {version}")
+
+        offset = _BINARY_HEADER.size
+        strings = []
+        for _ in range(3):
+            length, = struct.unpack_from("<H", view, offset)
+            offset += 2
+            if offset + length > len(view):
+                raise ValueError("Truncated skin data")
+            strings.append(str(view[offset:offset + length], "utf-8") or None)
+            offset += length
+    except struct.error as exc:
+        raise ValueError("Truncated skin data") from exc
+
+    return flags, ((skin_w, skin_h), (cape_w, cape_h)), strings, offset
+
+
+def _read_binary_planes(view: memoryview, flags: int, sizes, offset: int):
+    """Reads the skin and (if present) cape image following the header of the binary skin format"""
+    images = []
+    for size in sizes[:2 if flags & _BINARY_FLAG_CAPE else 1]:
+        try:
+            if flags & _BINARY_FLAG_ZLIB:
+                length, = struct.unpack_from("<I", view, offset)
+                offset += 4
+                plane = zlib.decompress(view[offset:offset + length])
+            else:
+                length = size[0] * size[1] * 4
+                plane = view[offset:offset + length]
+        except (struct.error, zlib.error) as exc:
+            raise ValueError("Corrupt skin data") from exc
+        if len(plane) != size[0] * size[1] * 4:
+            raise ValueError("Corrupt skin data")
+        offset += length
+        images.append(Image.frombuffer("RGBA", size, plane, "raw", "RGBA", 0, 1))
+    return images
+
+
+def _open_image(data: bytes) -> Image.Image:
+    """Opens and loads an encoded image, raising a ValueError for anything that isn't a readable image"""
+    try:
+        image = Image.open(BytesIO(data))
+        image.load()
+    except OSError as exc:  # includes PIL.UnidentifiedImageError and truncated files
+        raise ValueError("Corrupt image data") from exc
+    return image
+
+
 class Skin:
     """
     Tip
@@ -32,13 +151,8 @@ class Skin:
             name=None,
     ):
         self._raw_skin: Image.Image = raw_skin
-        self._raw_skin_url: Optional[str] = raw_skin_url
         self._raw_cape: Optional[Image.Image] = None
-        self._raw_cape_url: Optional[str] = raw_cape_url
-        self._name: Optional[str] = name
-
-        self._skin: Optional[Image.Image] = None
-        self._head: Optional[Image.Image] = None
+        self._init_state(raw_skin_url, raw_cape_url, name)
 
         if raw_cape is not None:
             self.set_cape(raw_cape)
@@ -63,6 +177,19 @@ class Skin:
 
             self._raw_skin = new_skin_im
 
+    def _init_state(self, raw_skin_url: Optional[str], raw_cape_url: Optional[str], name: Optional[str]):
+        """Sets up the metadata and render caches shared by all kinds of skins"""
+        self._raw_skin_url: Optional[str] = raw_skin_url
+        self._raw_cape_url: Optional[str] = raw_cape_url
+        self._name: Optional[str] = name
+
+        self._skin: Optional[Image.Image] = None
+        self._head: Optional[Image.Image] = None
+        self._opacity_index: dict = {}
+        self._fingerprint: Optional[str] = None
+        self._cape_fingerprint: Optional[str] = None
+        self._normalized_cape: Optional[NormalizedCape] = None
+
     def __repr__(self):
         return f"<Skin (slim={self.is_slim}) (has_cape={self.has_cape})>"
 
@@ -96,11 +223,46 @@ class Skin:
         """The players capes url. Returns None if the player doesn't have a cape or the cape has been manually passed"""
         return self._raw_cape_url
 
+    @property
+    def opacity_index(self):
+        """Opaque texels per (body part, face), filled by the renderer on first use
+
+        Kept on the skin so repeated renders skip transparent texels without sampling them again"""
+        return self._opacity_index
+
     @property
     def has_cape(self):
         """Whether the player has a cape"""
         return bool(self._raw_cape)
 
+    @property
+    def normalized_cape(self):
+        """The players cape converted to the canonical mojang layout and split into frames
+
+        Computed only once per cape. Returns None if the player doesn't have a cape"""
+        if self._normalized_cape is None and self.has_cape:
+            self._normalized_cape = normalize_cape(self.raw_cape)
+        return self._normalized_cape
+
+    @property
+    def fingerprint(self):
+        """Stable content hash of the skin, e.g. for cache keys or change detection
+
+        This is the mojang texture hash if the skin url is known,
+        otherwise a SHA-256 of the normalized skin pixels. Computed only once."""
+        if self._fingerprint is None:
+            self._fingerprint = texture_hash(self._raw_skin_url) or _pixel_hash(self.raw_skin)
+        return self._fingerprint
+
+    @property
+    def cape_fingerprint(self):
+        """Stable content hash of the cape. Returns None if the player doesn't have a cape
+
+        Same rules as :py:attr:`fingerprint` apply"""
+        if self._cape_fingerprint is None and self.has_cape:
+            self._cape_fingerprint = texture_hash(self._raw_cape_url) or _pixel_hash(self.raw_cape)
+        return self._cape_fingerprint
+
     @property
     def is_slim(self):
         """Whether the skin is slim (Alex type) or classic (Steve type)
@@ -115,21 +277,16 @@ class Skin:
         ----------
         cape: PIL.Image.Image
             The new cape image (64x32px)
+            Other provider formats are converted on first use, see :py:attr:`normalized_cape`
         """
-        # attempt to detect wrongly scaled mojang capes
-        if cape.width / cape.height == 2 and (cape.width != 64 or cape.height != 32):
-            cape.resize((64, 32), resample=Image.LANCZOS)
-
-        if cape.width == 22 and cape.height == 17:  # Labymod
-            pass
-
-        if cape.width == 64 and cape.height > 32:  # MinecraftCapes animated
-            pass
-
         if cape.mode != "RGBA":  # Converting capes to RGBA
             cape = cape.convert(mode="RGBA")
 
         self._raw_cape = cape
+        self._cape_fingerprint = None
+        self._normalized_cape = None
+        for key in [key for key in self._opacity_index if key[0] == "cape"]:
+            del self._opacity_index[key]
 
     def show(self):
         """Shows the last rendered skin
@@ -185,24 +342,97 @@ class Skin:
         -------
         :class:`Skin`
         """
-        skin, cape = b64.split(";")
-        skin.encode()
-        if cape:
-            cape.encode()
-
-        im_str = base64.b64decode(skin)
-        buffered = BytesIO(im_str)
-        im_skin = Image.open(buffered)
-
-        if cape:
-            im_str = base64.b64decode(cape)
-            buffered = BytesIO(im_str)
-            im_cape = Image.open(buffered)
-        else:
-            im_cape = None
+        skin, _, cape = b64.partition(";")
+
+        im_skin = _open_image(base64.b64decode(skin))
+        im_cape = _open_image(base64.b64decode(cape)) if cape else None
 
         return cls(raw_skin=im_skin, raw_cape=im_cape)
 
+    def encode(self, compress: bool = True) -> bytes:
+        """Serializes the skin, cape and metadata into a compact binary format
+
+        Faster and smaller than :py:func:`encodeb64` since no PNG or base64 encoding is involved.
+        A :class:`Skin` class can then be recreated using :py:func:`decode`
+
+        Parameters
+        ----------
+        compress: bool
+            Whether the pixel data is zlib compressed
+
+        Returns
+        -------
+        bytes
+            The serialized skin
+        """
+        flags = _BINARY_FLAG_ZLIB if compress else 0
+        if self.is_slim:
+            flags |= _BINARY_FLAG_SLIM
+        planes = [self._raw_skin.tobytes()]
+        cape_size = (0, 0)
+        if self._raw_cape:
+            flags |= _BINARY_FLAG_CAPE
+            planes.append(self._raw_cape.tobytes())
+            cape_size = self._raw_cape.size
+
+        parts = [_BINARY_HEADER.pack(_BINARY_MAGIC, _BINARY_VERSION, flags, *self._raw_skin.size, *cape_size)]
+        for string in (self._raw_skin_url, self._raw_cape_url, self._name):
+            encoded = (string or "").encode()
+            parts.append(struct.pack("<H", len(encoded)))
+            parts.append(encoded)
+
+        for plane in planes:
+            if compress:
+                plane = zlib.compress(plane, 6)
+                parts.append(struct.pack("<I", len(plane)))
+            parts.append(plane)
+
+        return b"".join(parts)
+
+    @classmethod
+    def decode(cls, data: Union[bytes, bytearray, memoryview, str], lazy: bool = False):
+        """Create an instance of this class from data saved with :py:func:`encode`
+
+        Strings are treated as the legacy format of :py:func:`encodeb64` and passed on to :py:func:`decodeb64`.
+        Uncompressed pixel data is used directly without copying it.
+
+        Parameters
+        ----------
+        data: Union[bytes, bytearray, memoryview, str]
+            The serialized skin
+        lazy: bool
+            Return a :class:`LazySkin` which only decodes the images once they are needed
+
+        Returns
+        -------
+        :class:`Skin`
+
+        Raises
+        ------
+        ValueError
+            The data is not in a supported format
+        """
+        if lazy:
+            return LazySkin(data)
+
+        if isinstance(data, str):
+            return cls.decodeb64(data)
+
+        view = memoryview(data).cast("B")
+        if len(view) < _BINARY_HEADER.size or bytes(view[:4]) != _BINARY_MAGIC:
+            return cls.decodeb64(bytes(view).decode())
+
+        flags, sizes, strings, offset = _read_binary_header(view)
+        images = _read_binary_planes(view, flags, sizes, offset)
+
+        return cls(
+            raw_skin=images[0],
+            raw_cape=images[1] if len(images) > 1 else None,
+            raw_skin_url=strings[0],
+            raw_cape_url=strings[1],
+            name=strings[2],
+        )
+
     async def render_skin(
             self,
             vr: int = 25,
@@ -285,6 +515,120 @@ class Skin:
         self._skin = im
         return im
 
+    async def render_cape_animation(
+            self,
+            vr: int = 25,
+            hr: int = 35,
+            hrh: int = 0,
+            vrll: int = 0,
+            vrrl: int = 0,
+            vrla: int = 0,
+            hrla: int = 0,
+            vrra: int = 0,
+            hrra: int = 0,
+            vrc: int = 30,
+            ratio: int = 12,
+            display_hair: bool = True,
+            display_second_layer: bool = True,
+            aa: bool = False,
+            duration: int = 100,
+            fp=None,
+            format: Optional[str] = None,
+    ) -> List[Image.Image]:
+        """Render a full body skin once per frame of the players (animated) cape
+
+        The body is only rendered once, just the cape is redrawn for every frame.
+        Static capes result in a single frame.
+
+        Parameters
+        ----------
+        vr: int
+            Vertical rotation of the output image
+        hr: int
+            Horizontal rotation of the output image
+        hrh: int
+            Horizontal head rotation
+        vrll: int
+            Vertical rotation of the left leg
+        vrrl: int
+            Vertical rotation of the right leg
+        vrla: int
+            Vertical rotation of the left arm
+        hrla: int
+            Horizontal rotation of the left arm
+        vrra: int
+            Vertical rotation of the right arm
+        hrra: int
+            Horizontal rotation of the right arm
+        vrc: int
+            Vertical rotation of the cape
+        ratio: int
+            Resolution of the returned images
+        display_hair: bool
+            Whether the second head layer is displayed
+        display_second_layer: bool
+            Whether the second skin layer is displayed
+        aa: bool
+            Antialiasing: smoothens the corners a bit
+        duration: int
+            Display time of each frame in ms. Only used when saving to ``fp``
+        fp
+            Filename or file object to save the animation to (e.g. GIF, WebP or APNG)
+        format: Optional[str]
+            Format of the saved animation. Determined from the filename if omitted
+
+        Returns
+        -------
+        List[PIL.Image.Image]
+            The rendered frames
+
+        Raises
+        ------
+        ValueError
+            The player doesn't have a cape
+        """
+        if not self.has_cape:
+            raise ValueError("The player doesn't have a cape")
+
+        render = Render(
+            player=self,
+            vr=vr,
+            hr=hr,
+            hrh=hrh,
+            vrll=vrll,
+            vrrl=vrrl,
+            vrla=vrla,
+            hrla=hrla,
+            vrra=vrra,
+            hrra=hrra,
+            vrc=vrc,
+            ratio=ratio,
+            head_only=False,
+            display_hair=display_hair,
+            display_layers=display_second_layer,
+            display_cape=True,
+            aa=aa,
+        )
+        frames = await render.get_cape_animation()
+        self._skin = frames[0]
+
+        if fp is not None:
+            def save():
+                options = {"disposal": 2} if (format or str(fp)).upper().endswith("GIF") else {}
+                frames[0].save(
+                    fp,
+                    format=format,
+                    save_all=True,
+                    append_images=frames[1:],
+                    duration=duration,
+                    loop=0,
+                    **options
+                )
+
+            await asyncio.get_event_loop().run_in_executor(None, save)
+
+        return frames
+
     async def render_head(
             self,
             vr: int = 25,
@@ -325,3 +669,135 @@ class Skin:
         im = await render.get_render()
         self._head = im
         return im
+
+    async def render_head_sizes(
+            self,
+            sizes: Iterable[int] = (256, 128, 64, 32),
+            vr: int = 25,
+            hr: int = 35,
+            display_hair: bool = True,
+            aa: bool = False,
+    ) -> Dict[int, Image.Image]:
+        """Render the players head in multiple sizes at once
+
+        The head is only rendered once at the largest size. All smaller sizes are
+        derived from it using an alpha-correct downsample chain.
+
+        Parameters
+        ----------
+        sizes: Iterable[int]
+            Length of the longest edge of each returned image in px
+        vr: int
+            Vertical rotation of the output image
+        hr: int
+            Horizontal rotation of the output image
+        display_hair: bool
+            Whether or not the second head layer should be displayed
+        aa: bool
+            Antialiasing: smoothens the corners a bit
+
+        Returns
+        -------
+        Dict[int, PIL.Image.Image]
+            The rendered heads by size, largest first
+        """
+        sizes = list(sizes)
+        if not sizes:
+            raise ValueError("At least one size must be passed")
+
+        render = Render(
+            player=self,
+            vr=vr,
+            hr=hr,
+            head_only=True,
+            display_hair=display_hair,
+            aa=aa,
+            size=max(sizes),
+        )
+        im = await render.get_render()
+        heads = await asyncio.get_event_loop().run_in_executor(None, lambda: dict(mip_chain(im, sizes)))
+        self._head = heads[max(sizes)]
+        return heads
+
+
+class LazySkin(Skin):
+    """A :class:`Skin` which keeps the serialized data and decodes the images on first use
+
+    Metadata like :py:attr:`raw_skin_url`, :py:attr:`has_cape` and :py:attr:`is_slim` is read from the
+    header of the binary format without touching the pixel data. Accessing :py:attr:`raw_skin`,
+    :py:attr:`raw_cape` or rendering decodes the images once.
+
+    Tip
+    ----
+    Use this when rehydrating many cached players of which only a few will actually be rendered.
+
+    Parameters
+    ----------
+    data: Union[bytes, bytearray, memoryview, str]
+        Data obtained from :py:func:`Skin.encode` or :py:func:`Skin.encodeb64`
+    """
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview, str]):
+        self._data = data
+        self._flags: Optional[int] = None
+        self._init_state(None, None, None)
+
+        if not isinstance(data, str):
+            view = memoryview(data).cast("B")
+            if len(view) >= _BINARY_HEADER.size and bytes(view[:4]) == _BINARY_MAGIC:
+                self._flags, _, strings, _ = _read_binary_header(view)
+                self._raw_skin_url, self._raw_cape_url, self._name = strings
+
+    def __getattr__(self, item):
+        # only called for missing attributes, which the images are until they have been decoded
+        if item in ("_raw_skin", "_raw_cape"):
+            self._load()
+            return self.__dict__[item]
+        raise AttributeError(item)
+
+    def __repr__(self):
+        # legacy b64 data has no header, so the model is only known once decoded
+        slim = "unknown" if self._flags is None and not self.is_decoded else self.is_slim
+        return f"<LazySkin (slim={slim}) (has_cape={self.has_cape}) (decoded={self.is_decoded})>"
+
+    @property
+    def is_decoded(self):
+        """Whether the images have been decoded yet"""
+        return self._data is None
+
+    @property
+    def has_cape(self):
+        """Whether the player has a cape"""
+        if self._flags is not None and not self.is_decoded:
+            return bool(self._flags & _BINARY_FLAG_CAPE)
+        if isinstance(self._data, str):
+            return bool(self._data.partition(";")[2])
+        return super().has_cape
+
+    @property
+    def is_slim(self):
+        """Whether the skin is slim (Alex type) or classic (Steve type)
+
+        Only difference being the width of the arms (3px - 4px)"""
+        if self._flags is not None and not self.is_decoded:
+            return bool(self._flags & _BINARY_FLAG_SLIM)
+        return super().is_slim
+
+    def _load(self):
+        """Decodes the stored data into images"""
+        if self._data is None:
+            return
+
+        skin = Skin.decode(self._data)
+        self._raw_skin = skin.raw_skin
+        self._raw_cape = skin.raw_cape
+        self._data = None
+
+    def encode(self, compress: bool = True) -> bytes:
+        if not self.is_decoded and self._flags is not None and compress == bool(self._flags & _BINARY_FLAG_ZLIB):
+            return bytes(self._data)  # still in the requested format, no need to decode
+        return super().encode(compress=compress)
+
+    def set_cape(self, cape: Image.Image):
+        self._load()
+        super().set_cape(cape)
@@ -1,9 +1,9 @@
 import asyncio
 import numpy as np
 
-from math import radians, sin, cos
+from math import radians, sin, cos, ceil
 from PIL import Image, ImageDraw
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, List, Iterable, Iterator, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from . import Skin
@@ -39,6 +39,55 @@ def append_dict(dic, key1, key2, key3, value):
     return dic
 
 
+class LazyVolumePoints:
+    """The points of a part, built on first access
+
+    Faces only access points for their opaque texels, so parts without any
+    (like an empty 2nd layer) never build their points at all."""
+
+    def __init__(self, build):
+        self._build = build
+        self._points = None
+
+    def __getitem__(self, key):
+        if self._points is None:
+            self._points = self._build()
+        return self._points[key]
+
+
+def mip_chain(image: Image.Image, sizes: Iterable[int]) -> Iterator[Tuple[int, Image.Image]]:
+    """Downsamples a render to several sizes, largest first
+
+    Every level is derived from the previous one instead of the full render. The chain runs on
+    premultiplied alpha, so transparent pixels don't bleed dark fringes into the edges.
+
+    Parameters
+    ----------
+    image: PIL.Image.Image
+        The rendered image, at least as large as the biggest requested size
+    sizes: Iterable[int]
+        Length of the longest edge of each output image
+
+    Yields
+    ------
+    Tuple[int, PIL.Image.Image]
+        The requested size and the matching image
+    """
+    im = image.convert("RGBa")
+    for size in sorted(set(sizes), reverse=True):
+        scale = size / max(im.size)
+        new_size = (max(1, round(im.width * scale)), max(1, round(im.height * scale)))
+
+        if new_size != im.size:
+            factor = im.width // new_size[0]
+            if factor > 1 and im.size == (new_size[0] * factor, new_size[1] * factor):
+                im = im.reduce(factor)  # exact box filter, much cheaper than a resize
+            else:
+                im = im.resize(new_size, resample=Image.BOX if scale >= 0.5 else Image.LANCZOS)
+
+        yield size, im.convert("RGBA")
+
+
 class Render:
     def __init__(
             self,
@@ -59,6 +108,7 @@ class Render:
             display_layers: bool = False,
             display_cape: bool = False,
             aa: bool = False,
+            size: Optional[int] = None,
     ):
         self.vr = vr
         self.hr = hr
@@ -77,6 +127,7 @@ class Render:
         self.layers = display_layers
         self.player = player
         self.aa = aa
+        self.size = size
         self.rendered_image = None
 
         self.loop = asyncio.get_event_loop()
@@ -127,7 +178,7 @@ class Render:
         def render_skin(skin):
             self.calculate_angles()
             self.determine_faces()
-            self.generate_polygons(hd_ratio, skin, self.player.raw_cape)
+            self.generate_polygons(hd_ratio, skin, self.player.normalized_cape)
             self.member_rotation(hd_ratio)
 
             im = self.display_image()
@@ -141,6 +192,69 @@ class Render:
 
         return im
 
+    async def get_cape_animation(self):
+        skin = self.player.raw_skin
+        hd_ratio = int(skin.size[0] / 64)
+
+        return await self.loop.run_in_executor(
+            None,
+            self.render_cape_frames,
+            hd_ratio,
+            skin
+        )
+
+    def render_cape_frames(self, hd_ratio, skin):
+        """Renders one image per frame of an animated cape
+
+        The body is generated, projected and drawn only once. For every frame
+        just the cape is generated and drawn on top of or behind it."""
+        cape = self.player.normalized_cape
+        self.calculate_angles()
+        self.determine_faces()
+        self.generate_polygons(hd_ratio, skin, cape)
+        self.member_rotation(hd_ratio)
+
+        # all frames have to be projected before drawing so every layer has the same size
+        cape_polygons = [self.polygons["cape"]]
+        for frame in range(1, len(cape.frames)):
+            self.generate_cape_polygons(hd_ratio, cape, frame)
+            self.cape_rotation(hd_ratio)
+            cape_polygons.append(self.polygons["cape"])
+
+        display_order = self.get_display_order()
+        cape_order = [pieces for pieces in display_order if "cape" in pieces]
+        cape_behind = "cape" in display_order[0]
+        body = self.display_image([pieces for pieces in display_order if "cape" not in pieces])
+
+        frames = []
+        for polygons in cape_polygons:
+            self.polygons["cape"] = polygons
+            layer = self.display_image(cape_order)
+            frames.append(Image.alpha_composite(layer, body) if cape_behind else Image.alpha_composite(body, layer))
+        return frames
+
+    def opaque_texels(self, part, face, texture, texel, *ranges, frame=0):
+        """Returns the opaque texels of a single face as ``(*indices, color)`` tuples
+
+        ``texel`` maps the loop indices (one per range) to the texture coordinates.
+        The result only depends on the texture, so it is computed once and stored in
+        :py:attr:`Skin.opacity_index`. Fully transparent faces yield nothing.
+        ``frame`` distinguishes the frames of animated capes."""
+        index = self.player.opacity_index
+        key = (part, face, frame) if frame else (part, face)
+        if key not in index:
+            pixels = np.asarray(texture)
+            grid = np.meshgrid(*[np.asarray(r) for r in ranges], indexing="ij")
+            x, y = (np.broadcast_to(c, grid[0].shape) for c in texel(*grid))
+            colors = pixels[y, x]
+            mask = colors[..., 3] != 0
+
+            index[key] = list(zip(
+                *[g[mask].tolist() for g in grid],
+                map(tuple, colors[mask].tolist())
+            ))
+        return index[key]
+
     def calculate_angles(self):
         alpha = radians(self.vr)
         beta = -radians(self.hr)
@@ -298,7 +412,7 @@ class Render:
         )
         return cube_points
 
-    def generate_polygons(self, hd_ratio, skin, im_cape):
+    def generate_polygons(self, hd_ratio, skin, cape):
         self.polygons = {
             "helmet": {"front": [], "back": [], "top": [], "bottom": [], "right": [], "left": []},
             "head": {"front": [], "back": [], "top": [], "bottom": [], "right": [], "left": []},
@@ -316,1309 +430,1377 @@ class Render:
         }
 
         """Head"""
-        volume_points = {}
-        for i in range(0, 9 * hd_ratio):
-            for j in range(0, 9 * hd_ratio):
-                volume_points = append_dict(volume_points, i, j, -2 * hd_ratio,
-                                            Point(self, np.array([i, j, -2 * hd_ratio])))
-                volume_points = append_dict(volume_points, i, j, 6 * hd_ratio,
-                                            Point(self, np.array([i, j, 6 * hd_ratio])))
-
-        for j in range(0, 9 * hd_ratio):
-            for k in range(-2 * hd_ratio, 7 * hd_ratio):
-                volume_points = append_dict(volume_points, 0, j, k, Point(self, np.array([0, j, k])))
-                volume_points = append_dict(volume_points, 8 * hd_ratio, j, k,
-                                            Point(self, np.array([8 * hd_ratio, j, k])))
-
-        for i in range(0, 9 * hd_ratio):
-            for k in range(-2 * hd_ratio, 7 * hd_ratio):
-                volume_points = append_dict(volume_points, i, 0, k, Point(self, np.array([i, 0, k])))
-                volume_points = append_dict(volume_points, i, 8 * hd_ratio, k,
-                                            Point(self, np.array([i, 8 * hd_ratio, k])))
-
-        if "back" in self.visible_faces["head"]["front"]:
-            for i in range(0, 8 * hd_ratio):
-                for j in range(0, 8 * hd_ratio):
-                    color = skin.getpixel((32 * hd_ratio - 1 - i, 8 * hd_ratio + j))
-                    if color[3] != 0:
-                        self.polygons["head"]["back"].append(Polygon([
-                            volume_points[i][j][-2 * hd_ratio],
-                            volume_points[i + 1][j][-2 * hd_ratio],
-                            volume_points[i + 1][j + 1][-2 * hd_ratio],
-                            volume_points[i][j + 1][-2 * hd_ratio]],
-                            color))
-
-        if "front" in self.visible_faces["head"]["front"]:
-            for i in range(0, 8 * hd_ratio):
-                for j in range(0, 8 * hd_ratio):
-                    color = skin.getpixel((8 * hd_ratio + i, 8 * hd_ratio + j))
-                    if color[3] != 0:
-                        self.polygons["head"]["front"].append(Polygon([
-                            volume_points[i][j][6 * hd_ratio],
-                            volume_points[i + 1][j][6 * hd_ratio],
-                            volume_points[i + 1][j + 1][6 * hd_ratio],
-                            volume_points[i][j + 1][6 * hd_ratio]],
-                            color))
-
-        if "right" in self.visible_faces["head"]["front"]:
-            for j in range(0, 8 * hd_ratio):
-                for k in range(-2 * hd_ratio, 6 * hd_ratio):
-                    color = skin.getpixel((k + 2 * hd_ratio, 8 * hd_ratio + j))
-                    if color[3] != 0:
-                        self.polygons["head"]["right"].append(Polygon([
-                            volume_points[0][j][k],
-                            volume_points[0][j][k + 1],
-                            volume_points[0][j + 1][k + 1],
-                            volume_points[0][j + 1][k]],
-                            color))
-
-        if "left" in self.visible_faces["head"]["front"]:
-            for j in range(0, 8 * hd_ratio):
-                for k in range(-2 * hd_ratio, 6 * hd_ratio):
-                    color = skin.getpixel(((24 * hd_ratio - 1) - k - 2 * hd_ratio, 8 * hd_ratio + j))
-                    if color[3] != 0:
-                        self.polygons["head"]["left"].append(Polygon([
-                            volume_points[8 * hd_ratio][j][k],
-                            volume_points[8 * hd_ratio][j][k + 1],
-                            volume_points[8 * hd_ratio][j + 1][k + 1],
-                            volume_points[8 * hd_ratio][j + 1][k]],
-                            color))
-
-        if "top" in self.visible_faces["head"]["front"]:
-            for i in range(0, 8 * hd_ratio):
-                for k in range(-2 * hd_ratio, 6 * hd_ratio):
-                    color = skin.getpixel((8 * hd_ratio + i, 2 * hd_ratio + k))
-                    if color[3] != 0:
-                        self.polygons["head"]["top"].append(Polygon([
-                            volume_points[i][0][k],
-                            volume_points[i + 1][0][k],
-                            volume_points[i + 1][0][k + 1],
-                            volume_points[i][0][k + 1]],
-                            color))
-
-        if "bottom" in self.visible_faces["head"]["front"]:
-            for i in range(0, 8 * hd_ratio):
-                for k in range(-2 * hd_ratio, 6 * hd_ratio):
-                    color = skin.getpixel((16 * hd_ratio + i, 2 * hd_ratio + k))
-                    if color[3] != 0:
-                        self.polygons["head"]["bottom"].append(Polygon([
-                            volume_points[i][8 * hd_ratio][k],
-                            volume_points[i + 1][8 * hd_ratio][k],
-                            volume_points[i + 1][8 * hd_ratio][k + 1],
-                            volume_points[i][8 * hd_ratio][k + 1]],
-                            color))
-
-        """Helmet / Hair"""
-        if self.display_hair:
+        def build_points():
             volume_points = {}
             for i in range(0, 9 * hd_ratio):
                 for j in range(0, 9 * hd_ratio):
                     volume_points = append_dict(volume_points, i, j, -2 * hd_ratio,
-                                                Point(self, np.array([i * 8.5 / 8 - 0.25 * hd_ratio,
-                                                                      j * 8.5 / 8 - 0.25 * hd_ratio,
-                                                                      -2.25 * hd_ratio])))
+                                                Point(self, np.array([i, j, -2 * hd_ratio])))
                     volume_points = append_dict(volume_points, i, j, 6 * hd_ratio,
-                                                Point(self, np.array([i * 8.5 / 8 - 0.25 * hd_ratio,
-                                                                      j * 8.5 / 8 - 0.25 * hd_ratio,
-                                                                      6.25 * hd_ratio])))
+                                                Point(self, np.array([i, j, 6 * hd_ratio])))
 
             for j in range(0, 9 * hd_ratio):
                 for k in range(-2 * hd_ratio, 7 * hd_ratio):
-                    volume_points = append_dict(volume_points, 0, j, k,
-                                                Point(self, np.array([-0.25 * hd_ratio,
-                                                                        j * 8.5 / 8 - 0.25 * hd_ratio,
-                                                                        k * 8.5 / 8 - 0.25 * hd_ratio])))
+                    volume_points = append_dict(volume_points, 0, j, k, Point(self, np.array([0, j, k])))
                     volume_points = append_dict(volume_points, 8 * hd_ratio, j, k,
-                                                Point(self, np.array([8.25 * hd_ratio,
-                                                                        j * 8.5 / 8 - 0.25 * hd_ratio,
-                                                                        k * 8.5 / 8 - 0.25 * hd_ratio])))
+                                                Point(self, np.array([8 * hd_ratio, j, k])))
 
             for i in range(0, 9 * hd_ratio):
                 for k in range(-2 * hd_ratio, 7 * hd_ratio):
-                    volume_points = append_dict(volume_points, i, 0, k,
-                                                Point(self, np.array([i * 8.5 / 8 - 0.25 * hd_ratio,
-                                                                        -0.25 * hd_ratio,
-                                                                        k * 8.5 / 8 - 0.25 * hd_ratio])))
+                    volume_points = append_dict(volume_points, i, 0, k, Point(self, np.array([i, 0, k])))
                     volume_points = append_dict(volume_points, i, 8 * hd_ratio, k,
-                                                Point(self, np.array([i * 8.5 / 8 - 0.25 * hd_ratio,
-                                                                        8.25 * hd_ratio,
-                                                                        k * 8.5 / 8 - 0.25 * hd_ratio])))
-
-            for i in range(0, 8 * hd_ratio):
-                for j in range(0, 8 * hd_ratio):
-                    color = skin.getpixel((64 * hd_ratio - 1 - i, 8 * hd_ratio + j))
-                    if color[3] != 0:
-                        self.polygons["helmet"]["back"].append(Polygon([
-                            volume_points[i][j][-2 * hd_ratio],
-                            volume_points[i + 1][j][-2 * hd_ratio],
-                            volume_points[i + 1][j + 1][-2 * hd_ratio],
-                            volume_points[i][j + 1][-2 * hd_ratio]],
-                            color))
+                                                Point(self, np.array([i, 8 * hd_ratio, k])))
+            return volume_points
 
-            for i in range(0, 8 * hd_ratio):
-                for j in range(0, 8 * hd_ratio):
-                    color = skin.getpixel((40 * hd_ratio + i, 8 * hd_ratio + j))
-                    if color[3] != 0:
-                        self.polygons["helmet"]["front"].append(Polygon([
-                            volume_points[i][j][6 * hd_ratio],
-                            volume_points[i + 1][j][6 * hd_ratio],
-                            volume_points[i + 1][j + 1][6 * hd_ratio],
-                            volume_points[i][j + 1][6 * hd_ratio]],
-                            color))
+        volume_points = LazyVolumePoints(build_points)
 
-            for j in range(0, 8 * hd_ratio):
-                for k in range(-2 * hd_ratio, 6 * hd_ratio):
-                    color = skin.getpixel((34 * hd_ratio + k, 8 * hd_ratio + j))
-                    if color[3] != 0:
-                        self.polygons["helmet"]["right"].append(Polygon([
-                            volume_points[0][j][k],
-                            volume_points[0][j][k + 1],
-                            volume_points[0][j + 1][k + 1],
-                            volume_points[0][j + 1][k]],
-                            color))
+        if "back" in self.visible_faces["head"]["front"]:
+            for i, j, color in self.opaque_texels(
+                    "head", "back", skin,
+                    lambda i, j: (32 * hd_ratio - 1 - i, 8 * hd_ratio + j),
+                    range(0, 8 * hd_ratio), range(0, 8 * hd_ratio)):
+                self.polygons["head"]["back"].append(Polygon([
+                    volume_points[i][j][-2 * hd_ratio],
+                    volume_points[i + 1][j][-2 * hd_ratio],
+                    volume_points[i + 1][j + 1][-2 * hd_ratio],
+                    volume_points[i][j + 1][-2 * hd_ratio]],
+                    color))
 
-            for j in range(0, 8 * hd_ratio):
-                for k in range(-2 * hd_ratio, 6 * hd_ratio):
-                    color = skin.getpixel((54 * hd_ratio - k - 1, 8 * hd_ratio + j))
-                    if color[3] != 0:
-                        self.polygons["helmet"]["left"].append(Polygon([
-                            volume_points[8 * hd_ratio][j][k],
-                            volume_points[8 * hd_ratio][j][k + 1],
-                            volume_points[8 * hd_ratio][j + 1][k + 1],
-                            volume_points[8 * hd_ratio][j + 1][k]],
-                            color))
+        if "front" in self.visible_faces["head"]["front"]:
+            for i, j, color in self.opaque_texels(
+                    "head", "front", skin,
+                    lambda i, j: (8 * hd_ratio + i, 8 * hd_ratio + j),
+                    range(0, 8 * hd_ratio), range(0, 8 * hd_ratio)):
+                self.polygons["head"]["front"].append(Polygon([
+                    volume_points[i][j][6 * hd_ratio],
+                    volume_points[i + 1][j][6 * hd_ratio],
+                    volume_points[i + 1][j + 1][6 * hd_ratio],
+                    volume_points[i][j + 1][6 * hd_ratio]],
+                    color))
 
-            for i in range(0, 8 * hd_ratio):
-                for k in range(-2 * hd_ratio, 6 * hd_ratio):
-                    color = skin.getpixel((40 * hd_ratio + i, 2 * hd_ratio + k))
-                    if color[3] != 0:
-                        self.polygons["helmet"]["top"].append(Polygon([
-                            volume_points[i][0][k],
-                            volume_points[i + 1][0][k],
-                            volume_points[i + 1][0][k + 1],
-                            volume_points[i][0][k + 1]],
-                            color))
+        if "right" in self.visible_faces["head"]["front"]:
+            for j, k, color in self.opaque_texels(
+                    "head", "right", skin,
+                    lambda j, k: (k + 2 * hd_ratio, 8 * hd_ratio + j),
+                    range(0, 8 * hd_ratio), range(-2 * hd_ratio, 6 * hd_ratio)):
+                self.polygons["head"]["right"].append(Polygon([
+                    volume_points[0][j][k],
+                    volume_points[0][j][k + 1],
+                    volume_points[0][j + 1][k + 1],
+                    volume_points[0][j + 1][k]],
+                    color))
 
-            for i in range(0, 8 * hd_ratio):
-                for k in range(-2 * hd_ratio, 6 * hd_ratio):
-                    color = skin.getpixel((48 * hd_ratio + 1, 2 * hd_ratio + k))
-                    if color[3] != 0:
-                        self.polygons["helmet"]["bottom"].append(Polygon([
-                            volume_points[i][8 * hd_ratio][k],
-                            volume_points[i + 1][8 * hd_ratio][k],
-                            volume_points[i + 1][8 * hd_ratio][k + 1],
-                            volume_points[i][8 * hd_ratio][k + 1]],
-                            color))
+        if "left" in self.visible_faces["head"]["front"]:
+            for j, k, color in self.opaque_texels(
+                    "head", "left", skin,
+                    lambda j, k: ((24 * hd_ratio - 1) - k - 2 * hd_ratio, 8 * hd_ratio + j),
+                    range(0, 8 * hd_ratio), range(-2 * hd_ratio, 6 * hd_ratio)):
+                self.polygons["head"]["left"].append(Polygon([
+                    volume_points[8 * hd_ratio][j][k],
+                    volume_points[8 * hd_ratio][j][k + 1],
+                    volume_points[8 * hd_ratio][j + 1][k + 1],
+                    volume_points[8 * hd_ratio][j + 1][k]],
+                    color))
+
+        if "top" in self.visible_faces["head"]["front"]:
+            for i, k, color in self.opaque_texels(
+                    "head", "top", skin,
+                    lambda i, k: (8 * hd_ratio + i, 2 * hd_ratio + k),
+                    range(0, 8 * hd_ratio), range(-2 * hd_ratio, 6 * hd_ratio)):
+                self.polygons["head"]["top"].append(Polygon([
+                    volume_points[i][0][k],
+                    volume_points[i + 1][0][k],
+                    volume_points[i + 1][0][k + 1],
+                    volume_points[i][0][k + 1]],
+                    color))
+
+        if "bottom" in self.visible_faces["head"]["front"]:
+            for i, k, color in self.opaque_texels(
+                    "head", "bottom", skin,
+                    lambda i, k: (16 * hd_ratio + i, 2 * hd_ratio + k),
+                    range(0, 8 * hd_ratio), range(-2 * hd_ratio, 6 * hd_ratio)):
+                self.polygons["head"]["bottom"].append(Polygon([
+                    volume_points[i][8 * hd_ratio][k],
+                    volume_points[i + 1][8 * hd_ratio][k],
+                    volume_points[i + 1][8 * hd_ratio][k + 1],
+                    volume_points[i][8 * hd_ratio][k + 1]],
+                    color))
+
+        """Helmet / Hair"""
+        if self.display_hair:
+            def build_points():
+                volume_points = {}
+                for i in range(0, 9 * hd_ratio):
+                    for j in range(0, 9 * hd_ratio):
+                        volume_points = append_dict(volume_points, i, j, -2 * hd_ratio,
+                                                    Point(self, np.array([i * 8.5 / 8 - 0.25 * hd_ratio,
+                                                                          j * 8.5 / 8 - 0.25 * hd_ratio,
+                                                                          -2.25 * hd_ratio])))
+                        volume_points = append_dict(volume_points, i, j, 6 * hd_ratio,
+                                                    Point(self, np.array([i * 8.5 / 8 - 0.25 * hd_ratio,
+                                                                          j * 8.5 / 8 - 0.25 * hd_ratio,
+                                                                          6.25 * hd_ratio])))
+
+                for j in range(0, 9 * hd_ratio):
+                    for k in range(-2 * hd_ratio, 7 * hd_ratio):
+                        volume_points = append_dict(volume_points, 0, j, k,
+                                                    Point(self, np.array([-0.25 * hd_ratio,
+                                                                            j * 8.5 / 8 - 0.25 * hd_ratio,
+                                                                            k * 8.5 / 8 - 0.25 * hd_ratio])))
+                        volume_points = append_dict(volume_points, 8 * hd_ratio, j, k,
+                                                    Point(self, np.array([8.25 * hd_ratio,
+                                                                            j * 8.5 / 8 - 0.25 * hd_ratio,
+                                                                            k * 8.5 / 8 - 0.25 * hd_ratio])))
+
+                for i in range(0, 9 * hd_ratio):
+                    for k in range(-2 * hd_ratio, 7 * hd_ratio):
+                        volume_points = append_dict(volume_points, i, 0, k,
+                                                    Point(self, np.array([i * 8.5 / 8 - 0.25 * hd_ratio,
+                                                                            -0.25 * hd_ratio,
+                                                                            k * 8.5 / 8 - 0.25 * hd_ratio])))
+                        volume_points = append_dict(volume_points, i, 8 * hd_ratio, k,
+                                                    Point(self, np.array([i * 8.5 / 8 - 0.25 * hd_ratio,
+                                                                            8.25 * hd_ratio,
+                                                                            k * 8.5 / 8 - 0.25 * hd_ratio])))
+                return volume_points
+
+            volume_points = LazyVolumePoints(build_points)
+
+            for i, j, color in self.opaque_texels(
+                    "helmet", "back", skin,
+                    lambda i, j: (64 * hd_ratio - 1 - i, 8 * hd_ratio + j),
+                    range(0, 8 * hd_ratio), range(0, 8 * hd_ratio)):
+                self.polygons["helmet"]["back"].append(Polygon([
+                    volume_points[i][j][-2 * hd_ratio],
+                    volume_points[i + 1][j][-2 * hd_ratio],
+                    volume_points[i + 1][j + 1][-2 * hd_ratio],
+                    volume_points[i][j + 1][-2 * hd_ratio]],
+                    color))
+
+            for i, j, color in self.opaque_texels(
+                    "helmet", "front", skin,
+                    lambda i, j: (40 * hd_ratio + i, 8 * hd_ratio + j),
+                    range(0, 8 * hd_ratio), range(0, 8 * hd_ratio)):
+                self.polygons["helmet"]["front"].append(Polygon([
+                    volume_points[i][j][6 * hd_ratio],
+                    volume_points[i + 1][j][6 * hd_ratio],
+                    volume_points[i + 1][j + 1][6 * hd_ratio],
+                    volume_points[i][j + 1][6 * hd_ratio]],
+                    color))
+
+            for j, k, color in self.opaque_texels(
+                    "helmet", "right", skin,
+                    lambda j, k: (34 * hd_ratio + k, 8 * hd_ratio + j),
+                    range(0, 8 * hd_ratio), range(-2 * hd_ratio, 6 * hd_ratio)):
+                self.polygons["helmet"]["right"].append(Polygon([
+                    volume_points[0][j][k],
+                    volume_points[0][j][k + 1],
+                    volume_points[0][j + 1][k + 1],
+                    volume_points[0][j + 1][k]],
+                    color))
+
+            for j, k, color in self.opaque_texels(
+                    "helmet", "left", skin,
+                    lambda j, k: (54 * hd_ratio - k - 1, 8 * hd_ratio + j),
+                    range(0, 8 * hd_ratio), range(-2 * hd_ratio, 6 * hd_ratio)):
+                self.polygons["helmet"]["left"].append(Polygon([
+                    volume_points[8 * hd_ratio][j][k],
+                    volume_points[8 * hd_ratio][j][k + 1],
+                    volume_points[8 * hd_ratio][j + 1][k + 1],
+                    volume_points[8 * hd_ratio][j + 1][k]],
+                    color))
+
+            for i, k, color in self.opaque_texels(
+                    "helmet", "top", skin,
+                    lambda i, k: (40 * hd_ratio + i, 2 * hd_ratio + k),
+                    range(0, 8 * hd_ratio), range(-2 * hd_ratio, 6 * hd_ratio)):
+                self.polygons["helmet"]["top"].append(Polygon([
+                    volume_points[i][0][k],
+                    volume_points[i + 1][0][k],
+                    volume_points[i + 1][0][k + 1],
+                    volume_points[i][0][k + 1]],
+                    color))
+
+            for i, k, color in self.opaque_texels(
+                    "helmet", "bottom", skin,
+                    lambda i, k: (48 * hd_ratio + 1, 2 * hd_ratio + k),
+                    range(0, 8 * hd_ratio), range(-2 * hd_ratio, 6 * hd_ratio)):
+                self.polygons["helmet"]["bottom"].append(Polygon([
+                    volume_points[i][8 * hd_ratio][k],
+                    volume_points[i + 1][8 * hd_ratio][k],
+                    volume_points[i + 1][8 * hd_ratio][k + 1],
+                    volume_points[i][8 * hd_ratio][k + 1]],
+                    color))
 
         if not self.head_only:
             """Torso"""
-            volume_points = {}
-            for i in range(0, 9 * hd_ratio):
+            def build_points():
+                volume_points = {}
+                for i in range(0, 9 * hd_ratio):
+                    for j in range(0, 13 * hd_ratio):
+                        volume_points = append_dict(volume_points, i, j, 0,
+                                                    Point(self, np.array([i, j + 8 * hd_ratio, 0])))
+                        volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
+                                                    Point(self, np.array([i, j + 8 * hd_ratio, 4 * hd_ratio])))
+
                 for j in range(0, 13 * hd_ratio):
-                    volume_points = append_dict(volume_points, i, j, 0,
-                                                Point(self, np.array([i, j + 8 * hd_ratio, 0])))
-                    volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
-                                                Point(self, np.array([i, j + 8 * hd_ratio, 4 * hd_ratio])))
+                    for k in range(0, 5 * hd_ratio):
+                        volume_points = append_dict(volume_points, 0, j, k,
+                                                    Point(self, np.array([0, j + 8 * hd_ratio, k])))
+                        volume_points = append_dict(volume_points, 8 * hd_ratio, j, k,
+                                                    Point(self, np.array([8 * hd_ratio, j + 8 * hd_ratio, k])))
 
-            for j in range(0, 13 * hd_ratio):
-                for k in range(0, 5 * hd_ratio):
-                    volume_points = append_dict(volume_points, 0, j, k,
-                                                Point(self, np.array([0, j + 8 * hd_ratio, k])))
-                    volume_points = append_dict(volume_points, 8 * hd_ratio, j, k,
-                                                Point(self, np.array([8 * hd_ratio, j + 8 * hd_ratio, k])))
+                for i in range(0, 9 * hd_ratio):
+                    for k in range(0, 5 * hd_ratio):
+                        volume_points = append_dict(volume_points, i, 0, k,
+                                                    Point(self, np.array([i, 8 * hd_ratio, k])))
+                        volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
+                                                    Point(self, np.array([i, 20 * hd_ratio, k])))
+                return volume_points
 
-            for i in range(0, 9 * hd_ratio):
-                for k in range(0, 5 * hd_ratio):
-                    volume_points = append_dict(volume_points, i, 0, k,
-                                                Point(self, np.array([i, 8 * hd_ratio, k])))
-                    volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
-                                                Point(self, np.array([i, 20 * hd_ratio, k])))
+            volume_points = LazyVolumePoints(build_points)
 
             if "back" in self.visible_faces["torso"]["front"]:
-                for i in range(0, 8 * hd_ratio):
-                    for j in range(0, 12 * hd_ratio):
-                        color = skin.getpixel(((40 * hd_ratio - 1) - i, 20 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["torso"]["back"].append(Polygon([
-                                volume_points[i][j][0],
-                                volume_points[i + 1][j][0],
-                                volume_points[i + 1][j + 1][0],
-                                volume_points[i][j + 1][0]],
-                                color))
+                for i, j, color in self.opaque_texels(
+                        "torso", "back", skin,
+                        lambda i, j: ((40 * hd_ratio - 1) - i, 20 * hd_ratio + j),
+                        range(0, 8 * hd_ratio), range(0, 12 * hd_ratio)):
+                    self.polygons["torso"]["back"].append(Polygon([
+                        volume_points[i][j][0],
+                        volume_points[i + 1][j][0],
+                        volume_points[i + 1][j + 1][0],
+                        volume_points[i][j + 1][0]],
+                        color))
 
             if "front" in self.visible_faces["torso"]["front"]:
-                for i in range(0, 8 * hd_ratio):
-                    for j in range(0, 12 * hd_ratio):
-                        color = skin.getpixel((20 * hd_ratio + i, 20 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["torso"]["front"].append(Polygon([
-                                volume_points[i][j][4 * hd_ratio],
-                                volume_points[i + 1][j][4 * hd_ratio],
-                                volume_points[i + 1][j + 1][4 * hd_ratio],
-                                volume_points[i][j + 1][4 * hd_ratio]],
-                                color))
+                for i, j, color in self.opaque_texels(
+                        "torso", "front", skin,
+                        lambda i, j: (20 * hd_ratio + i, 20 * hd_ratio + j),
+                        range(0, 8 * hd_ratio), range(0, 12 * hd_ratio)):
+                    self.polygons["torso"]["front"].append(Polygon([
+                        volume_points[i][j][4 * hd_ratio],
+                        volume_points[i + 1][j][4 * hd_ratio],
+                        volume_points[i + 1][j + 1][4 * hd_ratio],
+                        volume_points[i][j + 1][4 * hd_ratio]],
+                        color))
 
             if "right" in self.visible_faces["torso"]["front"]:
-                for j in range(0, 12 * hd_ratio):
-                    for k in range(0 * hd_ratio, 4 * hd_ratio):
-                        color = skin.getpixel((16 * hd_ratio + k, 20 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["torso"]["right"].append(Polygon([
-                                volume_points[0][j][k],
-                                volume_points[0][j][k + 1],
-                                volume_points[0][j + 1][k + 1],
-                                volume_points[0][j + 1][k]],
-                                color))
+                for j, k, color in self.opaque_texels(
+                        "torso", "right", skin,
+                        lambda j, k: (16 * hd_ratio + k, 20 * hd_ratio + j),
+                        range(0, 12 * hd_ratio), range(0 * hd_ratio, 4 * hd_ratio)):
+                    self.polygons["torso"]["right"].append(Polygon([
+                        volume_points[0][j][k],
+                        volume_points[0][j][k + 1],
+                        volume_points[0][j + 1][k + 1],
+                        volume_points[0][j + 1][k]],
+                        color))
 
             if "left" in self.visible_faces["torso"]["front"]:
-                for j in range(0, 12 * hd_ratio):
-                    for k in range(0 * hd_ratio, 4 * hd_ratio):
-                        color = skin.getpixel(((32 * hd_ratio - 1) - k, 20 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["torso"]["left"].append(Polygon([
-                                volume_points[8 * hd_ratio][j][k],
-                                volume_points[8 * hd_ratio][j][k + 1],
-                                volume_points[8 * hd_ratio][j + 1][k + 1],
-                                volume_points[8 * hd_ratio][j + 1][k]],
-                                color))
+                for j, k, color in self.opaque_texels(
+                        "torso", "left", skin,
+                        lambda j, k: ((32 * hd_ratio - 1) - k, 20 * hd_ratio + j),
+                        range(0, 12 * hd_ratio), range(0 * hd_ratio, 4 * hd_ratio)):
+                    self.polygons["torso"]["left"].append(Polygon([
+                        volume_points[8 * hd_ratio][j][k],
+                        volume_points[8 * hd_ratio][j][k + 1],
+                        volume_points[8 * hd_ratio][j + 1][k + 1],
+                        volume_points[8 * hd_ratio][j + 1][k]],
+                        color))
 
             if "top" in self.visible_faces["torso"]["front"]:
-                for i in range(0, 8 * hd_ratio):
-                    for k in range(0 * hd_ratio, 4 * hd_ratio):
-                        color = skin.getpixel((20 * hd_ratio + i, 16 * hd_ratio + k))
-                        if color[3] != 0:
-                            self.polygons["torso"]["top"].append(Polygon([
-                                volume_points[i][0][k],
-                                volume_points[i + 1][0][k],
-                                volume_points[i + 1][0][k + 1],
-                                volume_points[i][0][k + 1]],
-                                color))
+                for i, k, color in self.opaque_texels(
+                        "torso", "top", skin,
+                        lambda i, k: (20 * hd_ratio + i, 16 * hd_ratio + k),
+                        range(0, 8 * hd_ratio), range(0 * hd_ratio, 4 * hd_ratio)):
+                    self.polygons["torso"]["top"].append(Polygon([
+                        volume_points[i][0][k],
+                        volume_points[i + 1][0][k],
+                        volume_points[i + 1][0][k + 1],
+                        volume_points[i][0][k + 1]],
+                        color))
 
             if "bottom" in self.visible_faces["torso"]["front"]:
-                for i in range(0, 8 * hd_ratio):
-                    for k in range(0 * hd_ratio, 4 * hd_ratio):
-                        color = skin.getpixel((28 * hd_ratio + i, (20 * hd_ratio - 1) - k))
-                        if color[3] != 0:
-                            self.polygons["torso"]["bottom"].append(Polygon([
-                                volume_points[i][12 * hd_ratio][k],
-                                volume_points[i + 1][12 * hd_ratio][k],
-                                volume_points[i + 1][12 * hd_ratio][k + 1],
-                                volume_points[i][12 * hd_ratio][k + 1]],
-                                color))
+                for i, k, color in self.opaque_texels(
+                        "torso", "bottom", skin,
+                        lambda i, k: (28 * hd_ratio + i, (20 * hd_ratio - 1) - k),
+                        range(0, 8 * hd_ratio), range(0 * hd_ratio, 4 * hd_ratio)):
+                    self.polygons["torso"]["bottom"].append(Polygon([
+                        volume_points[i][12 * hd_ratio][k],
+                        volume_points[i + 1][12 * hd_ratio][k],
+                        volume_points[i + 1][12 * hd_ratio][k + 1],
+                        volume_points[i][12 * hd_ratio][k + 1]],
+                        color))
 
             """Torso 2nd layer"""
             if self.layers:
-                volume_points = {}
-                for i in range(0, 9 * hd_ratio):
+                def build_points():
+                    volume_points = {}
+                    for i in range(0, 9 * hd_ratio):
+                        for j in range(0, 13 * hd_ratio):
+                            volume_points = append_dict(volume_points, i, j, 0,
+                                                        Point(self, np.array([i * 8.25 / 8 - 0.125 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                              -0.125 * hd_ratio])))
+                            volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
+                                                        Point(self, np.array([i * 8.25 / 8 - 0.125 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                              4.125 * hd_ratio])))
                     for j in range(0, 13 * hd_ratio):
-                        volume_points = append_dict(volume_points, i, j, 0,
-                                                    Point(self, np.array([i * 8.25 / 8 - 0.125 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                          -0.125 * hd_ratio])))
-                        volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
-                                                    Point(self, np.array([i * 8.25 / 8 - 0.125 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                          4.125 * hd_ratio])))
-                for j in range(0, 13 * hd_ratio):
-                    for k in range(0, 5 * hd_ratio):
-                        volume_points = append_dict(volume_points, 0, j, k,
-                                                    Point(self, np.array([-0.125 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
-                        volume_points = append_dict(volume_points, 8 * hd_ratio, j, k,
-                                                    Point(self, np.array([8.125 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
-
-                for i in range(0, 9 * hd_ratio):
-                    for k in range(0, 5 * hd_ratio):
-                        volume_points = append_dict(volume_points, i, 0, k,
-                                                    Point(self, np.array([i * 8.25 / 8 - 0.125 * hd_ratio,
-                                                                         7.875 * hd_ratio,
-                                                                         k * 4.25 / 4 - 0.125 * hd_ratio])))
-                        volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
-                                                    Point(self, np.array([i * 8.25 / 8 - 0.125 * hd_ratio,
-                                                                         12.125 * hd_ratio,
-                                                                         k * 4.25 / 4 - 0.125 * hd_ratio])))
+                        for k in range(0, 5 * hd_ratio):
+                            volume_points = append_dict(volume_points, 0, j, k,
+                                                        Point(self, np.array([-0.125 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+                            volume_points = append_dict(volume_points, 8 * hd_ratio, j, k,
+                                                        Point(self, np.array([8.125 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+
+                    for i in range(0, 9 * hd_ratio):
+                        for k in range(0, 5 * hd_ratio):
+                            volume_points = append_dict(volume_points, i, 0, k,
+                                                        Point(self, np.array([i * 8.25 / 8 - 0.125 * hd_ratio,
+                                                                             7.875 * hd_ratio,
+                                                                             k * 4.25 / 4 - 0.125 * hd_ratio])))
+                            volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
+                                                        Point(self, np.array([i * 8.25 / 8 - 0.125 * hd_ratio,
+                                                                             12.125 * hd_ratio,
+                                                                             k * 4.25 / 4 - 0.125 * hd_ratio])))
+                    return volume_points
+
+                volume_points = LazyVolumePoints(build_points)
 
                 if "back" in self.visible_faces["torso_layer"]["front"]:
-                    for i in range(0, 8 * hd_ratio):
-                        for j in range(0, 12 * hd_ratio):
-                            color = skin.getpixel(((40 * hd_ratio - 1) - i, 20 * hd_ratio + j + 16))
-                            if color[3] != 0:
-                                self.polygons["torso_layer"]["back"].append(Polygon([
-                                    volume_points[i][j][0],
-                                    volume_points[i + 1][j][0],
-                                    volume_points[i + 1][j + 1][0],
-                                    volume_points[i][j + 1][0]],
-                                    color))
+                    for i, j, color in self.opaque_texels(
+                            "torso_layer", "back", skin,
+                            lambda i, j: ((40 * hd_ratio - 1) - i, 20 * hd_ratio + j + 16),
+                            range(0, 8 * hd_ratio), range(0, 12 * hd_ratio)):
+                        self.polygons["torso_layer"]["back"].append(Polygon([
+                            volume_points[i][j][0],
+                            volume_points[i + 1][j][0],
+                            volume_points[i + 1][j + 1][0],
+                            volume_points[i][j + 1][0]],
+                            color))
 
                 if "front" in self.visible_faces["torso_layer"]["front"]:
-                    for i in range(0, 8 * hd_ratio):
-                        for j in range(0, 12 * hd_ratio):
-                            color = skin.getpixel((20 * hd_ratio + i, 20 * hd_ratio + j + 16))
-                            if color[3] != 0:
-                                self.polygons["torso_layer"]["front"].append(Polygon([
-                                    volume_points[i][j][4 * hd_ratio],
-                                    volume_points[i + 1][j][4 * hd_ratio],
-                                    volume_points[i + 1][j + 1][4 * hd_ratio],
-                                    volume_points[i][j + 1][4 * hd_ratio]],
-                                    color))
+                    for i, j, color in self.opaque_texels(
+                            "torso_layer", "front", skin,
+                            lambda i, j: (20 * hd_ratio + i, 20 * hd_ratio + j + 16),
+                            range(0, 8 * hd_ratio), range(0, 12 * hd_ratio)):
+                        self.polygons["torso_layer"]["front"].append(Polygon([
+                            volume_points[i][j][4 * hd_ratio],
+                            volume_points[i + 1][j][4 * hd_ratio],
+                            volume_points[i + 1][j + 1][4 * hd_ratio],
+                            volume_points[i][j + 1][4 * hd_ratio]],
+                            color))
 
                 if "right" in self.visible_faces["torso_layer"]["front"]:
-                    for j in range(0, 12 * hd_ratio):
-                        for k in range(0 * hd_ratio, 4 * hd_ratio):
-                            color = skin.getpixel((16 * hd_ratio + k, 20 * hd_ratio + j + 16))
-                            if color[3] != 0:
-                                self.polygons["torso_layer"]["right"].append(Polygon([
-                                    volume_points[0][j][k],
-                                    volume_points[0][j][k + 1],
-                                    volume_points[0][j + 1][k + 1],
-                                    volume_points[0][j + 1][k]],
-                                    color))
+                    for j, k, color in self.opaque_texels(
+                            "torso_layer", "right", skin,
+                            lambda j, k: (16 * hd_ratio + k, 20 * hd_ratio + j + 16),
+                            range(0, 12 * hd_ratio), range(0 * hd_ratio, 4 * hd_ratio)):
+                        self.polygons["torso_layer"]["right"].append(Polygon([
+                            volume_points[0][j][k],
+                            volume_points[0][j][k + 1],
+                            volume_points[0][j + 1][k + 1],
+                            volume_points[0][j + 1][k]],
+                            color))
 
                 if "left" in self.visible_faces["torso_layer"]["front"]:
-                    for j in range(0, 12 * hd_ratio):
-                        for k in range(0 * hd_ratio, 4 * hd_ratio):
-                            color = skin.getpixel(((32 * hd_ratio - 1) - k, 20 * hd_ratio + j + 16))
-                            if color[3] != 0:
-                                self.polygons["torso_layer"]["left"].append(Polygon([
-                                    volume_points[8 * hd_ratio][j][k],
-                                    volume_points[8 * hd_ratio][j][k + 1],
-                                    volume_points[8 * hd_ratio][j + 1][k + 1],
-                                    volume_points[8 * hd_ratio][j + 1][k]],
-                                    color))
+                    for j, k, color in self.opaque_texels(
+                            "torso_layer", "left", skin,
+                            lambda j, k: ((32 * hd_ratio - 1) - k, 20 * hd_ratio + j + 16),
+                            range(0, 12 * hd_ratio), range(0 * hd_ratio, 4 * hd_ratio)):
+                        self.polygons["torso_layer"]["left"].append(Polygon([
+                            volume_points[8 * hd_ratio][j][k],
+                            volume_points[8 * hd_ratio][j][k + 1],
+                            volume_points[8 * hd_ratio][j + 1][k + 1],
+                            volume_points[8 * hd_ratio][j + 1][k]],
+                            color))
 
                 if "top" in self.visible_faces["torso_layer"]["front"]:
-                    for i in range(0, 8 * hd_ratio):
-                        for k in range(0 * hd_ratio, 4 * hd_ratio):
-                            color = skin.getpixel((20 * hd_ratio + i, 16 * hd_ratio + k + 16))
-                            if color[3] != 0:
-                                self.polygons["torso_layer"]["top"].append(Polygon([
-                                    volume_points[i][0][k],
-                                    volume_points[i + 1][0][k],
-                                    volume_points[i + 1][0][k + 1],
-                                    volume_points[i][0][k + 1]],
-                                    color))
+                    for i, k, color in self.opaque_texels(
+                            "torso_layer", "top", skin,
+                            lambda i, k: (20 * hd_ratio + i, 16 * hd_ratio + k + 16),
+                            range(0, 8 * hd_ratio), range(0 * hd_ratio, 4 * hd_ratio)):
+                        self.polygons["torso_layer"]["top"].append(Polygon([
+                            volume_points[i][0][k],
+                            volume_points[i + 1][0][k],
+                            volume_points[i + 1][0][k + 1],
+                            volume_points[i][0][k + 1]],
+                            color))
 
                 if "bottom" in self.visible_faces["torso_layer"]["front"]:
-                    for i in range(0, 8 * hd_ratio):
-                        for k in range(0 * hd_ratio, 4 * hd_ratio):
-                            color = skin.getpixel((28 * hd_ratio + i, (20 * hd_ratio - 1) - k + 16))
-                            if color[3] != 0:
-                                self.polygons["torso_layer"]["bottom"].append(Polygon([
-                                    volume_points[i][12 * hd_ratio][k],
-                                    volume_points[i + 1][12 * hd_ratio][k],
-                                    volume_points[i + 1][12 * hd_ratio][k + 1],
-                                    volume_points[i][12 * hd_ratio][k + 1]],
-                                    color))
+                    for i, k, color in self.opaque_texels(
+                            "torso_layer", "bottom", skin,
+                            lambda i, k: (28 * hd_ratio + i, (20 * hd_ratio - 1) - k + 16),
+                            range(0, 8 * hd_ratio), range(0 * hd_ratio, 4 * hd_ratio)):
+                        self.polygons["torso_layer"]["bottom"].append(Polygon([
+                            volume_points[i][12 * hd_ratio][k],
+                            volume_points[i + 1][12 * hd_ratio][k],
+                            volume_points[i + 1][12 * hd_ratio][k + 1],
+                            volume_points[i][12 * hd_ratio][k + 1]],
+                            color))
 
             """Cape"""
             if self.display_cape:
+                self.generate_cape_polygons(hd_ratio, cape)
+
+            start = 1 if self.player.is_slim else 0
+            """Right arm"""
+            def build_points():
                 volume_points = {}
-                for i in range(0, 11 * hd_ratio):
-                    for j in range(0, 17 * hd_ratio):
+                for i in range(start, 5 * hd_ratio):
+                    for j in range(0, 13 * hd_ratio):
                         volume_points = append_dict(volume_points, i, j, 0,
-                                                    Point(self, np.array([i - 1, j + 8 * hd_ratio, -1])))
-                        volume_points = append_dict(volume_points, i, j, 1 * hd_ratio,
-                                                    Point(self, np.array([i - 1, j + 8 * hd_ratio, 0])))
+                                                    Point(self, np.array([i - 4 * hd_ratio, j + 8 * hd_ratio, 0])))
+                        volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
+                                                    Point(self, np.array([i - 4 * hd_ratio, j + 8 * hd_ratio, 4 * hd_ratio])))
 
-                for j in range(0, 17 * hd_ratio):
-                    for k in range(0, 2 * hd_ratio):
-                        volume_points = append_dict(volume_points, 0, j, k,
+                for j in range(0, 13 * hd_ratio):
+                    for k in range(0, 5 * hd_ratio):
+                        volume_points = append_dict(volume_points, start, j, k,
+                                                    Point(self, np.array([-4 * hd_ratio + start, j + 8 * hd_ratio, k])))
+                        volume_points = append_dict(volume_points, 4 * hd_ratio, j, k,
                                                     Point(self, np.array([0, j + 8 * hd_ratio, k])))
-                        volume_points = append_dict(volume_points, 8 * hd_ratio, j, k,
-                                                    Point(self, np.array([8 * hd_ratio, j + 8 * hd_ratio, k])))
 
-                for i in range(0, 11 * hd_ratio):
-                    for k in range(0, 2 * hd_ratio):
+                for i in range(start, 5 * hd_ratio):
+                    for k in range(0, 5 * hd_ratio):
                         volume_points = append_dict(volume_points, i, 0, k,
-                                                    Point(self, np.array([i, 8 * hd_ratio, k])))
+                                                    Point(self, np.array([i - 4 * hd_ratio, 8 * hd_ratio, k])))
                         volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
-                                                    Point(self, np.array([i, 20 * hd_ratio, k])))
+                                                    Point(self, np.array([i - 4 * hd_ratio, 20 * hd_ratio, k])))
+                return volume_points
 
-                if "back" in self.visible_faces["cape"]["front"]:
-                    for i in range(0, 10 * hd_ratio):
-                        for j in range(0, 16 * hd_ratio):
-                            color = im_cape.getpixel(((11 * hd_ratio - 1) - i, 1 * hd_ratio + j))
-                            if color[3] != 0:
-                                self.polygons["cape"]["back"].append(Polygon([
-                                    volume_points[i][j][0],
-                                    volume_points[i + 1][j][0],
-                                    volume_points[i + 1][j + 1][0],
-                                    volume_points[i][j + 1][0]],
-                                    color))
-
-                if "front" in self.visible_faces["cape"]["front"]:
-                    for i in range(0, 10 * hd_ratio):
-                        for j in range(0, 16 * hd_ratio):
-                            color = im_cape.getpixel((12 * hd_ratio + i, 1 * hd_ratio + j))
-                            if color[3] != 0:
-                                self.polygons["cape"]["front"].append(Polygon([
-                                    volume_points[i][j][1 * hd_ratio],
-                                    volume_points[i + 1][j][1 * hd_ratio],
-                                    volume_points[i + 1][j + 1][1 * hd_ratio],
-                                    volume_points[i][j + 1][1 * hd_ratio]],
-                                    color))
-
-                if "right" in self.visible_faces["cape"]["front"]:
-                    for j in range(0, 16 * hd_ratio):
-                        color = im_cape.getpixel((12 * hd_ratio, 1 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["cape"]["right"].append(Polygon([
-                                volume_points[0][j][0],
-                                volume_points[0][j][1],
-                                volume_points[0][j + 1][1],
-                                volume_points[0][j + 1][0]],
-                                color))
-
-                if "left" in self.visible_faces["cape"]["front"]:
-                    for j in range(0, 16 * hd_ratio):
-                        color = im_cape.getpixel((1 * hd_ratio, 1 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["cape"]["left"].append(Polygon([
-                                volume_points[10 * hd_ratio][j][0],
-                                volume_points[10 * hd_ratio][j][1],
-                                volume_points[10 * hd_ratio][j + 1][1],
-                                volume_points[10 * hd_ratio][j + 1][0]],
-                                color))
-
-                if "top" in self.visible_faces["cape"]["front"]:
-                    for i in range(0, 10 * hd_ratio):
-                        color = im_cape.getpixel((1 + i, 0))
-                        if color[3] != 0:
-                            self.polygons["cape"]["top"].append(Polygon([
-                                volume_points[i][0][0],
-                                volume_points[i + 1][0][0],
-                                volume_points[i + 1][0][1],
-                                volume_points[i][0][1]],
-                                color))
-
-                if "bottom" in self.visible_faces["cape"]["front"]:
-                    for i in range(0, 10 * hd_ratio):
-                        color = im_cape.getpixel((11 * hd_ratio + i, 0))
-                        if color[3] != 0:
-                            self.polygons["cape"]["bottom"].append(Polygon([
-                                volume_points[i][16 * hd_ratio][0],
-                                volume_points[i + 1][16 * hd_ratio][0],
-                                volume_points[i + 1][16 * hd_ratio][1],
-                                volume_points[i][16 * hd_ratio][1]],
-                                color))
-
-            start = 1 if self.player.is_slim else 0
-            """Right arm"""
-            volume_points = {}
-            for i in range(start, 5 * hd_ratio):
-                for j in range(0, 13 * hd_ratio):
-                    volume_points = append_dict(volume_points, i, j, 0,
-                                                Point(self, np.array([i - 4 * hd_ratio, j + 8 * hd_ratio, 0])))
-                    volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
-                                                Point(self, np.array([i - 4 * hd_ratio, j + 8 * hd_ratio, 4 * hd_ratio])))
-
-            for j in range(0, 13 * hd_ratio):
-                for k in range(0, 5 * hd_ratio):
-                    volume_points = append_dict(volume_points, start, j, k,
-                                                Point(self, np.array([-4 * hd_ratio + start, j + 8 * hd_ratio, k])))
-                    volume_points = append_dict(volume_points, 4 * hd_ratio, j, k,
-                                                Point(self, np.array([0, j + 8 * hd_ratio, k])))
-
-            for i in range(start, 5 * hd_ratio):
-                for k in range(0, 5 * hd_ratio):
-                    volume_points = append_dict(volume_points, i, 0, k,
-                                                Point(self, np.array([i - 4 * hd_ratio, 8 * hd_ratio, k])))
-                    volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
-                                                Point(self, np.array([i - 4 * hd_ratio, 20 * hd_ratio, k])))
+            volume_points = LazyVolumePoints(build_points)
 
             if "back" in self.visible_faces["r_arm"]["front"]:
-                for i in range(start, 4 * hd_ratio):
-                    for j in range(0, 12 * hd_ratio):
-                        color = skin.getpixel((((56 - start) * hd_ratio - 1) - i, 20 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["r_arm"]["back"].append(Polygon([
-                                volume_points[i][j][0],
-                                volume_points[i + 1][j][0],
-                                volume_points[i + 1][j + 1][0],
-                                volume_points[i][j + 1][0]],
-                                color))
+                for i, j, color in self.opaque_texels(
+                        "r_arm", "back", skin,
+                        lambda i, j: (((56 - start) * hd_ratio - 1) - i, 20 * hd_ratio + j),
+                        range(start, 4 * hd_ratio), range(0, 12 * hd_ratio)):
+                    self.polygons["r_arm"]["back"].append(Polygon([
+                        volume_points[i][j][0],
+                        volume_points[i + 1][j][0],
+                        volume_points[i + 1][j + 1][0],
+                        volume_points[i][j + 1][0]],
+                        color))
 
             if "front" in self.visible_faces["r_arm"]["front"]:
-                for i in range(start, 4 * hd_ratio):
-                    for j in range(0, 12 * hd_ratio):
-                        color = skin.getpixel(((44 - start) * hd_ratio + i, 20 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["r_arm"]["front"].append(Polygon([
-                                volume_points[i][j][4 * hd_ratio],
-                                volume_points[i + 1][j][4 * hd_ratio],
-                                volume_points[i + 1][j + 1][4 * hd_ratio],
-                                volume_points[i][j + 1][4 * hd_ratio]],
-                                color))
+                for i, j, color in self.opaque_texels(
+                        "r_arm", "front", skin,
+                        lambda i, j: ((44 - start) * hd_ratio + i, 20 * hd_ratio + j),
+                        range(start, 4 * hd_ratio), range(0, 12 * hd_ratio)):
+                    self.polygons["r_arm"]["front"].append(Polygon([
+                        volume_points[i][j][4 * hd_ratio],
+                        volume_points[i + 1][j][4 * hd_ratio],
+                        volume_points[i + 1][j + 1][4 * hd_ratio],
+                        volume_points[i][j + 1][4 * hd_ratio]],
+                        color))
 
             if "right" in self.visible_faces["r_arm"]["front"]:
-                for j in range(0, 12 * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel((40 * hd_ratio + k, 20 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["r_arm"]["right"].append(Polygon([
-                                volume_points[start][j][k],
-                                volume_points[start][j][k + 1],
-                                volume_points[start][j + 1][k + 1],
-                                volume_points[start][j + 1][k]],
-                                color))
+                for j, k, color in self.opaque_texels(
+                        "r_arm", "right", skin,
+                        lambda j, k: (40 * hd_ratio + k, 20 * hd_ratio + j),
+                        range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["r_arm"]["right"].append(Polygon([
+                        volume_points[start][j][k],
+                        volume_points[start][j][k + 1],
+                        volume_points[start][j + 1][k + 1],
+                        volume_points[start][j + 1][k]],
+                        color))
 
             if "left" in self.visible_faces["r_arm"]["front"]:
-                for j in range(0, 12 * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel((((52 - start) * hd_ratio - 1) - k, 20 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["r_arm"]["left"].append(Polygon([
-                                volume_points[4 * hd_ratio][j][k],
-                                volume_points[4 * hd_ratio][j][k + 1],
-                                volume_points[4 * hd_ratio][j + 1][k + 1],
-                                volume_points[4 * hd_ratio][j + 1][k]],
-                                color))
+                for j, k, color in self.opaque_texels(
+                        "r_arm", "left", skin,
+                        lambda j, k: (((52 - start) * hd_ratio - 1) - k, 20 * hd_ratio + j),
+                        range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["r_arm"]["left"].append(Polygon([
+                        volume_points[4 * hd_ratio][j][k],
+                        volume_points[4 * hd_ratio][j][k + 1],
+                        volume_points[4 * hd_ratio][j + 1][k + 1],
+                        volume_points[4 * hd_ratio][j + 1][k]],
+                        color))
 
             if "top" in self.visible_faces["r_arm"]["front"]:
-                for i in range(start, 4 * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel(((44 - start) * hd_ratio + i, 16 * hd_ratio + k))
-                        if color[3] != 0:
-                            self.polygons["r_arm"]["top"].append(Polygon([
-                                volume_points[i][0][k],
-                                volume_points[i + 1][0][k],
-                                volume_points[i + 1][0][k + 1],
-                                volume_points[i][0][k + 1]],
-                                color))
+                for i, k, color in self.opaque_texels(
+                        "r_arm", "top", skin,
+                        lambda i, k: ((44 - start) * hd_ratio + i, 16 * hd_ratio + k),
+                        range(start, 4 * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["r_arm"]["top"].append(Polygon([
+                        volume_points[i][0][k],
+                        volume_points[i + 1][0][k],
+                        volume_points[i + 1][0][k + 1],
+                        volume_points[i][0][k + 1]],
+                        color))
 
             if "bottom" in self.visible_faces["r_arm"]["front"]:
-                for i in range(start, 4 * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel(((48 - start * 2) * hd_ratio + i, 16 * hd_ratio + k))
-                        if color[3] != 0:
-                            self.polygons["r_arm"]["bottom"].append(Polygon([
-                                volume_points[i][12 * hd_ratio][k],
-                                volume_points[i + 1][12 * hd_ratio][k],
-                                volume_points[i + 1][12 * hd_ratio][k + 1],
-                                volume_points[i][12 * hd_ratio][k + 1]],
-                                color))
+                for i, k, color in self.opaque_texels(
+                        "r_arm", "bottom", skin,
+                        lambda i, k: ((48 - start * 2) * hd_ratio + i, 16 * hd_ratio + k),
+                        range(start, 4 * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["r_arm"]["bottom"].append(Polygon([
+                        volume_points[i][12 * hd_ratio][k],
+                        volume_points[i + 1][12 * hd_ratio][k],
+                        volume_points[i + 1][12 * hd_ratio][k + 1],
+                        volume_points[i][12 * hd_ratio][k + 1]],
+                        color))
 
             """Right arm 2nd layer"""
             if self.layers:
-                volume_points = {}
-                for i in range(start, 5 * hd_ratio):
-                    for j in range(0, 13 * hd_ratio):
-                        volume_points = append_dict(volume_points, i, j, 0,
-                                                    Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) - 4 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                          -0.125 * hd_ratio])))
-                        volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
-                                                    Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) - 4 * hd_ratio,
-                                                                           (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                           4.125 * hd_ratio])))
+                def build_points():
+                    volume_points = {}
+                    for i in range(start, 5 * hd_ratio):
+                        for j in range(0, 13 * hd_ratio):
+                            volume_points = append_dict(volume_points, i, j, 0,
+                                                        Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) - 4 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                              -0.125 * hd_ratio])))
+                            volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
+                                                        Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) - 4 * hd_ratio,
+                                                                               (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                               4.125 * hd_ratio])))
 
-                for j in range(0, 13 * hd_ratio):
-                    for k in range(0, 5 * hd_ratio):
-                        volume_points = append_dict(volume_points, start, j, k,
-                                                    Point(self, np.array([(-4.125 + start) * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
-                        volume_points = append_dict(volume_points, 4 * hd_ratio, j, k,
-                                                    Point(self, np.array([0.125 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
-
-                for i in range(start, 5 * hd_ratio):
-                    for k in range(0, 5 * hd_ratio):
-                        volume_points = append_dict(volume_points, i, 0, k,
-                                                    Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) - 4 * hd_ratio,
-                                                                          7.875 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
-                        volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
-                                                    Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) - 4 * hd_ratio,
-                                                                          20.125 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
+                    for j in range(0, 13 * hd_ratio):
+                        for k in range(0, 5 * hd_ratio):
+                            volume_points = append_dict(volume_points, start, j, k,
+                                                        Point(self, np.array([(-4.125 + start) * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+                            volume_points = append_dict(volume_points, 4 * hd_ratio, j, k,
+                                                        Point(self, np.array([0.125 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+
+                    for i in range(start, 5 * hd_ratio):
+                        for k in range(0, 5 * hd_ratio):
+                            volume_points = append_dict(volume_points, i, 0, k,
+                                                        Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) - 4 * hd_ratio,
+                                                                              7.875 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+                            volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
+                                                        Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) - 4 * hd_ratio,
+                                                                              20.125 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+                    return volume_points
+
+                volume_points = LazyVolumePoints(build_points)
 
                 if "back" in self.visible_faces["r_arm_layer"]["front"]:
-                    for i in range(start, 4 * hd_ratio):
-                        for j in range(0, 12 * hd_ratio):
-                            color = skin.getpixel((((56 - start * 2) * hd_ratio - 1) - i, 20 * hd_ratio + j + 16))
-                            if color[3] != 0:
-                                self.polygons["r_arm_layer"]["back"].append(Polygon([
-                                    volume_points[i][j][0],
-                                    volume_points[i + 1][j][0],
-                                    volume_points[i + 1][j + 1][0],
-                                    volume_points[i][j + 1][0]],
-                                    color))
+                    for i, j, color in self.opaque_texels(
+                            "r_arm_layer", "back", skin,
+                            lambda i, j: (((56 - start * 2) * hd_ratio - 1) - i, 20 * hd_ratio + j + 16),
+                            range(start, 4 * hd_ratio), range(0, 12 * hd_ratio)):
+                        self.polygons["r_arm_layer"]["back"].append(Polygon([
+                            volume_points[i][j][0],
+                            volume_points[i + 1][j][0],
+                            volume_points[i + 1][j + 1][0],
+                            volume_points[i][j + 1][0]],
+                            color))
 
                 if "front" in self.visible_faces["r_arm_layer"]["front"]:
-                    for i in range(start, 4 * hd_ratio):
-                        for j in range(0, 12 * hd_ratio):
-                            color = skin.getpixel(((44 - start) * hd_ratio + i, 20 * hd_ratio + j + 16))
-                            if color[3] != 0:
-                                self.polygons["r_arm_layer"]["front"].append(Polygon([
-                                    volume_points[i][j][4 * hd_ratio],
-                                    volume_points[i + 1][j][4 * hd_ratio],
-                                    volume_points[i + 1][j + 1][4 * hd_ratio],
-                                    volume_points[i][j + 1][4 * hd_ratio]],
-                                    color))
+                    for i, j, color in self.opaque_texels(
+                            "r_arm_layer", "front", skin,
+                            lambda i, j: ((44 - start) * hd_ratio + i, 20 * hd_ratio + j + 16),
+                            range(start, 4 * hd_ratio), range(0, 12 * hd_ratio)):
+                        self.polygons["r_arm_layer"]["front"].append(Polygon([
+                            volume_points[i][j][4 * hd_ratio],
+                            volume_points[i + 1][j][4 * hd_ratio],
+                            volume_points[i + 1][j + 1][4 * hd_ratio],
+                            volume_points[i][j + 1][4 * hd_ratio]],
+                            color))
 
                 if "right" in self.visible_faces["r_arm_layer"]["front"]:
-                    for j in range(0, 12 * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color = skin.getpixel((40 * hd_ratio + k, 20 * hd_ratio + j + 16))
-                            if color[3] != 0:
-                                self.polygons["r_arm_layer"]["right"].append(Polygon([
-                                    volume_points[start][j][k],
-                                    volume_points[start][j][k + 1],
-                                    volume_points[start][j + 1][k + 1],
-                                    volume_points[start][j + 1][k]],
-                                    color))
+                    for j, k, color in self.opaque_texels(
+                            "r_arm_layer", "right", skin,
+                            lambda j, k: (40 * hd_ratio + k, 20 * hd_ratio + j + 16),
+                            range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["r_arm_layer"]["right"].append(Polygon([
+                            volume_points[start][j][k],
+                            volume_points[start][j][k + 1],
+                            volume_points[start][j + 1][k + 1],
+                            volume_points[start][j + 1][k]],
+                            color))
 
                 if "left" in self.visible_faces["r_arm_layer"]["front"]:
-                    for j in range(0, 12 * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color = skin.getpixel((((52 - start) * hd_ratio - 1) - k, 20 * hd_ratio + j + 16))
-                            if color[3] != 0:
-                                self.polygons["r_arm_layer"]["left"].append(Polygon([
-                                    volume_points[4 * hd_ratio][j][k],
-                                    volume_points[4 * hd_ratio][j][k + 1],
-                                    volume_points[4 * hd_ratio][j + 1][k + 1],
-                                    volume_points[4 * hd_ratio][j + 1][k]],
-                                    color))
+                    for j, k, color in self.opaque_texels(
+                            "r_arm_layer", "left", skin,
+                            lambda j, k: (((52 - start) * hd_ratio - 1) - k, 20 * hd_ratio + j + 16),
+                            range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["r_arm_layer"]["left"].append(Polygon([
+                            volume_points[4 * hd_ratio][j][k],
+                            volume_points[4 * hd_ratio][j][k + 1],
+                            volume_points[4 * hd_ratio][j + 1][k + 1],
+                            volume_points[4 * hd_ratio][j + 1][k]],
+                            color))
 
                 if "top" in self.visible_faces["r_arm_layer"]["front"]:
-                    for i in range(start, 4 * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color = skin.getpixel(((44 - start) * hd_ratio + i, 16 * hd_ratio + k + 16))
-                            if color[3] != 0:
-                                self.polygons["r_arm_layer"]["top"].append(Polygon([
-                                    volume_points[i][0][k],
-                                    volume_points[i + 1][0][k],
-                                    volume_points[i + 1][0][k + 1],
-                                    volume_points[i][0][k + 1]],
-                                    color))
+                    for i, k, color in self.opaque_texels(
+                            "r_arm_layer", "top", skin,
+                            lambda i, k: ((44 - start) * hd_ratio + i, 16 * hd_ratio + k + 16),
+                            range(start, 4 * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["r_arm_layer"]["top"].append(Polygon([
+                            volume_points[i][0][k],
+                            volume_points[i + 1][0][k],
+                            volume_points[i + 1][0][k + 1],
+                            volume_points[i][0][k + 1]],
+                            color))
 
                 if "bottom" in self.visible_faces["r_arm_layer"]["front"]:
-                    for i in range(start, 4 * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color = skin.getpixel(((48 - start * 2) * hd_ratio + i, 16 * hd_ratio + k + 16))
-                            if color[3] != 0:
-                                self.polygons["r_arm_layer"]["bottom"].append(Polygon([
-                                    volume_points[i][12 * hd_ratio][k],
-                                    volume_points[i + 1][12 * hd_ratio][k],
-                                    volume_points[i + 1][12 * hd_ratio][k + 1],
-                                    volume_points[i][12 * hd_ratio][k + 1]],
-                                    color))
+                    for i, k, color in self.opaque_texels(
+                            "r_arm_layer", "bottom", skin,
+                            lambda i, k: ((48 - start * 2) * hd_ratio + i, 16 * hd_ratio + k + 16),
+                            range(start, 4 * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["r_arm_layer"]["bottom"].append(Polygon([
+                            volume_points[i][12 * hd_ratio][k],
+                            volume_points[i + 1][12 * hd_ratio][k],
+                            volume_points[i + 1][12 * hd_ratio][k + 1],
+                            volume_points[i][12 * hd_ratio][k + 1]],
+                            color))
 
             """Left arm"""
-            volume_points = {}
-            for i in range(0, (5 - start) * hd_ratio):
+            def build_points():
+                volume_points = {}
+                for i in range(0, (5 - start) * hd_ratio):
+                    for j in range(0, 13 * hd_ratio):
+                        volume_points = append_dict(volume_points, i, j, 0,
+                                                    Point(self, np.array([i + 8 * hd_ratio, j + 8 * hd_ratio, 0])))
+                        volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
+                                                    Point(self, np.array([i + 8 * hd_ratio, j + 8 * hd_ratio, 4 * hd_ratio])))
+
                 for j in range(0, 13 * hd_ratio):
-                    volume_points = append_dict(volume_points, i, j, 0,
-                                                Point(self, np.array([i + 8 * hd_ratio, j + 8 * hd_ratio, 0])))
-                    volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
-                                                Point(self, np.array([i + 8 * hd_ratio, j + 8 * hd_ratio, 4 * hd_ratio])))
+                    for k in range(0, 5 * hd_ratio):
+                        volume_points = append_dict(volume_points, 0, j, k,
+                                                    Point(self, np.array([8 * hd_ratio, j + 8 * hd_ratio, k])))
+                        volume_points = append_dict(volume_points, (4 - start) * hd_ratio, j, k,
+                                                    Point(self, np.array([(12 - start) * hd_ratio, j + 8 * hd_ratio, k])))
 
-            for j in range(0, 13 * hd_ratio):
-                for k in range(0, 5 * hd_ratio):
-                    volume_points = append_dict(volume_points, 0, j, k,
-                                                Point(self, np.array([8 * hd_ratio, j + 8 * hd_ratio, k])))
-                    volume_points = append_dict(volume_points, (4 - start) * hd_ratio, j, k,
-                                                Point(self, np.array([(12 - start) * hd_ratio, j + 8 * hd_ratio, k])))
+                for i in range(0, (5 - start) * hd_ratio):
+                    for k in range(0, 5 * hd_ratio):
+                        volume_points = append_dict(volume_points, i, 0, k,
+                                                    Point(self, np.array([i + 8 * hd_ratio, 8 * hd_ratio, k])))
+                        volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
+                                                    Point(self, np.array([i + 8 * hd_ratio, 20 * hd_ratio, k])))
+                return volume_points
 
-            for i in range(0, (5 - start) * hd_ratio):
-                for k in range(0, 5 * hd_ratio):
-                    volume_points = append_dict(volume_points, i, 0, k,
-                                                Point(self, np.array([i + 8 * hd_ratio, 8 * hd_ratio, k])))
-                    volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
-                                                Point(self, np.array([i + 8 * hd_ratio, 20 * hd_ratio, k])))
+            volume_points = LazyVolumePoints(build_points)
 
             if "back" in self.visible_faces["l_arm"]["front"]:
-                for i in range(0, (4 - start) * hd_ratio):
-                    for j in range(0, 12 * hd_ratio):
-                        color = skin.getpixel(((48 - start * 2) * hd_ratio - 1 - i, 52 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["l_arm"]["back"].append(Polygon([
-                                volume_points[i][j][0],
-                                volume_points[i + 1][j][0],
-                                volume_points[i + 1][j + 1][0],
-                                volume_points[i][j + 1][0]],
-                                color))
+                for i, j, color in self.opaque_texels(
+                        "l_arm", "back", skin,
+                        lambda i, j: ((48 - start * 2) * hd_ratio - 1 - i, 52 * hd_ratio + j),
+                        range(0, (4 - start) * hd_ratio), range(0, 12 * hd_ratio)):
+                    self.polygons["l_arm"]["back"].append(Polygon([
+                        volume_points[i][j][0],
+                        volume_points[i + 1][j][0],
+                        volume_points[i + 1][j + 1][0],
+                        volume_points[i][j + 1][0]],
+                        color))
 
             if "front" in self.visible_faces["l_arm"]["front"]:
-                for i in range(0, (4 - start) * hd_ratio):
-                    for j in range(0, 12 * hd_ratio):
-                        color = skin.getpixel((36 * hd_ratio + i, 52 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["l_arm"]["front"].append(Polygon([
-                                volume_points[i][j][4 * hd_ratio],
-                                volume_points[i + 1][j][4 * hd_ratio],
-                                volume_points[i + 1][j + 1][4 * hd_ratio],
-                                volume_points[i][j + 1][4 * hd_ratio]],
-                                color))
+                for i, j, color in self.opaque_texels(
+                        "l_arm", "front", skin,
+                        lambda i, j: (36 * hd_ratio + i, 52 * hd_ratio + j),
+                        range(0, (4 - start) * hd_ratio), range(0, 12 * hd_ratio)):
+                    self.polygons["l_arm"]["front"].append(Polygon([
+                        volume_points[i][j][4 * hd_ratio],
+                        volume_points[i + 1][j][4 * hd_ratio],
+                        volume_points[i + 1][j + 1][4 * hd_ratio],
+                        volume_points[i][j + 1][4 * hd_ratio]],
+                        color))
 
             if "right" in self.visible_faces["l_arm"]["front"]:
-                for j in range(0, 12 * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel((32 * hd_ratio + k, 52 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["l_arm"]["right"].append(Polygon([
-                                volume_points[0][j][k],
-                                volume_points[0][j][k + 1],
-                                volume_points[0][j + 1][k + 1],
-                                volume_points[0][j + 1][k]],
-                                color))
+                for j, k, color in self.opaque_texels(
+                        "l_arm", "right", skin,
+                        lambda j, k: (32 * hd_ratio + k, 52 * hd_ratio + j),
+                        range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["l_arm"]["right"].append(Polygon([
+                        volume_points[0][j][k],
+                        volume_points[0][j][k + 1],
+                        volume_points[0][j + 1][k + 1],
+                        volume_points[0][j + 1][k]],
+                        color))
 
             if "left" in self.visible_faces["l_arm"]["front"]:
-                for j in range(0, 12 * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel(((44 - start) * hd_ratio - 1 - k, 52 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["l_arm"]["left"].append(Polygon([
-                                volume_points[(4 - start) * hd_ratio][j][k],
-                                volume_points[(4 - start) * hd_ratio][j][k + 1],
-                                volume_points[(4 - start) * hd_ratio][j + 1][k + 1],
-                                volume_points[(4 - start) * hd_ratio][j + 1][k]],
-                                color))
+                for j, k, color in self.opaque_texels(
+                        "l_arm", "left", skin,
+                        lambda j, k: ((44 - start) * hd_ratio - 1 - k, 52 * hd_ratio + j),
+                        range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["l_arm"]["left"].append(Polygon([
+                        volume_points[(4 - start) * hd_ratio][j][k],
+                        volume_points[(4 - start) * hd_ratio][j][k + 1],
+                        volume_points[(4 - start) * hd_ratio][j + 1][k + 1],
+                        volume_points[(4 - start) * hd_ratio][j + 1][k]],
+                        color))
 
             if "top" in self.visible_faces["l_arm"]["front"]:
-                for i in range(0, (4 - start) * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel((36 * hd_ratio + i, 48 * hd_ratio + k))
-                        if color[3] != 0:
-                            self.polygons["l_arm"]["top"].append(Polygon([
-                                volume_points[i][0][k],
-                                volume_points[i + 1][0][k],
-                                volume_points[i + 1][0][k + 1],
-                                volume_points[i][0][k + 1]],
-                                color))
+                for i, k, color in self.opaque_texels(
+                        "l_arm", "top", skin,
+                        lambda i, k: (36 * hd_ratio + i, 48 * hd_ratio + k),
+                        range(0, (4 - start) * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["l_arm"]["top"].append(Polygon([
+                        volume_points[i][0][k],
+                        volume_points[i + 1][0][k],
+                        volume_points[i + 1][0][k + 1],
+                        volume_points[i][0][k + 1]],
+                        color))
 
             if "bottom" in self.visible_faces["l_arm"]["front"]:
-                for i in range(0, (4 - start) * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel(((40 - start) * hd_ratio + i, 48 * hd_ratio + k))
-                        if color[3] != 0:
-                            self.polygons["l_arm"]["bottom"].append(Polygon([
-                                volume_points[i][12 * hd_ratio][k],
-                                volume_points[i + 1][12 * hd_ratio][k],
-                                volume_points[i + 1][12 * hd_ratio][k + 1],
-                                volume_points[i][12 * hd_ratio][k + 1]],
-                                color))
+                for i, k, color in self.opaque_texels(
+                        "l_arm", "bottom", skin,
+                        lambda i, k: ((40 - start) * hd_ratio + i, 48 * hd_ratio + k),
+                        range(0, (4 - start) * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["l_arm"]["bottom"].append(Polygon([
+                        volume_points[i][12 * hd_ratio][k],
+                        volume_points[i + 1][12 * hd_ratio][k],
+                        volume_points[i + 1][12 * hd_ratio][k + 1],
+                        volume_points[i][12 * hd_ratio][k + 1]],
+                        color))
 
             """Left arm 2nd layer"""
             if self.layers:
-                volume_points = {}
-                for i in range(0, (5 - start) * hd_ratio):
-                    for j in range(0, 13 * hd_ratio):
-                        volume_points = append_dict(volume_points, i, j, 0,
-                                                    Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                          -0.125 * hd_ratio])))
-                        volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
-                                                    Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                          4.125 * hd_ratio])))
-
-                for j in range(0, 13 * hd_ratio):
-                    for k in range(0, 5 * hd_ratio):
-                        volume_points = append_dict(volume_points, 0, j, k,
-                                                    Point(self, np.array([7.875 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
-                        volume_points = append_dict(volume_points, (4 - start) * hd_ratio, j, k,
-                                                    Point(self, np.array([(12.125 - start) * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
+                def build_points():
+                    volume_points = {}
+                    for i in range(0, (5 - start) * hd_ratio):
+                        for j in range(0, 13 * hd_ratio):
+                            volume_points = append_dict(volume_points, i, j, 0,
+                                                        Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                              -0.125 * hd_ratio])))
+                            volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
+                                                        Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                              4.125 * hd_ratio])))
 
-                for i in range(0, (5 - start) * hd_ratio):
-                    for k in range(0, 5 * hd_ratio):
-                        volume_points = append_dict(volume_points, i, 0, k,
-                                                    Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                          7.875 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
-                        volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
-                                                    Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 8 * hd_ratio,
-                                                                          20.125 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
+                    for j in range(0, 13 * hd_ratio):
+                        for k in range(0, 5 * hd_ratio):
+                            volume_points = append_dict(volume_points, 0, j, k,
+                                                        Point(self, np.array([7.875 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+                            volume_points = append_dict(volume_points, (4 - start) * hd_ratio, j, k,
+                                                        Point(self, np.array([(12.125 - start) * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+
+                    for i in range(0, (5 - start) * hd_ratio):
+                        for k in range(0, 5 * hd_ratio):
+                            volume_points = append_dict(volume_points, i, 0, k,
+                                                        Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                              7.875 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+                            volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
+                                                        Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 8 * hd_ratio,
+                                                                              20.125 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+                    return volume_points
+
+                volume_points = LazyVolumePoints(build_points)
 
                 if "back" in self.visible_faces["l_arm_layer"]["front"]:
-                    for i in range(0, (4 - start) * hd_ratio):
-                        for j in range(0, 12 * hd_ratio):
-                            color = skin.getpixel(((64 - start * 2) * hd_ratio - 1 - i, 52 * hd_ratio + j))
-                            if color[3] != 0:
-                                self.polygons["l_arm_layer"]["back"].append(Polygon([
-                                    volume_points[i][j][0],
-                                    volume_points[i + 1][j][0],
-                                    volume_points[i + 1][j + 1][0],
-                                    volume_points[i][j + 1][0]],
-                                    color))
+                    for i, j, color in self.opaque_texels(
+                            "l_arm_layer", "back", skin,
+                            lambda i, j: ((64 - start * 2) * hd_ratio - 1 - i, 52 * hd_ratio + j),
+                            range(0, (4 - start) * hd_ratio), range(0, 12 * hd_ratio)):
+                        self.polygons["l_arm_layer"]["back"].append(Polygon([
+                            volume_points[i][j][0],
+                            volume_points[i + 1][j][0],
+                            volume_points[i + 1][j + 1][0],
+                            volume_points[i][j + 1][0]],
+                            color))
 
                 if "front" in self.visible_faces["l_arm_layer"]["front"]:
-                    for i in range(0, (4 - start) * hd_ratio):
-                        for j in range(0, 12 * hd_ratio):
-                            color = skin.getpixel((52 * hd_ratio + i, 52 * hd_ratio + j))
-                            if color[3] != 0:
-                                self.polygons["l_arm_layer"]["front"].append(Polygon([
-                                    volume_points[i][j][4 * hd_ratio],
-                                    volume_points[i + 1][j][4 * hd_ratio],
-                                    volume_points[i + 1][j + 1][4 * hd_ratio],
-                                    volume_points[i][j + 1][4 * hd_ratio]],
-                                    color))
+                    for i, j, color in self.opaque_texels(
+                            "l_arm_layer", "front", skin,
+                            lambda i, j: (52 * hd_ratio + i, 52 * hd_ratio + j),
+                            range(0, (4 - start) * hd_ratio), range(0, 12 * hd_ratio)):
+                        self.polygons["l_arm_layer"]["front"].append(Polygon([
+                            volume_points[i][j][4 * hd_ratio],
+                            volume_points[i + 1][j][4 * hd_ratio],
+                            volume_points[i + 1][j + 1][4 * hd_ratio],
+                            volume_points[i][j + 1][4 * hd_ratio]],
+                            color))
 
                 if "right" in self.visible_faces["l_arm_layer"]["front"]:
-                    for j in range(0, 12 * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color = skin.getpixel((48 * hd_ratio + k, 52 * hd_ratio + j))
-                            if color[3] != 0:
-                                self.polygons["l_arm_layer"]["right"].append(Polygon([
-                                    volume_points[0][j][k],
-                                    volume_points[0][j][k + 1],
-                                    volume_points[0][j + 1][k + 1],
-                                    volume_points[0][j + 1][k]],
-                                    color))
+                    for j, k, color in self.opaque_texels(
+                            "l_arm_layer", "right", skin,
+                            lambda j, k: (48 * hd_ratio + k, 52 * hd_ratio + j),
+                            range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["l_arm_layer"]["right"].append(Polygon([
+                            volume_points[0][j][k],
+                            volume_points[0][j][k + 1],
+                            volume_points[0][j + 1][k + 1],
+                            volume_points[0][j + 1][k]],
+                            color))
 
                 if "left" in self.visible_faces["l_arm_layer"]["front"]:
-                    for j in range(0, 12 * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color = skin.getpixel(((60 - start) * hd_ratio - 1 - k, 52 * hd_ratio + j))
-                            if color[3] != 0:
-                                self.polygons["l_arm_layer"]["left"].append(Polygon([
-                                    volume_points[(4 - start) * hd_ratio][j][k],
-                                    volume_points[(4 - start) * hd_ratio][j][k + 1],
-                                    volume_points[(4 - start) * hd_ratio][j + 1][k + 1],
-                                    volume_points[(4 - start) * hd_ratio][j + 1][k]],
-                                    color))
+                    for j, k, color in self.opaque_texels(
+                            "l_arm_layer", "left", skin,
+                            lambda j, k: ((60 - start) * hd_ratio - 1 - k, 52 * hd_ratio + j),
+                            range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["l_arm_layer"]["left"].append(Polygon([
+                            volume_points[(4 - start) * hd_ratio][j][k],
+                            volume_points[(4 - start) * hd_ratio][j][k + 1],
+                            volume_points[(4 - start) * hd_ratio][j + 1][k + 1],
+                            volume_points[(4 - start) * hd_ratio][j + 1][k]],
+                            color))
 
                 if "top" in self.visible_faces["l_arm_layer"]["front"]:
-                    for i in range(0, (4 - start) * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color = skin.getpixel((52 * hd_ratio + i, 48 * hd_ratio + k))
-                            if color[3] != 0:
-                                self.polygons["l_arm_layer"]["top"].append(Polygon([
-                                    volume_points[i][0][k],
-                                    volume_points[i + 1][0][k],
-                                    volume_points[i + 1][0][k + 1],
-                                    volume_points[i][0][k + 1]],
-                                    color))
+                    for i, k, color in self.opaque_texels(
+                            "l_arm_layer", "top", skin,
+                            lambda i, k: (52 * hd_ratio + i, 48 * hd_ratio + k),
+                            range(0, (4 - start) * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["l_arm_layer"]["top"].append(Polygon([
+                            volume_points[i][0][k],
+                            volume_points[i + 1][0][k],
+                            volume_points[i + 1][0][k + 1],
+                            volume_points[i][0][k + 1]],
+                            color))
 
                 if "bottom" in self.visible_faces["l_arm_layer"]["front"]:
-                    for i in range(0, (4 - start) * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color = skin.getpixel(((56 - start) * hd_ratio + i, 48 * hd_ratio + k))
-                            if color[3] != 0:
-                                self.polygons["l_arm_layer"]["bottom"].append(Polygon([
-                                    volume_points[i][12 * hd_ratio][k],
-                                    volume_points[i + 1][12 * hd_ratio][k],
-                                    volume_points[i + 1][12 * hd_ratio][k + 1],
-                                    volume_points[i][12 * hd_ratio][k + 1]],
-                                    color))
+                    for i, k, color in self.opaque_texels(
+                            "l_arm_layer", "bottom", skin,
+                            lambda i, k: ((56 - start) * hd_ratio + i, 48 * hd_ratio + k),
+                            range(0, (4 - start) * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["l_arm_layer"]["bottom"].append(Polygon([
+                            volume_points[i][12 * hd_ratio][k],
+                            volume_points[i + 1][12 * hd_ratio][k],
+                            volume_points[i + 1][12 * hd_ratio][k + 1],
+                            volume_points[i][12 * hd_ratio][k + 1]],
+                            color))
 
             """Right leg"""
-            volume_points = {}
-            for i in range(0, 5 * hd_ratio):
+            def build_points():
+                volume_points = {}
+                for i in range(0, 5 * hd_ratio):
+                    for j in range(0, 13 * hd_ratio):
+                        volume_points = append_dict(volume_points, i, j, 0,
+                                                    Point(self, np.array([i, j + 20 * hd_ratio, 0])))
+                        volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
+                                                    Point(self, np.array([i, j + 20 * hd_ratio, 4 * hd_ratio])))
+
                 for j in range(0, 13 * hd_ratio):
-                    volume_points = append_dict(volume_points, i, j, 0,
-                                                Point(self, np.array([i, j + 20 * hd_ratio, 0])))
-                    volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
-                                                Point(self, np.array([i, j + 20 * hd_ratio, 4 * hd_ratio])))
+                    for k in range(0, 5 * hd_ratio):
+                        volume_points = append_dict(volume_points, 0, j, k,
+                                                    Point(self, np.array([0, j + 20 * hd_ratio, k])))
+                        volume_points = append_dict(volume_points, 4 * hd_ratio, j, k,
+                                                    Point(self, np.array([4 * hd_ratio, j + 20 * hd_ratio, k])))
 
-            for j in range(0, 13 * hd_ratio):
-                for k in range(0, 5 * hd_ratio):
-                    volume_points = append_dict(volume_points, 0, j, k,
-                                                Point(self, np.array([0, j + 20 * hd_ratio, k])))
-                    volume_points = append_dict(volume_points, 4 * hd_ratio, j, k,
-                                                Point(self, np.array([4 * hd_ratio, j + 20 * hd_ratio, k])))
+                for i in range(0, 5 * hd_ratio):
+                    for k in range(0, 5 * hd_ratio):
+                        volume_points = append_dict(volume_points, i, 0, k,
+                                                    Point(self, np.array([i, 20 * hd_ratio, k])))
+                        volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
+                                                    Point(self, np.array([i, 32 * hd_ratio, k])))
+                return volume_points
 
-            for i in range(0, 5 * hd_ratio):
-                for k in range(0, 5 * hd_ratio):
-                    volume_points = append_dict(volume_points, i, 0, k,
-                                                Point(self, np.array([i, 20 * hd_ratio, k])))
-                    volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
-                                                Point(self, np.array([i, 32 * hd_ratio, k])))
+            volume_points = LazyVolumePoints(build_points)
 
             if "back" in self.visible_faces["r_leg"]["front"]:
-                for i in range(0, 4 * hd_ratio):
-                    for j in range(0, 12 * hd_ratio):
-                        color = skin.getpixel(((16 * hd_ratio - 1) - i, 20 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["r_leg"]["back"].append(Polygon([
-                                volume_points[i][j][0],
-                                volume_points[i + 1][j][0],
-                                volume_points[i + 1][j + 1][0],
-                                volume_points[i][j + 1][0]],
-                                color))
+                for i, j, color in self.opaque_texels(
+                        "r_leg", "back", skin,
+                        lambda i, j: ((16 * hd_ratio - 1) - i, 20 * hd_ratio + j),
+                        range(0, 4 * hd_ratio), range(0, 12 * hd_ratio)):
+                    self.polygons["r_leg"]["back"].append(Polygon([
+                        volume_points[i][j][0],
+                        volume_points[i + 1][j][0],
+                        volume_points[i + 1][j + 1][0],
+                        volume_points[i][j + 1][0]],
+                        color))
 
             if "front" in self.visible_faces["r_leg"]["front"]:
-                for i in range(0, 4 * hd_ratio):
-                    for j in range(0, 12 * hd_ratio):
-                        color = skin.getpixel((4 * hd_ratio + i, 20 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["r_leg"]["front"].append(Polygon([
-                                volume_points[i][j][4 * hd_ratio],
-                                volume_points[i + 1][j][4 * hd_ratio],
-                                volume_points[i + 1][j + 1][4 * hd_ratio],
-                                volume_points[i][j + 1][4 * hd_ratio]],
-                                color))
+                for i, j, color in self.opaque_texels(
+                        "r_leg", "front", skin,
+                        lambda i, j: (4 * hd_ratio + i, 20 * hd_ratio + j),
+                        range(0, 4 * hd_ratio), range(0, 12 * hd_ratio)):
+                    self.polygons["r_leg"]["front"].append(Polygon([
+                        volume_points[i][j][4 * hd_ratio],
+                        volume_points[i + 1][j][4 * hd_ratio],
+                        volume_points[i + 1][j + 1][4 * hd_ratio],
+                        volume_points[i][j + 1][4 * hd_ratio]],
+                        color))
 
             if "right" in self.visible_faces["r_leg"]["front"]:
-                for j in range(0, 12 * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel((k, 20 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["r_leg"]["right"].append(Polygon([
-                                volume_points[0][j][k],
-                                volume_points[0][j][k + 1],
-                                volume_points[0][j + 1][k + 1],
-                                volume_points[0][j + 1][k]],
-                                color))
+                for j, k, color in self.opaque_texels(
+                        "r_leg", "right", skin,
+                        lambda j, k: (k, 20 * hd_ratio + j),
+                        range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["r_leg"]["right"].append(Polygon([
+                        volume_points[0][j][k],
+                        volume_points[0][j][k + 1],
+                        volume_points[0][j + 1][k + 1],
+                        volume_points[0][j + 1][k]],
+                        color))
 
             if "left" in self.visible_faces["r_leg"]["front"]:
-                for j in range(0, 12 * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel(((12 * hd_ratio - 1) - k, 20 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["r_leg"]["left"].append(Polygon([
-                                volume_points[4 * hd_ratio][j][k],
-                                volume_points[4 * hd_ratio][j][k + 1],
-                                volume_points[4 * hd_ratio][j + 1][k + 1],
-                                volume_points[4 * hd_ratio][j + 1][k]],
-                                color))
+                for j, k, color in self.opaque_texels(
+                        "r_leg", "left", skin,
+                        lambda j, k: ((12 * hd_ratio - 1) - k, 20 * hd_ratio + j),
+                        range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["r_leg"]["left"].append(Polygon([
+                        volume_points[4 * hd_ratio][j][k],
+                        volume_points[4 * hd_ratio][j][k + 1],
+                        volume_points[4 * hd_ratio][j + 1][k + 1],
+                        volume_points[4 * hd_ratio][j + 1][k]],
+                        color))
 
             if "top" in self.visible_faces["r_leg"]["front"]:
-                for i in range(0, 4 * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel((4 * hd_ratio + i, 16 * hd_ratio + k))
-                        if color[3] != 0:
-                            self.polygons["r_leg"]["top"].append(Polygon([
-                                volume_points[i][0][k],
-                                volume_points[i + 1][0][k],
-                                volume_points[i + 1][0][k + 1],
-                                volume_points[i][0][k + 1]],
-                                color))
+                for i, k, color in self.opaque_texels(
+                        "r_leg", "top", skin,
+                        lambda i, k: (4 * hd_ratio + i, 16 * hd_ratio + k),
+                        range(0, 4 * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["r_leg"]["top"].append(Polygon([
+                        volume_points[i][0][k],
+                        volume_points[i + 1][0][k],
+                        volume_points[i + 1][0][k + 1],
+                        volume_points[i][0][k + 1]],
+                        color))
 
             if "bottom" in self.visible_faces["r_leg"]["front"]:
-                for i in range(0, 4 * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel((8 * hd_ratio + i, 16 * hd_ratio + k))
-                        if color[3] != 0:
-                            self.polygons["r_leg"]["bottom"].append(Polygon([
-                                volume_points[i][12 * hd_ratio][k],
-                                volume_points[i + 1][12 * hd_ratio][k],
-                                volume_points[i + 1][12 * hd_ratio][k + 1],
-                                volume_points[i][12 * hd_ratio][k + 1]],
-                                color))
+                for i, k, color in self.opaque_texels(
+                        "r_leg", "bottom", skin,
+                        lambda i, k: (8 * hd_ratio + i, 16 * hd_ratio + k),
+                        range(0, 4 * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["r_leg"]["bottom"].append(Polygon([
+                        volume_points[i][12 * hd_ratio][k],
+                        volume_points[i + 1][12 * hd_ratio][k],
+                        volume_points[i + 1][12 * hd_ratio][k + 1],
+                        volume_points[i][12 * hd_ratio][k + 1]],
+                        color))
 
             """Right leg 2nd layer"""
             if self.layers:
-                volume_points = {}
-                for i in range(0, 5 * hd_ratio):
-                    for j in range(0, 13 * hd_ratio):
-                        volume_points = append_dict(volume_points, i, j, 0,
-                                                    Point(self, np.array([i * 4.25 / 4 - 0.125 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
-                                                                          -0.125 * hd_ratio])))
-                        volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
-                                                    Point(self, np.array([i * 4.25 / 4 - 0.125 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
-                                                                          4.125 * hd_ratio])))
-
-                for j in range(0, 13 * hd_ratio):
-                    for k in range(0, 5 * hd_ratio):
-                        volume_points = append_dict(volume_points, 0, j, k,
-                                                    Point(self, np.array([-0.125 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
-                        volume_points = append_dict(volume_points, 4 * hd_ratio, j, k,
-                                                    Point(self, np.array([4.125 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
+                def build_points():
+                    volume_points = {}
+                    for i in range(0, 5 * hd_ratio):
+                        for j in range(0, 13 * hd_ratio):
+                            volume_points = append_dict(volume_points, i, j, 0,
+                                                        Point(self, np.array([i * 4.25 / 4 - 0.125 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
+                                                                              -0.125 * hd_ratio])))
+                            volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
+                                                        Point(self, np.array([i * 4.25 / 4 - 0.125 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
+                                                                              4.125 * hd_ratio])))
 
-                for i in range(0, 5 * hd_ratio):
-                    for k in range(0, 5 * hd_ratio):
-                        volume_points = append_dict(volume_points, i, 0, k,
-                                                    Point(self, np.array([i * 4.25 / 4 - 0.125 * hd_ratio,
-                                                                          19.875 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
-                        volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
-                                                    Point(self, np.array([i * 4.25 / 4 - 0.125 * hd_ratio,
-                                                                          32.125 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
+                    for j in range(0, 13 * hd_ratio):
+                        for k in range(0, 5 * hd_ratio):
+                            volume_points = append_dict(volume_points, 0, j, k,
+                                                        Point(self, np.array([-0.125 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+                            volume_points = append_dict(volume_points, 4 * hd_ratio, j, k,
+                                                        Point(self, np.array([4.125 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+
+                    for i in range(0, 5 * hd_ratio):
+                        for k in range(0, 5 * hd_ratio):
+                            volume_points = append_dict(volume_points, i, 0, k,
+                                                        Point(self, np.array([i * 4.25 / 4 - 0.125 * hd_ratio,
+                                                                              19.875 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+                            volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
+                                                        Point(self, np.array([i * 4.25 / 4 - 0.125 * hd_ratio,
+                                                                              32.125 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+                    return volume_points
+
+                volume_points = LazyVolumePoints(build_points)
 
                 if "back" in self.visible_faces["r_leg_layer"]["front"]:
-                    for i in range(0, 4 * hd_ratio):
-                        for j in range(0, 12 * hd_ratio):
-                            color = skin.getpixel((16 * hd_ratio - 1 - i, 36 * hd_ratio + j))
-                            if color[3] != 0:
-                                self.polygons["r_leg_layer"]["back"].append(Polygon([
-                                    volume_points[i][j][0],
-                                    volume_points[i + 1][j][0],
-                                    volume_points[i + 1][j + 1][0],
-                                    volume_points[i][j + 1][0]],
-                                    color))
+                    for i, j, color in self.opaque_texels(
+                            "r_leg_layer", "back", skin,
+                            lambda i, j: (16 * hd_ratio - 1 - i, 36 * hd_ratio + j),
+                            range(0, 4 * hd_ratio), range(0, 12 * hd_ratio)):
+                        self.polygons["r_leg_layer"]["back"].append(Polygon([
+                            volume_points[i][j][0],
+                            volume_points[i + 1][j][0],
+                            volume_points[i + 1][j + 1][0],
+                            volume_points[i][j + 1][0]],
+                            color))
 
                 if "front" in self.visible_faces["r_leg_layer"]["front"]:
-                    for i in range(0, 4 * hd_ratio):
-                        for j in range(0, 12 * hd_ratio):
-                            color = skin.getpixel((4 * hd_ratio + i, 36 * hd_ratio + j))
-                            if color[3] != 0:
-                                self.polygons["r_leg_layer"]["front"].append(Polygon([
-                                    volume_points[i][j][4 * hd_ratio],
-                                    volume_points[i + 1][j][4 * hd_ratio],
-                                    volume_points[i + 1][j + 1][4 * hd_ratio],
-                                    volume_points[i][j + 1][4 * hd_ratio]],
-                                    color))
+                    for i, j, color in self.opaque_texels(
+                            "r_leg_layer", "front", skin,
+                            lambda i, j: (4 * hd_ratio + i, 36 * hd_ratio + j),
+                            range(0, 4 * hd_ratio), range(0, 12 * hd_ratio)):
+                        self.polygons["r_leg_layer"]["front"].append(Polygon([
+                            volume_points[i][j][4 * hd_ratio],
+                            volume_points[i + 1][j][4 * hd_ratio],
+                            volume_points[i + 1][j + 1][4 * hd_ratio],
+                            volume_points[i][j + 1][4 * hd_ratio]],
+                            color))
 
                 if "right" in self.visible_faces["r_leg_layer"]["front"]:
-                    for j in range(0, 12 * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color = skin.getpixel((k, 36 * hd_ratio + j))
-                            if color[3] != 0:
-                                self.polygons["r_leg_layer"]["right"].append(Polygon([
-                                    volume_points[0][j][k],
-                                    volume_points[0][j][k + 1],
-                                    volume_points[0][j + 1][k + 1],
-                                    volume_points[0][j + 1][k]],
-                                    color))
+                    for j, k, color in self.opaque_texels(
+                            "r_leg_layer", "right", skin,
+                            lambda j, k: (k, 36 * hd_ratio + j),
+                            range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["r_leg_layer"]["right"].append(Polygon([
+                            volume_points[0][j][k],
+                            volume_points[0][j][k + 1],
+                            volume_points[0][j + 1][k + 1],
+                            volume_points[0][j + 1][k]],
+                            color))
 
                 if "left" in self.visible_faces["r_leg_layer"]["front"]:
-                    for j in range(0, 12 * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color = skin.getpixel((12 * hd_ratio - 1 - k, 36 * hd_ratio + j))
-                            if color[3] != 0:
-                                self.polygons["r_leg_layer"]["left"].append(Polygon([
-                                    volume_points[4 * hd_ratio][j][k],
-                                    volume_points[4 * hd_ratio][j][k + 1],
-                                    volume_points[4 * hd_ratio][j + 1][k + 1],
-                                    volume_points[4 * hd_ratio][j + 1][k]],
-                                    color))
+                    for j, k, color in self.opaque_texels(
+                            "r_leg_layer", "left", skin,
+                            lambda j, k: (12 * hd_ratio - 1 - k, 36 * hd_ratio + j),
+                            range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["r_leg_layer"]["left"].append(Polygon([
+                            volume_points[4 * hd_ratio][j][k],
+                            volume_points[4 * hd_ratio][j][k + 1],
+                            volume_points[4 * hd_ratio][j + 1][k + 1],
+                            volume_points[4 * hd_ratio][j + 1][k]],
+                            color))
 
                 if "top" in self.visible_faces["r_leg_layer"]["front"]:
-                    for i in range(0, 4 * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color = skin.getpixel((4 * hd_ratio + i, 32 * hd_ratio + k))
-                            if color[3] != 0:
-                                self.polygons["r_leg_layer"]["top"].append(Polygon([
-                                    volume_points[i][0][k],
-                                    volume_points[i + 1][0][k],
-                                    volume_points[i + 1][0][k + 1],
-                                    volume_points[i][0][k + 1]],
-                                    color))
+                    for i, k, color in self.opaque_texels(
+                            "r_leg_layer", "top", skin,
+                            lambda i, k: (4 * hd_ratio + i, 32 * hd_ratio + k),
+                            range(0, 4 * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["r_leg_layer"]["top"].append(Polygon([
+                            volume_points[i][0][k],
+                            volume_points[i + 1][0][k],
+                            volume_points[i + 1][0][k + 1],
+                            volume_points[i][0][k + 1]],
+                            color))
 
                 if "bottom" in self.visible_faces["r_leg_layer"]["front"]:
-                    for i in range(0, 4 * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color = skin.getpixel((8 * hd_ratio + i, 32 * hd_ratio + k))
-                            if color[3] != 0:
-                                self.polygons["r_leg_layer"]["bottom"].append(Polygon([
-                                    volume_points[i][12 * hd_ratio][k],
-                                    volume_points[i + 1][12 * hd_ratio][k],
-                                    volume_points[i + 1][12 * hd_ratio][k + 1],
-                                    volume_points[i][12 * hd_ratio][k + 1]],
-                                    color))
+                    for i, k, color in self.opaque_texels(
+                            "r_leg_layer", "bottom", skin,
+                            lambda i, k: (8 * hd_ratio + i, 32 * hd_ratio + k),
+                            range(0, 4 * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["r_leg_layer"]["bottom"].append(Polygon([
+                            volume_points[i][12 * hd_ratio][k],
+                            volume_points[i + 1][12 * hd_ratio][k],
+                            volume_points[i + 1][12 * hd_ratio][k + 1],
+                            volume_points[i][12 * hd_ratio][k + 1]],
+                            color))
 
             """Left leg"""
-            volume_points = {}
-            for i in range(0, 9 * hd_ratio):
+            def build_points():
+                volume_points = {}
+                for i in range(0, 9 * hd_ratio):
+                    for j in range(0, 13 * hd_ratio):
+                        volume_points = append_dict(volume_points, i, j, 0,
+                                                    Point(self, np.array([i + 4 * hd_ratio, j + 20 * hd_ratio, 0])))
+                        volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
+                                                    Point(self, np.array([i + 4 * hd_ratio, j + 20 * hd_ratio, 4 * hd_ratio])))
+
                 for j in range(0, 13 * hd_ratio):
-                    volume_points = append_dict(volume_points, i, j, 0,
-                                                Point(self, np.array([i + 4 * hd_ratio, j + 20 * hd_ratio, 0])))
-                    volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
-                                                Point(self, np.array([i + 4 * hd_ratio, j + 20 * hd_ratio, 4 * hd_ratio])))
+                    for k in range(0, 5 * hd_ratio):
+                        volume_points = append_dict(volume_points, 0, j, k,
+                                                    Point(self, np.array([4 * hd_ratio, j + 20 * hd_ratio, k])))
+                        volume_points = append_dict(volume_points, 4 * hd_ratio, j, k,
+                                                    Point(self, np.array([8 * hd_ratio, j + 20 * hd_ratio, k])))
 
-            for j in range(0, 13 * hd_ratio):
-                for k in range(0, 5 * hd_ratio):
-                    volume_points = append_dict(volume_points, 0, j, k,
-                                                Point(self, np.array([4 * hd_ratio, j + 20 * hd_ratio, k])))
-                    volume_points = append_dict(volume_points, 4 * hd_ratio, j, k,
-                                                Point(self, np.array([8 * hd_ratio, j + 20 * hd_ratio, k])))
+                for i in range(0, 9 * hd_ratio):
+                    for k in range(0, 5 * hd_ratio):
+                        volume_points = append_dict(volume_points, i, 0, k,
+                                                    Point(self, np.array([i + 4 * hd_ratio, 20 * hd_ratio, k])))
+                        volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
+                                                    Point(self, np.array([i + 4 * hd_ratio, 32 * hd_ratio, k])))
+                return volume_points
 
-            for i in range(0, 9 * hd_ratio):
-                for k in range(0, 5 * hd_ratio):
-                    volume_points = append_dict(volume_points, i, 0, k,
-                                                Point(self, np.array([i + 4 * hd_ratio, 20 * hd_ratio, k])))
-                    volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
-                                                Point(self, np.array([i + 4 * hd_ratio, 32 * hd_ratio, k])))
+            volume_points = LazyVolumePoints(build_points)
 
             if "back" in self.visible_faces["l_leg"]["front"]:
-                for i in range(0, 4 * hd_ratio):
-                    for j in range(0, 12 * hd_ratio):
-                        color = skin.getpixel((32 * hd_ratio - 1 - i, 52 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["l_leg"]["back"].append(Polygon([
-                                volume_points[i][j][0],
-                                volume_points[i + 1][j][0],
-                                volume_points[i + 1][j + 1][0],
-                                volume_points[i][j + 1][0]],
-                                color))
+                for i, j, color in self.opaque_texels(
+                        "l_leg", "back", skin,
+                        lambda i, j: (32 * hd_ratio - 1 - i, 52 * hd_ratio + j),
+                        range(0, 4 * hd_ratio), range(0, 12 * hd_ratio)):
+                    self.polygons["l_leg"]["back"].append(Polygon([
+                        volume_points[i][j][0],
+                        volume_points[i + 1][j][0],
+                        volume_points[i + 1][j + 1][0],
+                        volume_points[i][j + 1][0]],
+                        color))
 
             if "front" in self.visible_faces["l_leg"]["front"]:
-                for i in range(0, 4 * hd_ratio):
-                    for j in range(0, 12 * hd_ratio):
-                        color = skin.getpixel((20 * hd_ratio + i, 52 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["l_leg"]["front"].append(Polygon([
-                                volume_points[i][j][4 * hd_ratio],
-                                volume_points[i + 1][j][4 * hd_ratio],
-                                volume_points[i + 1][j + 1][4 * hd_ratio],
-                                volume_points[i][j + 1][4 * hd_ratio]],
-                                color))
+                for i, j, color in self.opaque_texels(
+                        "l_leg", "front", skin,
+                        lambda i, j: (20 * hd_ratio + i, 52 * hd_ratio + j),
+                        range(0, 4 * hd_ratio), range(0, 12 * hd_ratio)):
+                    self.polygons["l_leg"]["front"].append(Polygon([
+                        volume_points[i][j][4 * hd_ratio],
+                        volume_points[i + 1][j][4 * hd_ratio],
+                        volume_points[i + 1][j + 1][4 * hd_ratio],
+                        volume_points[i][j + 1][4 * hd_ratio]],
+                        color))
 
             if "right" in self.visible_faces["l_leg"]["front"]:
-                for j in range(0, 12 * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel((16 * hd_ratio + k, 52 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["l_leg"]["right"].append(Polygon([
-                                volume_points[0][j][k],
-                                volume_points[0][j][k + 1],
-                                volume_points[0][j + 1][k + 1],
-                                volume_points[0][j + 1][k]],
-                                color))
+                for j, k, color in self.opaque_texels(
+                        "l_leg", "right", skin,
+                        lambda j, k: (16 * hd_ratio + k, 52 * hd_ratio + j),
+                        range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["l_leg"]["right"].append(Polygon([
+                        volume_points[0][j][k],
+                        volume_points[0][j][k + 1],
+                        volume_points[0][j + 1][k + 1],
+                        volume_points[0][j + 1][k]],
+                        color))
 
             if "left" in self.visible_faces["l_leg"]["front"]:
-                for j in range(0, 12 * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel((28 * hd_ratio - 1 - k, 52 * hd_ratio + j))
-                        if color[3] != 0:
-                            self.polygons["l_leg"]["left"].append(Polygon([
-                                volume_points[4 * hd_ratio][j][k],
-                                volume_points[4 * hd_ratio][j][k + 1],
-                                volume_points[4 * hd_ratio][j + 1][k + 1],
-                                volume_points[4 * hd_ratio][j + 1][k]],
-                                color))
+                for j, k, color in self.opaque_texels(
+                        "l_leg", "left", skin,
+                        lambda j, k: (28 * hd_ratio - 1 - k, 52 * hd_ratio + j),
+                        range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["l_leg"]["left"].append(Polygon([
+                        volume_points[4 * hd_ratio][j][k],
+                        volume_points[4 * hd_ratio][j][k + 1],
+                        volume_points[4 * hd_ratio][j + 1][k + 1],
+                        volume_points[4 * hd_ratio][j + 1][k]],
+                        color))
 
             if "top" in self.visible_faces["l_leg"]["front"]:
-                for i in range(0, 4 * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel((20 * hd_ratio + i, 48 * hd_ratio + k))
-                        if color[3] != 0:
-                            self.polygons["l_leg"]["top"].append(Polygon([
-                                volume_points[i][0][k],
-                                volume_points[i + 1][0][k],
-                                volume_points[i + 1][0][k + 1],
-                                volume_points[i][0][k + 1]],
-                                color))
+                for i, k, color in self.opaque_texels(
+                        "l_leg", "top", skin,
+                        lambda i, k: (20 * hd_ratio + i, 48 * hd_ratio + k),
+                        range(0, 4 * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["l_leg"]["top"].append(Polygon([
+                        volume_points[i][0][k],
+                        volume_points[i + 1][0][k],
+                        volume_points[i + 1][0][k + 1],
+                        volume_points[i][0][k + 1]],
+                        color))
 
             if "bottom" in self.visible_faces["l_leg"]["front"]:
-                for i in range(0, 4 * hd_ratio):
-                    for k in range(0, 4 * hd_ratio):
-                        color = skin.getpixel((24 * hd_ratio + i, 48 * hd_ratio + k))
-                        if color[3] != 0:
-                            self.polygons["l_leg"]["bottom"].append(Polygon([
-                                volume_points[i][12 * hd_ratio][k],
-                                volume_points[i + 1][12 * hd_ratio][k],
-                                volume_points[i + 1][12 * hd_ratio][k + 1],
-                                volume_points[i][12 * hd_ratio][k + 1]],
-                                color))
+                for i, k, color in self.opaque_texels(
+                        "l_leg", "bottom", skin,
+                        lambda i, k: (24 * hd_ratio + i, 48 * hd_ratio + k),
+                        range(0, 4 * hd_ratio), range(0, 4 * hd_ratio)):
+                    self.polygons["l_leg"]["bottom"].append(Polygon([
+                        volume_points[i][12 * hd_ratio][k],
+                        volume_points[i + 1][12 * hd_ratio][k],
+                        volume_points[i + 1][12 * hd_ratio][k + 1],
+                        volume_points[i][12 * hd_ratio][k + 1]],
+                        color))
 
             """Left leg 2nd layer"""
             if self.layers:
-                volume_points = {}
-                for i in range(0, 5 * hd_ratio):
-                    for j in range(0, 13 * hd_ratio):
-                        volume_points = append_dict(volume_points, i, j, 0,
-                                                    Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 4 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
-                                                                          -0.125 * hd_ratio])))
-                        volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
-                                                    Point(self,
-                                                          np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 4 * hd_ratio,
-                                                                    (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
-                                                                    4.125 * hd_ratio])))
+                def build_points():
+                    volume_points = {}
+                    for i in range(0, 5 * hd_ratio):
+                        for j in range(0, 13 * hd_ratio):
+                            volume_points = append_dict(volume_points, i, j, 0,
+                                                        Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 4 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
+                                                                              -0.125 * hd_ratio])))
+                            volume_points = append_dict(volume_points, i, j, 4 * hd_ratio,
+                                                        Point(self,
+                                                              np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 4 * hd_ratio,
+                                                                        (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
+                                                                        4.125 * hd_ratio])))
 
-                for j in range(0, 13 * hd_ratio):
-                    for k in range(0, 5 * hd_ratio):
-                        volume_points = append_dict(volume_points, 0, j, k,
-                                                    Point(self, np.array([3.875 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
-                        volume_points = append_dict(volume_points, 4 * hd_ratio, j, k,
-                                                    Point(self, np.array([8.125 * hd_ratio,
-                                                                          (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
-
-                for i in range(0, 5 * hd_ratio):
-                    for k in range(0, 5 * hd_ratio):
-                        volume_points = append_dict(volume_points, i, 0, k,
-                                                    Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 4 * hd_ratio,
-                                                                          19.875 * hd_ratio,
-                                                                          k * 4.25 / 4 - 0.125 * hd_ratio])))
-                        volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
-                                                    Point(self,
-                                                          np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 4 * hd_ratio,
-                                                                    32.125 * hd_ratio,
-                                                                    k * 4.25 / 4 - 0.125 * hd_ratio])))
+                    for j in range(0, 13 * hd_ratio):
+                        for k in range(0, 5 * hd_ratio):
+                            volume_points = append_dict(volume_points, 0, j, k,
+                                                        Point(self, np.array([3.875 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+                            volume_points = append_dict(volume_points, 4 * hd_ratio, j, k,
+                                                        Point(self, np.array([8.125 * hd_ratio,
+                                                                              (j * 12.25 / 12 - 0.125 * hd_ratio) + 20 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+
+                    for i in range(0, 5 * hd_ratio):
+                        for k in range(0, 5 * hd_ratio):
+                            volume_points = append_dict(volume_points, i, 0, k,
+                                                        Point(self, np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 4 * hd_ratio,
+                                                                              19.875 * hd_ratio,
+                                                                              k * 4.25 / 4 - 0.125 * hd_ratio])))
+                            volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
+                                                        Point(self,
+                                                              np.array([(i * 4.25 / 4 - 0.125 * hd_ratio) + 4 * hd_ratio,
+                                                                        32.125 * hd_ratio,
+                                                                        k * 4.25 / 4 - 0.125 * hd_ratio])))
+                    return volume_points
+
+                volume_points = LazyVolumePoints(build_points)
 
                 if "back" in self.visible_faces["l_leg_layer"]["front"]:
-                    for i in range(0, 4 * hd_ratio):
-                        for j in range(0, 12 * hd_ratio):
-                            color1 = skin.getpixel((16 * hd_ratio - 1 - i, 52 * hd_ratio + j))
-                            if color1[3] != 0:
-                                self.polygons["l_leg_layer"]["back"].append(Polygon([
-                                    volume_points[i][j][0],
-                                    volume_points[i + 1][j][0],
-                                    volume_points[i + 1][j + 1][0],
-                                    volume_points[i][j + 1][0]],
-                                    color1))
+                    for i, j, color1 in self.opaque_texels(
+                            "l_leg_layer", "back", skin,
+                            lambda i, j: (16 * hd_ratio - 1 - i, 52 * hd_ratio + j),
+                            range(0, 4 * hd_ratio), range(0, 12 * hd_ratio)):
+                        self.polygons["l_leg_layer"]["back"].append(Polygon([
+                            volume_points[i][j][0],
+                            volume_points[i + 1][j][0],
+                            volume_points[i + 1][j + 1][0],
+                            volume_points[i][j + 1][0]],
+                            color1))
 
                 if "front" in self.visible_faces["l_leg_layer"]["front"]:
-                    for i in range(0, 4 * hd_ratio):
-                        for j in range(0, 12 * hd_ratio):
-                            color2 = skin.getpixel((4 * hd_ratio + i, 52 * hd_ratio + j))
-                            if color2[3] != 0:
-                                self.polygons["l_leg_layer"]["front"].append(Polygon([
-                                    volume_points[i][j][4 * hd_ratio],
-                                    volume_points[i + 1][j][4 * hd_ratio],
-                                    volume_points[i + 1][j + 1][4 * hd_ratio],
-                                    volume_points[i][j + 1][4 * hd_ratio]],
-                                    color2))
+                    for i, j, color2 in self.opaque_texels(
+                            "l_leg_layer", "front", skin,
+                            lambda i, j: (4 * hd_ratio + i, 52 * hd_ratio + j),
+                            range(0, 4 * hd_ratio), range(0, 12 * hd_ratio)):
+                        self.polygons["l_leg_layer"]["front"].append(Polygon([
+                            volume_points[i][j][4 * hd_ratio],
+                            volume_points[i + 1][j][4 * hd_ratio],
+                            volume_points[i + 1][j + 1][4 * hd_ratio],
+                            volume_points[i][j + 1][4 * hd_ratio]],
+                            color2))
 
                 if "right" in self.visible_faces["l_leg_layer"]["front"]:
-                    for j in range(0, 12 * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color1 = skin.getpixel((k, 52 * hd_ratio + j))
-                            if color1[3] != 0:
-                                self.polygons["l_leg_layer"]["right"].append(Polygon([
-                                    volume_points[0][j][k],
-                                    volume_points[0][j][k + 1],
-                                    volume_points[0][j + 1][k + 1],
-                                    volume_points[0][j + 1][k]],
-                                    color1))
+                    for j, k, color1 in self.opaque_texels(
+                            "l_leg_layer", "right", skin,
+                            lambda j, k: (k, 52 * hd_ratio + j),
+                            range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["l_leg_layer"]["right"].append(Polygon([
+                            volume_points[0][j][k],
+                            volume_points[0][j][k + 1],
+                            volume_points[0][j + 1][k + 1],
+                            volume_points[0][j + 1][k]],
+                            color1))
 
                 if "left" in self.visible_faces["l_leg_layer"]["front"]:
-                    for j in range(0, 12 * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color2 = skin.getpixel((12 * hd_ratio - 1 - k, 52 * hd_ratio + j))
-                            if color2[3] != 0:
-                                self.polygons["l_leg_layer"]["left"].append(Polygon([
-                                    volume_points[4 * hd_ratio][j][k],
-                                    volume_points[4 * hd_ratio][j][k + 1],
-                                    volume_points[4 * hd_ratio][j + 1][k + 1],
-                                    volume_points[4 * hd_ratio][j + 1][k]],
-                                    color2))
+                    for j, k, color2 in self.opaque_texels(
+                            "l_leg_layer", "left", skin,
+                            lambda j, k: (12 * hd_ratio - 1 - k, 52 * hd_ratio + j),
+                            range(0, 12 * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["l_leg_layer"]["left"].append(Polygon([
+                            volume_points[4 * hd_ratio][j][k],
+                            volume_points[4 * hd_ratio][j][k + 1],
+                            volume_points[4 * hd_ratio][j + 1][k + 1],
+                            volume_points[4 * hd_ratio][j + 1][k]],
+                            color2))
 
                 if "top" in self.visible_faces["l_leg_layer"]["front"]:
-                    for i in range(0, 4 * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color1 = skin.getpixel((4 * hd_ratio + i, 48 * hd_ratio + k))
-                            if color1[3] != 0:
-                                self.polygons["l_leg_layer"]["top"].append(Polygon([
-                                    volume_points[i][0][k],
-                                    volume_points[i + 1][0][k],
-                                    volume_points[i + 1][0][k + 1],
-                                    volume_points[i][0][k + 1]],
-                                    color1))
+                    for i, k, color1 in self.opaque_texels(
+                            "l_leg_layer", "top", skin,
+                            lambda i, k: (4 * hd_ratio + i, 48 * hd_ratio + k),
+                            range(0, 4 * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["l_leg_layer"]["top"].append(Polygon([
+                            volume_points[i][0][k],
+                            volume_points[i + 1][0][k],
+                            volume_points[i + 1][0][k + 1],
+                            volume_points[i][0][k + 1]],
+                            color1))
 
                 if "bottom" in self.visible_faces["l_leg_layer"]["front"]:
-                    for i in range(0, 4 * hd_ratio):
-                        for k in range(0, 4 * hd_ratio):
-                            color2 = skin.getpixel((8 * hd_ratio + i, 48 * hd_ratio + k))
-                            if color2[3] != 0:
-                                self.polygons["l_leg_layer"]["bottom"].append(Polygon([
-                                    volume_points[i][12 * hd_ratio][k],
-                                    volume_points[i + 1][12 * hd_ratio][k],
-                                    volume_points[i + 1][12 * hd_ratio][k + 1],
-                                    volume_points[i][12 * hd_ratio][k + 1]],
-                                    color2))
+                    for i, k, color2 in self.opaque_texels(
+                            "l_leg_layer", "bottom", skin,
+                            lambda i, k: (8 * hd_ratio + i, 48 * hd_ratio + k),
+                            range(0, 4 * hd_ratio), range(0, 4 * hd_ratio)):
+                        self.polygons["l_leg_layer"]["bottom"].append(Polygon([
+                            volume_points[i][12 * hd_ratio][k],
+                            volume_points[i + 1][12 * hd_ratio][k],
+                            volume_points[i + 1][12 * hd_ratio][k + 1],
+                            volume_points[i][12 * hd_ratio][k + 1]],
+                            color2))
+
+    def generate_cape_polygons(self, hd_ratio, cape, frame=0):
+        """Generates the polygons of one frame of the cape into ``self.polygons["cape"]``"""
+        self.polygons["cape"] = {"front": [], "back": [], "top": [], "bottom": [], "right": [], "left": []}
+
+        im_cape = cape.frames[frame]
+        cs = cape.scale
+
+        def ct(v):  # skin resolution -> cape resolution
+            return v * cs // hd_ratio
+
+        def build_points():
+            volume_points = {}
+            for i in range(0, 11 * hd_ratio):
+                for j in range(0, 17 * hd_ratio):
+                    volume_points = append_dict(volume_points, i, j, 0,
+                                                Point(self, np.array([i - 1, j + 8 * hd_ratio, -1])))
+                    volume_points = append_dict(volume_points, i, j, 1 * hd_ratio,
+                                                Point(self, np.array([i - 1, j + 8 * hd_ratio, 0])))
+
+            for j in range(0, 17 * hd_ratio):
+                for k in range(0, 2 * hd_ratio):
+                    volume_points = append_dict(volume_points, 0, j, k,
+                                                Point(self, np.array([0, j + 8 * hd_ratio, k])))
+                    volume_points = append_dict(volume_points, 8 * hd_ratio, j, k,
+                                                Point(self, np.array([8 * hd_ratio, j + 8 * hd_ratio, k])))
+
+            for i in range(0, 11 * hd_ratio):
+                for k in range(0, 2 * hd_ratio):
+                    volume_points = append_dict(volume_points, i, 0, k,
+                                                Point(self, np.array([i, 8 * hd_ratio, k])))
+                    volume_points = append_dict(volume_points, i, 12 * hd_ratio, k,
+                                                Point(self, np.array([i, 20 * hd_ratio, k])))
+            return volume_points
+
+        volume_points = LazyVolumePoints(build_points)
+
+        if "back" in self.visible_faces["cape"]["front"]:
+            for i, j, color in self.opaque_texels(
+                    "cape", "back", im_cape,
+                    lambda i, j: ((11 * cs - 1) - ct(i), 1 * cs + ct(j)),
+                    range(0, 10 * hd_ratio), range(0, 16 * hd_ratio), frame=frame):
+                self.polygons["cape"]["back"].append(Polygon([
+                    volume_points[i][j][0],
+                    volume_points[i + 1][j][0],
+                    volume_points[i + 1][j + 1][0],
+                    volume_points[i][j + 1][0]],
+                    color))
+
+        if "front" in self.visible_faces["cape"]["front"]:
+            for i, j, color in self.opaque_texels(
+                    "cape", "front", im_cape,
+                    lambda i, j: (12 * cs + ct(i), 1 * cs + ct(j)),
+                    range(0, 10 * hd_ratio), range(0, 16 * hd_ratio), frame=frame):
+                self.polygons["cape"]["front"].append(Polygon([
+                    volume_points[i][j][1 * hd_ratio],
+                    volume_points[i + 1][j][1 * hd_ratio],
+                    volume_points[i + 1][j + 1][1 * hd_ratio],
+                    volume_points[i][j + 1][1 * hd_ratio]],
+                    color))
+
+        if "right" in self.visible_faces["cape"]["front"]:
+            for j, color in self.opaque_texels(
+                    "cape", "right", im_cape,
+                    lambda j: (12 * cs, 1 * cs + ct(j)),
+                    range(0, 16 * hd_ratio), frame=frame):
+                self.polygons["cape"]["right"].append(Polygon([
+                    volume_points[0][j][0],
+                    volume_points[0][j][1],
+                    volume_points[0][j + 1][1],
+                    volume_points[0][j + 1][0]],
+                    color))
+
+        if "left" in self.visible_faces["cape"]["front"]:
+            for j, color in self.opaque_texels(
+                    "cape", "left", im_cape,
+                    lambda j: (1 * cs, 1 * cs + ct(j)),
+                    range(0, 16 * hd_ratio), frame=frame):
+                self.polygons["cape"]["left"].append(Polygon([
+                    volume_points[10 * hd_ratio][j][0],
+                    volume_points[10 * hd_ratio][j][1],
+                    volume_points[10 * hd_ratio][j + 1][1],
+                    volume_points[10 * hd_ratio][j + 1][0]],
+                    color))
+
+        if "top" in self.visible_faces["cape"]["front"]:
+            for i, color in self.opaque_texels(
+                    "cape", "top", im_cape,
+                    lambda i: (1 * cs + ct(i), 0),
+                    range(0, 10 * hd_ratio), frame=frame):
+                self.polygons["cape"]["top"].append(Polygon([
+                    volume_points[i][0][0],
+                    volume_points[i + 1][0][0],
+                    volume_points[i + 1][0][1],
+                    volume_points[i][0][1]],
+                    color))
+
+        if "bottom" in self.visible_faces["cape"]["front"]:
+            for i, color in self.opaque_texels(
+                    "cape", "bottom", im_cape,
+                    lambda i: (11 * cs + ct(i), 0),
+                    range(0, 10 * hd_ratio), frame=frame):
+                self.polygons["cape"]["bottom"].append(Polygon([
+                    volume_points[i][16 * hd_ratio][0],
+                    volume_points[i + 1][16 * hd_ratio][0],
+                    volume_points[i + 1][16 * hd_ratio][1],
+                    volume_points[i][16 * hd_ratio][1]],
+                    color))
 
     def member_rotation(self, hd_ratio):
         for face in self.polygons["head"]:
@@ -1637,12 +1819,7 @@ class Render:
                     )
 
         if not self.head_only:
-            for face in self.polygons["cape"]:
-                for poly in self.polygons["cape"][face]:
-                    poly.project(
-                        np.array([4 * hd_ratio, 8 * hd_ratio, 0]),
-                        self.body_angles["cape"]
-                    )
+            self.cape_rotation(hd_ratio)
 
             for face in self.polygons["r_arm"]:
                 for poly in self.polygons["r_arm"][face]:
@@ -1708,10 +1885,20 @@ class Render:
                             self.body_angles[body_part]
                         )
 
-    def display_image(self):
+    def cape_rotation(self, hd_ratio):
+        for face in self.polygons["cape"]:
+            for poly in self.polygons["cape"][face]:
+                poly.project(
+                    np.array([4 * hd_ratio, 8 * hd_ratio, 0]),
+                    self.body_angles["cape"]
+                )
+
+    def display_image(self, display_order=None):
         width = self.max_x - self.min_x
         height = self.max_y - self.min_y
         ratio = self.ratio
+        if self.size is not None:  # smallest ratio which still covers the requested size
+            ratio = ceil((self.size - 1) / max(width, height))
         if ratio < 2:
             ratio = 2
 
@@ -1725,7 +1912,8 @@ class Render:
 
         image = Image.new('RGBA', (int(src_width), int(src_height)))
 
-        display_order = self.get_display_order()
+        if display_order is None:
+            display_order = self.get_display_order()
         draw = ImageDraw.Draw(image)
         for pieces in display_order:
             for piece, faces in pieces.items():
@@ -0,0 +1,259 @@
+import mmap
+import os
+
+import numpy as np
+from PIL import Image
+from typing import Optional, Dict
+
+from .skin import Skin
+from .utils import uuid_to_undashed
+
+
+__all__ = [
+    "SkinStore",
+]
+
+
+SLOT_SIZE = 64 * 64 * 4
+
+# one record per slot, the slot number is the position in the index file
+_RECORD = np.dtype([
+    ("uuid", "S32"),
+    ("flags", "u1"),
+    ("skin_w", "<u2"),
+    ("skin_h", "<u2"),
+    ("cape_w", "<u2"),
+    ("cape_h", "<u2"),
+    ("skin_offset", "<u8"),
+    ("cape_offset", "<u8"),
+])
+_FLAG_CAPE = 1
+_FLAG_HD = 2
+
+
+class SkinStore:
+    """On-disk skin store for large amounts of players
+
+    Skins are stored as raw RGBA pixels in fixed-size 64x64 slots, HD skins and capes
+    go to an append-only overflow file. All files are memory-mapped, so reading a
+    :class:`Skin` or a pixel array neither copies nor decodes anything.
+
+    Tip
+    ----
+    :py:attr:`skin_arrays` exposes all slots as one array which is handy for batch jobs.
+
+    Note
+    ----
+    Overwriting a player with an HD skin or a cape leaves the old overflow data behind.
+
+    Parameters
+    ----------
+    path: str
+        Directory of the store. Created if it does not exist
+    readonly: bool
+        Open the store without write access
+    """
+
+    def __init__(self, path: str, readonly: bool = False):
+        self._path = path
+        self._readonly = readonly
+        if not readonly:
+            os.makedirs(path, exist_ok=True)
+
+        self._files = {}
+        for name in ("index", "skins", "overflow"):
+            file_path = os.path.join(path, f"{name}.bin")
+            if not readonly and not os.path.exists(file_path):
+                open(file_path, "wb").close()
+            self._files[name] = open(file_path, "rb" if readonly else "r+b")
+        self._maps: Dict[str, Optional[mmap.mmap]] = {name: None for name in self._files}
+
+        records = self._records()
+        self._index: Dict[bytes, int] = dict(zip(records["uuid"].tolist(), range(len(records))))
+
+    def __repr__(self):
+        return f"<SkinStore (path={self._path}) (players={len(self)})>"
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, uuid: str):
+        return self._key(uuid) in self._index
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def _key(uuid: str) -> bytes:
+        key = uuid_to_undashed(uuid).lower()
+        if len(key) != 32:
+            raise ValueError("UUID seems to be invalid.")
+        return key.encode()
+
+    def _map(self, name: str, size: int) -> mmap.mmap:
+        """Returns a read only map of the given file covering at least ``size`` bytes"""
+        current = self._maps[name]
+        if current is None or len(current) < size:
+            f = self._files[name]
+            f.flush()
+            if current is not None:
+                try:
+                    current.close()
+                except BufferError:
+                    pass  # still exported to images or arrays, it's closed once they are gone
+            self._maps[name] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._maps[name]
+
+    def _records(self) -> np.ndarray:
+        size = os.fstat(self._files["index"].fileno()).st_size
+        count = size // _RECORD.itemsize
+        if not count:
+            return np.zeros(0, dtype=_RECORD)
+        return np.frombuffer(self._map("index", size), dtype=_RECORD, count=count)
+
+    def _write(self, name: str, offset: int, data: bytes):
+        f = self._files[name]
+        f.seek(offset)
+        f.write(data)
+
+    def _append(self, name: str, data: bytes) -> int:
+        f = self._files[name]
+        f.seek(0, os.SEEK_END)
+        offset = f.tell()
+        f.write(data)
+        return offset
+
+    def _view(self, name: str, offset: int, length: int) -> memoryview:
+        return memoryview(self._map(name, offset + length))[offset:offset + length]
+
+    def put(self, uuid: str, skin: Skin):
+        """Store a players skin and cape
+
+        An already stored skin of the same player is overwritten
+
+        Parameters
+        ----------
+        uuid: str
+            The players UUID
+        skin: Skin
+            The skin to store
+        """
+        if self._readonly:
+            raise PermissionError("The store has been opened read only")
+
+        key = self._key(uuid)
+        slot = self._index.get(key, len(self._index))
+
+        record = np.zeros(1, dtype=_RECORD)
+        record["uuid"] = key
+
+        raw_skin = skin.raw_skin
+        record["skin_w"], record["skin_h"] = raw_skin.size
+        if raw_skin.size == (64, 64):
+            self._write("skins", slot * SLOT_SIZE, raw_skin.tobytes())
+        else:
+            record["flags"] |= _FLAG_HD
+            self._write("skins", slot * SLOT_SIZE, bytes(SLOT_SIZE))  # keeps the slots contiguous
+            record["skin_offset"] = self._append("overflow", raw_skin.tobytes())
+
+        if skin.has_cape:
+            record["flags"] |= _FLAG_CAPE
+            record["cape_w"], record["cape_h"] = skin.raw_cape.size
+            record["cape_offset"] = self._append("overflow", skin.raw_cape.tobytes())
+
+        self._write("index", slot * _RECORD.itemsize, record.tobytes())
+        for f in self._files.values():
+            f.flush()
+        self._index[key] = slot
+
+    def _record(self, uuid: str) -> Optional[np.void]:
+        slot = self._index.get(self._key(uuid))
+        if slot is None:
+            return None
+        offset = slot * _RECORD.itemsize
+        return np.frombuffer(self._view("index", offset, _RECORD.itemsize), dtype=_RECORD)[0]
+
+    def _skin_view(self, uuid: str, record: np.void) -> memoryview:
+        w, h = int(record["skin_w"]), int(record["skin_h"])
+        if record["flags"] & _FLAG_HD:
+            return self._view("overflow", int(record["skin_offset"]), w * h * 4)
+        return self._view("skins", self._index[self._key(uuid)] * SLOT_SIZE, SLOT_SIZE)
+
+    def array(self, uuid: str) -> Optional[np.ndarray]:
+        """Get a players raw skin pixels without copying them
+
+        Parameters
+        ----------
+        uuid: str
+            The players UUID
+
+        Returns
+        -------
+        Optional[numpy.ndarray]
+            Read only array of shape (height, width, 4). None if the player is not in the store
+        """
+        record = self._record(uuid)
+        if record is None:
+            return None
+        return np.frombuffer(self._skin_view(uuid, record), dtype=np.uint8).reshape(
+            int(record["skin_h"]), int(record["skin_w"]), 4
+        )
+
+    def get(self, uuid: str) -> Optional[Skin]:
+        """Get a players :class:`Skin`
+
+        The images are backed by the memory-mapped files, no decoding or copying is involved
+
+        Parameters
+        ----------
+        uuid: str
+            The players UUID
+
+        Returns
+        -------
+        Optional[Skin]
+            None if the player is not in the store
+        """
+        record = self._record(uuid)
+        if record is None:
+            return None
+
+        size = (int(record["skin_w"]), int(record["skin_h"]))
+        raw_skin = Image.frombuffer("RGBA", size, self._skin_view(uuid, record), "raw", "RGBA", 0, 1)
+
+        raw_cape = None
+        if record["flags"] & _FLAG_CAPE:
+            size = (int(record["cape_w"]), int(record["cape_h"]))
+            view = self._view("overflow", int(record["cape_offset"]), size[0] * size[1] * 4)
+            raw_cape = Image.frombuffer("RGBA", size, view, "raw", "RGBA", 0, 1)
+
+        return Skin(raw_skin=raw_skin, raw_cape=raw_cape)
+
+    @property
+    def skin_arrays(self) -> np.ndarray:
+        """All 64x64 slots as one read only array of shape (players, 64, 64, 4)
+
+        Slots of HD skins are empty, use :py:func:`array` for those"""
+        size = len(self._index) * SLOT_SIZE
+        if not size:
+            return np.zeros((0, 64, 64, 4), dtype=np.uint8)
+        return np.frombuffer(self._map("skins", size), dtype=np.uint8, count=size).reshape(-1, 64, 64, 4)
+
+    def slot(self, uuid: str) -> Optional[int]:
+        """Position of the players skin in :py:attr:`skin_arrays`. None if the player is not in the store"""
+        return self._index.get(self._key(uuid))
+
+    def close(self):
+        """Closes all files of the store"""
+        for name, m in self._maps.items():
+            if m is not None:
+                try:
+                    m.close()
+                except BufferError:
+                    pass
+            self._maps[name] = None
+        for f in self._files.values():
+            f.close()
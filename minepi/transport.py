@@ -0,0 +1,147 @@
+import asyncio
+from abc import ABC, abstractmethod
+
+import aiohttp
+from typing import Optional
+
+
+__all__ = [
+    "Transport",
+    "AiohttpTransport",
+]
+
+
+class Transport(ABC):
+    """Base class of the HTTP layer used by :py:class:`minepi.MinePIClient`
+
+    Subclass it to route requests somewhere else, e.g. to record or replay them.
+    Responses have to provide the interface of :py:class:`aiohttp.ClientResponse`
+    used by this library: ``status``, ``headers``, ``read()``, ``json()`` and ``release()``.
+    """
+
+    @property
+    def closed(self) -> bool:
+        """Whether the transport has been closed"""
+        return False
+
+    @abstractmethod
+    async def request(self, method: str, url: str, **kwargs):
+        """Send a request and return the response
+
+        Parameters
+        ----------
+        method: str
+            The HTTP method
+        url: str
+            The url to request
+        kwargs
+            Additional arguments like ``json`` or ``headers``
+        """
+
+    async def close(self):
+        """Release all resources of the transport"""
+        pass
+
+
+class AiohttpTransport(Transport):
+    """Transport sending requests through a pooled :py:class:`aiohttp.ClientSession`
+
+    Parameters
+    ----------
+    session: aiohttp.ClientSession
+        Use an existing session instead of creating one. It is not closed by this transport
+    limit: int
+        Maximum number of simultaneous connections
+    limit_per_host: int
+        Maximum number of simultaneous connections to a single host
+    dns_cache_ttl: int
+        Seconds DNS lookups are cached for
+    keepalive_timeout: float
+        Seconds idle connections are kept open
+    timeout: float
+        Total timeout of a single request in seconds
+    """
+
+    def __init__(
+            self,
+            session: aiohttp.ClientSession = None,
+            limit: int = 100,
+            limit_per_host: int = 20,
+            dns_cache_ttl: int = 300,
+            keepalive_timeout: float = 30,
+            timeout: float = 30,
+    ):
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session: bool = session is None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closed: bool = False
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+
+    def __repr__(self):
+        return f"<AiohttpTransport (limit={self.limit}) (limit_per_host={self.limit_per_host}) (closed={self.closed})>"
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The underlying session. Created on first use
+
+        Raises
+        ------
+        RuntimeError
+            The transport or its session has been closed
+        """
+        if self.closed:
+            raise RuntimeError("Transport has been closed")
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                    keepalive_timeout=self.keepalive_timeout,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._loop = asyncio.get_event_loop()
+        return self._session
+
+    @property
+    def closed(self) -> bool:
+        """Whether the transport or its session has been closed"""
+        return self._closed or (self._session is not None and self._session.closed)
+
+    async def _check_loop(self):
+        """Replaces an owned session bound to another event loop, e.g. after a second asyncio.run()"""
+        if not self._owns_session or self._session is None or self._closed:
+            return
+        if self._loop is asyncio.get_running_loop():
+            return
+
+        old, self._session, self._loop = self._session, None, None
+        try:
+            await old.close()
+        except RuntimeError:
+            pass  # the old loop is gone, its connections can't be closed gracefully anymore
+
+    async def request(self, method: str, url: str, **kwargs) -> aiohttp.ClientResponse:
+        """Send a request through the pooled session
+
+        Raises
+        ------
+        RuntimeError
+            The transport has been closed
+        """
+        await self._check_loop()
+        return await self.session.request(method, url, **kwargs)
+
+    async def close(self):
+        """Closes the session (only if it has been created by this transport)
+
+        The transport can't be used anymore afterwards."""
+        self._closed = True
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
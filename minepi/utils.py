@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import typing
 import aiohttp
@@ -5,19 +6,30 @@ import json
 
 from PIL import Image
 from io import BytesIO
-from typing import Optional
+from typing import Optional, Iterable, AsyncIterator
 
-from .skin import Skin
+from .client import MinePIClient, resolve_client
+from .skin import Skin, texture_hash, register_texture_host
+from .cache import skin_interner, name_cache, profile_cache, cape_cache
+from .defaults import default_texture
+from .errors import InvalidPlayer
+from .singleflight import single_flight
 
 if typing.TYPE_CHECKING:
     from .player import Player
 
 
+_PROFILES_BATCH_SIZE = 10  # maximum amount of names per request to the profiles endpoint
+
+
 __all__ = [
     "uuid_to_dashed",
     "uuid_to_undashed",
+    "texture_hash",
+    "register_texture_host",
     "name_to_uuid",
     "uuid_to_name",
+    "fetch_profile",
     "fetch_skin",
     "fetch_optifine_cape",
     "fetch_labymod_cape",
@@ -25,6 +37,7 @@ __all__ = [
     "fetch_minecraftcapes_cape",
     "fetch_tlauncher_cape",
     "get_players_by_name",
+    "load_players",
 ]
 
 
@@ -60,7 +73,75 @@ def uuid_to_undashed(uuid: str) -> str:
     return uuid.replace("-", "")
 
 
-async def name_to_uuid(name: str, session: aiohttp.ClientSession = None) -> Optional[str]:
+def _decode(data: bytes) -> Image.Image:
+    image = Image.open(BytesIO(data))
+    image.load()  # Image.open is lazy, the actual decoding happens here
+    return image
+
+
+async def _decode_image(data: bytes) -> Image.Image:
+    """Decodes a downloaded image in the executor instead of blocking the event loop"""
+    return await asyncio.get_event_loop().run_in_executor(None, _decode, data)
+
+
+async def _none():
+    return None
+
+
+async def _fetch_texture(url: str, client: MinePIClient) -> Optional[Image.Image]:
+    """Get a texture from the registered defaults, the interner, the disk cache or by downloading it"""
+    image = default_texture(url) or skin_interner.get_image(url)
+    if image is not None:
+        return image
+    return await single_flight.do(("texture", texture_hash(url) or url), _download_texture, url, client)
+
+
+async def _download_texture(url: str, client: MinePIClient) -> Optional[Image.Image]:
+    data = await client.texture_cache.get(url) if client.texture_cache is not None else None
+    if data is None:
+        async with client.get(url) as resp:
+            if resp.status != 200:
+                return None
+            data = await resp.read()
+        if client.texture_cache is not None:
+            await client.texture_cache.put(url, data)
+
+    return skin_interner.intern_image(url, await _decode_image(data))
+
+
+def _mojang_scope(client: MinePIClient) -> str:
+    return client.cache_scope("api", "sessionserver")
+
+
+async def _fetch_provider_cape(provider: str, identity: str, url: str, client: MinePIClient) -> Optional[Image.Image]:
+    """Get a third party cape, revalidating cached ones and remembering players without one"""
+    scope = client.cache_scope(provider)
+    cached = cape_cache.get(provider, identity, scope)
+    if cached is None:
+        return None
+
+    headers = cape_cache.validators(provider, identity, scope)
+    async with client.get(url, headers=headers) as resp:
+        if resp.status == 304 and cached is not cape_cache.MISSING:
+            cape = cached  # unchanged, no need to download or decode it again
+            # a 304 may omit the validators, the ones sent still describe the cached cape
+            etag = resp.headers.get("ETag") or headers.get("If-None-Match")
+            last_modified = resp.headers.get("Last-Modified") or headers.get("If-Modified-Since")
+        elif resp.status == 200:
+            cape = await _decode_image(await resp.read())
+            # old validators must not be stored with new content
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+        else:
+            if resp.status in (204, 404):
+                cape_cache.put_missing(provider, identity, scope)
+            return None
+
+    cape_cache.put(provider, identity, cape, etag, last_modified, scope)
+    return cape
+
+
+async def name_to_uuid(name: str, session: aiohttp.ClientSession = None, client: MinePIClient = None) -> Optional[str]:
     """Convert a minecraft name to a UUID
 
     Parameters
@@ -69,32 +150,40 @@ async def name_to_uuid(name: str, session: aiohttp.ClientSession = None) -> Opti
         The minecraft name to get the UUID for
     session: aiohttp.ClientSession
         The ClientSession to use for requests
-        Defaults to a new session which is closed again after handling all requests
+    client: MinePIClient
+        The client to use for requests
+        Defaults to a shared client with pooled connections
 
     Returns
     -------
     Optional[str]
         None if the given name is invalid
     """
-    if session is None:
-        session = aiohttp.ClientSession()
-        close = True
-    else:
-        close = False
+    client = resolve_client(session, client)
+    scope = _mojang_scope(client)
+    uuid = name_cache.get_uuid(name, scope)
+    if uuid is not name_cache.MISSING:
+        return uuid
 
-    async with session.get(f"https://api.mojang.com/users/profiles/minecraft/{name}") as resp:
+    return await single_flight.do(("name", scope, name.lower()), _request_uuid, name, client)
+
+
+async def _request_uuid(name: str, client: MinePIClient) -> Optional[str]:
+    async with client.get(client.url("api", f"/users/profiles/minecraft/{name}")) as resp:
+        scope = _mojang_scope(client)
         if resp.status == 200:
-            uuid = (await resp.json())["id"]
+            resp_dict = await resp.json()
+            uuid = resp_dict["id"]
+            name_cache.put(resp_dict["name"], uuid, scope)
         else:
             uuid = None
-
-    if close:
-        await session.close()
+            if resp.status in (204, 404):
+                name_cache.put_missing_name(name, scope)
 
     return uuid
 
 
-async def uuid_to_name(uuid: str, session: aiohttp.ClientSession = None) -> Optional[str]:
+async def uuid_to_name(uuid: str, session: aiohttp.ClientSession = None, client: MinePIClient = None) -> Optional[str]:
     """Convert a UUID to a minecraft name
 
     Parameters
@@ -103,38 +192,101 @@ async def uuid_to_name(uuid: str, session: aiohttp.ClientSession = None) -> Opti
         The UUID to get the minecraft name for
     session: aiohttp.ClientSession
         The ClientSession to use for requests
-        Defaults to a new session which is closed again after handling all requests
+    client: MinePIClient
+        The client to use for requests
+        Defaults to a shared client with pooled connections
 
     Returns
     -------
     Optional[str]
         None if the given UUID is invalid
     """
-    if session is None:
-        session = aiohttp.ClientSession()
-        close = True
-    else:
-        close = False
+    client = resolve_client(session, client)
+    name = name_cache.get_name(uuid, _mojang_scope(client))
+    if name is not name_cache.MISSING:
+        return name
+
+    profile = await fetch_profile(uuid, client=client)
+    return profile["name"] if profile is not None else None
+
+
+def _parse_profile(resp_dict: dict) -> dict:
+    skin_url = cape_url = None
+    model = "classic"
+    for p in resp_dict.get("properties", []):
+        if p["name"] == "textures":
+            textures = json.loads(base64.b64decode(p["value"]))["textures"]
+            if "SKIN" in textures:
+                skin_url = textures["SKIN"]["url"]
+                model = textures["SKIN"].get("metadata", {}).get("model", "classic")
+            if "CAPE" in textures:
+                cape_url = textures["CAPE"]["url"]
+            break
+
+    return {
+        "uuid": resp_dict["id"],
+        "name": resp_dict["name"],
+        "skin_url": skin_url,
+        "cape_url": cape_url,
+        "model": model,
+    }
+
+
+async def fetch_profile(uuid: str, session: aiohttp.ClientSession = None, client: MinePIClient = None) -> Optional[dict]:
+    """Fetch a players profile from the session server
+
+    Profiles are cached by :py:data:`minepi.profile_cache`, so fetching the skin of an
+    already initialized player does not request the profile again.
+
+    Parameters
+    ----------
+    uuid: str
+        The UUID to get the profile for
+    session: aiohttp.ClientSession
+        The ClientSession to use for requests
+    client: MinePIClient
+        The client to use for requests
+        Defaults to a shared client with pooled connections
+
+    Returns
+    -------
+    Optional[dict]
+        The players ``uuid``, ``name``, ``skin_url``, ``cape_url`` and skin ``model``.
+        None if the given UUID is invalid
+    """
+    client = resolve_client(session, client)
+    scope = _mojang_scope(client)
+    profile = profile_cache.get(uuid, scope)
+    if profile is not profile_cache.MISSING:
+        return profile
 
-    async with session.get(
-            f"https://sessionserver.mojang.com/session/minecraft/profile/{uuid}"
+    return await single_flight.do(("profile", scope, uuid_to_undashed(uuid).lower()), _request_profile, uuid, client)
+
+
+async def _request_profile(uuid: str, client: MinePIClient) -> Optional[dict]:
+    async with client.get(
+            client.url("sessionserver", f"/session/minecraft/profile/{uuid_to_undashed(uuid)}")
     ) as resp:
+        scope = _mojang_scope(client)
         if resp.status == 200:
-            name = (await resp.json())["name"]
+            profile = _parse_profile(await resp.json())
+            profile_cache.put(profile, scope)
+            name_cache.put(profile["name"], profile["uuid"], scope)
         else:
-            name = None
-
-    if close:
-        await session.close()
+            profile = None
+            if resp.status in (204, 400, 404):
+                profile_cache.put_missing(uuid, scope)
+                name_cache.put_missing_uuid(uuid, scope)
 
-    return name
+    return profile
 
 
 async def fetch_skin(
         player: "Player" = None,
         name: str = None,
         uuid: str = None,
-        session: aiohttp.ClientSession = None
+        session: aiohttp.ClientSession = None,
+        client: MinePIClient = None
 ) -> Optional[Skin]:
     """Fetch a players skin
 
@@ -157,7 +309,9 @@ async def fetch_skin(
         UUID to fetch the skin for
     session: aiohttp.ClientSession
         The ClientSession to use for requests
-        Defaults to a new session which is closed again after handling all requests
+    client: MinePIClient
+        The client to use for requests
+        Defaults to a shared client with pooled connections
 
     Returns
     -------
@@ -172,55 +326,32 @@ async def fetch_skin(
     if player is None and name is None and uuid is None:
         raise ValueError("At least one parameter must be passed")
 
-    if session is None:
-        session = aiohttp.ClientSession()
-        close = True
-    else:
-        close = False
+    client = resolve_client(session, client)
 
     if player and player.uuid is not None:
         uuid = player.uuid
 
     if uuid is None and name is not None:
-        uuid = await name_to_uuid(name, session)
+        uuid = await name_to_uuid(name, client=client)
 
-    if uuid is not None:
-        async with session.get(
-            f"https://sessionserver.mojang.com/session/minecraft/profile/{uuid}"
-        ) as resp:
-            if resp.status == 200:
-                cape = None
-                skin = None
-                resp_dict = await resp.json()
-                for p in resp_dict["properties"]:
-                    if p["name"] == "textures":
-                        textures = json.loads(base64.b64decode(p["value"]))["textures"]
-                        skin_url = textures["SKIN"]["url"]
-                        cape_url = textures["CAPE"]["url"] if "CAPE" in textures.keys() else None
-
-                        if skin_url:
-                            async with session.get(skin_url) as resp_skin:
-                                if resp.status == 200:
-                                    skin = Image.open(BytesIO(await resp_skin.read()))
-
-                        if cape_url:
-                            async with session.get(cape_url) as resp_cape:
-                                if resp.status == 200:
-                                    cape = Image.open(BytesIO(await resp_cape.read()))
-                        break
-
-    if close is True:
-        await session.close()
+    profile = await fetch_profile(uuid, client=client) if uuid is not None else None
+    if profile is None or profile["skin_url"] is None:
+        raise ValueError
 
+    # the images are shared with other players using the same textures, the Skin is not
+    skin, cape = await asyncio.gather(
+        _fetch_texture(profile["skin_url"], client),
+        _fetch_texture(profile["cape_url"], client) if profile["cape_url"] else _none(),
+    )
     if skin is None:
         raise ValueError
 
     return Skin(
         raw_skin=skin,
         raw_cape=cape,
-        raw_skin_url=skin_url,
-        raw_cape_url=cape_url,
-        name=resp_dict["name"]
+        raw_skin_url=profile["skin_url"],
+        raw_cape_url=profile["cape_url"],
+        name=profile["name"]
     )
 
 
@@ -228,7 +359,8 @@ async def fetch_mojang_cape(
         player: "Player" = None,
         name: str = None,
         uuid: str = None,
-        session: aiohttp.ClientSession = None
+        session: aiohttp.ClientSession = None,
+        client: MinePIClient = None
 ) -> Optional[Image.Image]:
     """Fetch a players mojang cape
 
@@ -247,7 +379,9 @@ async def fetch_mojang_cape(
         UUID to fetch the mojang cape for
     session: aiohttp.ClientSession
         The ClientSession to use for requests
-        Defaults to a new session which is closed again after handling all requests
+    client: MinePIClient
+        The client to use for requests
+        Defaults to a shared client with pooled connections
 
     Returns
     -------
@@ -259,7 +393,7 @@ async def fetch_mojang_cape(
     ValueError
         No :py:class:`minepi.Player`, name or UUID has been passed
     """
-    s = await fetch_skin(player=player, name=name, uuid=uuid, session=session)
+    s = await fetch_skin(player=player, name=name, uuid=uuid, session=session, client=client)
     return s.raw_cape if s is not None else None
 
 
@@ -267,7 +401,8 @@ async def fetch_optifine_cape(
         player: "Player" = None,
         name: str = None,
         uuid: str = None,
-        session: aiohttp.ClientSession = None
+        session: aiohttp.ClientSession = None,
+        client: MinePIClient = None
 ) -> Optional[Image.Image]:
     """Fetch a players optifine cape
 
@@ -286,7 +421,9 @@ async def fetch_optifine_cape(
         UUID to fetch the optifine cape for
     session: aiohttp.ClientSession
         The ClientSession to use for requests
-        Defaults to a new session which is closed again after handling all requests
+    client: MinePIClient
+        The client to use for requests
+        Defaults to a shared client with pooled connections
 
     Returns
     -------
@@ -301,31 +438,20 @@ async def fetch_optifine_cape(
     if player is None and name is None and uuid is None:
         raise ValueError("At least one parameter must be passed")
 
-    if session is None:
-        session = aiohttp.ClientSession()
-        close = True
-    else:
-        close = False
+    client = resolve_client(session, client)
 
     if player is not None:
         name = player.name
     elif name is not None:
         pass
     else:
-        name = await uuid_to_name(uuid, session)
+        name = await uuid_to_name(uuid, client=client)
 
     if name is not None:
-        async with session.get(f"http://s.optifine.net/capes/{name}.png") as resp:
-            if resp.status == 200:
-                cape = Image.open(BytesIO(await resp.read()))
-            else:
-                cape = None
+        cape = await _fetch_provider_cape("optifine", name, client.url("optifine", f"/capes/{name}.png"), client)
     else:
         cape = None
 
-    if close:
-        await session.close()
-
     return cape
 
 
@@ -333,7 +459,8 @@ async def fetch_labymod_cape(
         player: "Player" = None,
         name: str = None,
         uuid: str = None,
-        session: aiohttp.ClientSession = None
+        session: aiohttp.ClientSession = None,
+        client: MinePIClient = None
 ) -> Optional[Image.Image]:
     """Fetch a players labymod cape
 
@@ -352,7 +479,9 @@ async def fetch_labymod_cape(
         UUID to fetch the labymod cape for
     session: aiohttp.ClientSession
         The ClientSession to use for requests
-        Defaults to a new session which is closed again after handling all requests
+    client: MinePIClient
+        The client to use for requests
+        Defaults to a shared client with pooled connections
 
     Returns
     -------
@@ -367,34 +496,23 @@ async def fetch_labymod_cape(
     if player is None and name is None and uuid is None:
         raise ValueError("At least one parameter must be passed")
 
-    if session is None:
-        session = aiohttp.ClientSession()
-        close = True
-    else:
-        close = False
+    client = resolve_client(session, client)
 
     if player is not None:
         uuid = player.uuid
     elif uuid is not None:
         pass
     else:
-        uuid = await name_to_uuid(name, session)
+        uuid = await name_to_uuid(name, client=client)
 
     if uuid is not None:
         if len(uuid) == 32:
             uuid = uuid_to_dashed(uuid)
 
-        async with session.get(f"https://dl.labymod.net/capes/{uuid}") as resp:
-            if resp.status == 200:
-                cape = Image.open(BytesIO(await resp.read()))
-            else:
-                cape = None
+        cape = await _fetch_provider_cape("labymod", uuid, client.url("labymod", f"/capes/{uuid}"), client)
     else:
         cape = None
 
-    if close:
-        await session.close()
-
     return cape
 
 
@@ -402,7 +520,8 @@ async def fetch_5zig_cape(
         player: "Player" = None,
         name: str = None,
         uuid: str = None,
-        session: aiohttp.ClientSession = None
+        session: aiohttp.ClientSession = None,
+        client: MinePIClient = None
 ) -> Optional[Image.Image]:
     """Fetch a players 5Zig cape
 
@@ -427,7 +546,9 @@ async def fetch_5zig_cape(
         UUID to fetch the 5Zig cape for
     session: aiohttp.ClientSession
         The ClientSession to use for requests
-        Defaults to a new session which is closed again after handling all requests
+    client: MinePIClient
+        The client to use for requests
+        Defaults to a shared client with pooled connections
 
     Returns
     -------
@@ -442,34 +563,23 @@ async def fetch_5zig_cape(
     if player is None and name is None and uuid is None:
         raise ValueError("At least one parameter must be passed")
 
-    if session is None:
-        session = aiohttp.ClientSession()
-        close = True
-    else:
-        close = False
+    client = resolve_client(session, client)
 
     if player is not None:
         uuid = player.uuid
     elif uuid is not None:
         pass
     else:
-        uuid = await name_to_uuid(name, session)
+        uuid = await name_to_uuid(name, client=client)
 
     if uuid is not None:
         if len(uuid) == 32:
             uuid = uuid_to_dashed(uuid)
 
-        async with session.get(f"https://textures.5zigreborn.eu/profile/{uuid}") as resp:
-            if resp.status == 200:
-                cape = Image.open(BytesIO(await resp.read()))
-            else:
-                cape = None
+        cape = await _fetch_provider_cape("5zig", uuid, client.url("5zig", f"/profile/{uuid}"), client)
     else:
         cape = None
 
-    if close:
-        await session.close()
-
     return cape
 
 
@@ -477,7 +587,8 @@ async def fetch_minecraftcapes_cape(
         player: "Player" = None,
         name: str = None,
         uuid: str = None,
-        session: aiohttp.ClientSession = None
+        session: aiohttp.ClientSession = None,
+        client: MinePIClient = None
 ) -> Optional[Image.Image]:
     """Fetch a players MinecraftCapes cape
 
@@ -500,7 +611,9 @@ async def fetch_minecraftcapes_cape(
         UUID to fetch the MinecraftCapes cape for
     session: aiohttp.ClientSession
         The ClientSession to use for requests
-        Defaults to a new session which is closed again after handling all requests
+    client: MinePIClient
+        The client to use for requests
+        Defaults to a shared client with pooled connections
 
     Returns
     -------
@@ -515,34 +628,23 @@ async def fetch_minecraftcapes_cape(
     if player is None and name is None and uuid is None:
         raise ValueError("At least one parameter must be passed")
 
-    if not session:
-        session = aiohttp.ClientSession()
-        close = True
-    else:
-        close = False
+    client = resolve_client(session, client)
 
     if player is not None:
         uuid = player.uuid
     elif uuid is not None:
         pass
     else:
-        uuid = await name_to_uuid(name, session)
+        uuid = await name_to_uuid(name, client=client)
 
     if uuid is not None:
         if len(uuid) == 36:
             uuid = uuid_to_undashed(uuid)
 
-        async with session.get(f"https://minecraftcapes.net/profile/{uuid}/cape") as resp:
-            if resp.status == 200:
-                cape = Image.open(BytesIO(await resp.read()))
-            else:
-                cape = None
+        cape = await _fetch_provider_cape("minecraftcapes", uuid, client.url("minecraftcapes", f"/profile/{uuid}/cape"), client)
     else:
         cape = None
 
-    if close:
-        await session.close()
-
     return cape
 
 
@@ -550,7 +652,8 @@ async def fetch_tlauncher_cape(
         player: "Player" = None,
         name: str = None,
         uuid: str = None,
-        session: aiohttp.ClientSession = None
+        session: aiohttp.ClientSession = None,
+        client: MinePIClient = None
 ) -> Optional[Image.Image]:
     """Fetch a players TLauncher cape
 
@@ -577,7 +680,9 @@ async def fetch_tlauncher_cape(
         UUID to fetch the TLauncher cape for
     session: aiohttp.ClientSession
         The ClientSession to use for requests
-        Defaults to a new session which is closed again after handling all requests
+    client: MinePIClient
+        The client to use for requests
+        Defaults to a shared client with pooled connections
 
     Returns
     -------
@@ -587,77 +692,214 @@ async def fetch_tlauncher_cape(
     Raises
     ------
     ValueError
-        No :py:class:`minepi.Player`, name or UUID has been passed
+        No :py:class:`minepi.Player`, name or UUID has been passed or TLauncher answered with unexpected JSON
     """
     if player is None and name is None and uuid is None:
         raise ValueError()
 
-    if session is None:
-        session = aiohttp.ClientSession()
-        close = True
-    else:
-        close = False
+    client = resolve_client(session, client)
 
     if player is not None:
         name = player.name
     elif name is not None:
         pass
     else:
-        name = await uuid_to_name(uuid, session)
+        name = await uuid_to_name(uuid, client=client)
 
     cape = None
-    if name is not None:
-        async with session.get(f"https://auth.tlauncher.org/skin/profile/texture/login/{name}") as resp:
+    scope = client.cache_scope("tlauncher")
+    if name is not None and cape_cache.get("tlauncher", name, scope) is not None:  # None: known to have no cape
+        async with client.get(client.url("tlauncher", f"/skin/profile/texture/login/{name}")) as resp:
             if resp.status == 200:
                 resp_dict = await resp.json()
-                cape_url = resp_dict["CAPE"]["url"] if "CAPE" in resp_dict.keys() else None
+                try:
+                    cape_url = resp_dict["CAPE"]["url"] if "CAPE" in resp_dict else None
+                except (KeyError, TypeError) as exc:
+                    raise ValueError("Unexpected TLauncher response") from exc
+                if cape_url is None:
+                    cape_cache.put_missing("tlauncher", name, scope)
             else:
                 cape_url = None
 
         if cape_url is not None:
-            if not cape_url.startswith("http://textures.minecraft.net/"):
-                async with session.get(cape_url) as resp:
-                    if resp.status == 200:
-                        cape = Image.open(BytesIO(await resp.read()))
-
-    if close:
-        await session.close()
+            if not cape_url.startswith(client.url("textures", "/")):
+                cape = await _fetch_provider_cape("tlauncher", name, cape_url, client)
 
     return cape
 
 
-async def get_players_by_name(names: list, session: aiohttp.ClientSession = None):
+async def _request_profiles(names: list, client: MinePIClient, semaphore: asyncio.Semaphore) -> list:
+    async with semaphore:
+        async with client.post(client.url("api", "/profiles/minecraft"), json=names) as resp:
+            if resp.status != 200:
+                # the names of this chunk are unknown, not missing
+                raise aiohttp.ClientError(f"Profile lookup failed with status {resp.status}")
+            entries = await resp.json()
+
+    scope = _mojang_scope(client)
+    found = set()
+    for entry in entries:
+        name_cache.put(entry["name"], entry["id"], scope)
+        found.add(entry["name"].lower())
+    for name in names:
+        if name.lower() not in found:
+            name_cache.put_missing_name(name, scope)
+    return entries
+
+
+async def get_players_by_name(
+        names: list,
+        session: aiohttp.ClientSession = None,
+        client: MinePIClient = None,
+        concurrency: int = 4,
+        with_missing: bool = False,
+):
     """Useful helper function to get multiple :py:class:`minepi.Player` objects
 
-    Only does one API call for the entire list instead of one per player
+    Only does one API call per 10 names instead of one per player
     This is recommended to be used if you have a list of usernames
 
+    Note
+    ----
+    Names are case insensitive, duplicates are only returned once.
+    Names already resolved by :py:data:`minepi.name_cache` don't need an API call.
+
     Parameters
     ----------
     names: list
         A list of minecraft usernames
     session: aiohttp.ClientSession
         The ClientSession to use for requests
-        Defaults to a new session which is closed again after handling all requests
+    client: MinePIClient
+        The client to use for requests
+        Defaults to a shared client with pooled connections
+    concurrency: int
+        Maximum number of batch requests sent at the same time
+    with_missing: bool
+        Also return the names which don't belong to any player
 
     Returns
     -------
-    list
-        A list of :py:class:`minepi.Player` objects
+    Union[list, Tuple[list, list]]
+        A list of :py:class:`minepi.Player` objects in the order of the given names.
+        If ``with_missing`` is set, a tuple of this list and a list of names which have not been found
+
+    Raises
+    ------
+    aiohttp.ClientError
+        A batch request failed. Names of the successful batches are cached nevertheless
     """
-    if session is None:
-        session = aiohttp.ClientSession()
-        close = True
-    else:
-        close = False
+    client = resolve_client(session, client)
 
-    players = []
-    async with session.post("https://api.mojang.com/profiles/minecraft", json=names) as resp:
-        if resp.status == 200:
-            for entry in await resp.json():
-                players.append(Player(uuid=entry["id"], name=entry["name"], session=session if not close else None))
+    from .player import Player
+
+    unique = {}
+    for name in names:
+        unique.setdefault(name.lower(), name)  # the first spelling wins
+    unique = list(unique.values())
+
+    scope = _mojang_scope(client)
+    resolved = {}  # lowercase name -> (uuid, name)
+    unknown = []
+    for name in unique:
+        uuid = name_cache.get_uuid(name, scope)
+        if uuid is name_cache.MISSING:
+            unknown.append(name)
+        elif uuid is not None:
+            cached_name = name_cache.get_name(uuid, scope)
+            resolved[name.lower()] = (uuid, name if cached_name in (None, name_cache.MISSING) else cached_name)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    chunks = [unknown[i:i + _PROFILES_BATCH_SIZE] for i in range(0, len(unknown), _PROFILES_BATCH_SIZE)]
+    results = await asyncio.gather(
+        *[_request_profiles(chunk, client, semaphore) for chunk in chunks],
+        return_exceptions=True,
+    )
+    for entries in results:
+        if isinstance(entries, BaseException):
+            raise entries
+        for entry in entries:
+            resolved[entry["name"].lower()] = (entry["id"], entry["name"])
 
-    if close:
-        await session.close()
+    players = []
+    missing = []
+    for name in unique:
+        if name.lower() in resolved:
+            uuid, resolved_name = resolved[name.lower()]
+            players.append(Player(uuid=uuid, name=resolved_name, client=client))
+        else:
+            missing.append(name)
 
+    if with_missing:
+        return players, missing
     return players
+
+
+async def load_players(
+        uuids: Iterable[str],
+        session: aiohttp.ClientSession = None,
+        client: MinePIClient = None,
+        concurrency: int = 50,
+) -> AsyncIterator["Player"]:
+    """Initialize many :py:class:`minepi.Player` objects by their UUIDs
+
+    At most ``concurrency`` players are initialized at the same time, all of them share one client.
+    Players are yielded as soon as they are initialized, so not necessarily in the given order.
+    Invalid or malformed UUIDs are skipped, so are players whose requests fail.
+
+    Tip
+    ----
+    ::
+
+        async with minepi.MinePIClient() as client:
+            async for player in minepi.load_players(uuids, client=client):
+                print(player.name)
+
+    Parameters
+    ----------
+    uuids: Iterable[str]
+        The UUIDs of the players. Consumed lazily, so generators work as well
+    session: aiohttp.ClientSession
+        The ClientSession to use for requests
+    client: MinePIClient
+        The client to use for requests
+        Defaults to a shared client with pooled connections
+    concurrency: int
+        Maximum number of players initialized at the same time
+
+    Yields
+    ------
+    Player
+        Initialized players
+    """
+    client = resolve_client(session, client)
+
+    from .player import Player
+
+    async def load(uuid: str) -> Optional[Player]:
+        try:
+            player = Player(uuid=uuid, client=client)
+            await player.initialize()
+        except (InvalidPlayer, aiohttp.ClientError, asyncio.TimeoutError, OSError, ValueError):
+            return None  # malformed UUIDs and failed requests must not end the iteration
+        return player if player.skin is not None else None
+
+    uuids = iter(uuids)
+    pending = set()
+    try:
+        while True:
+            for uuid in uuids:
+                pending.add(asyncio.ensure_future(load(uuid)))
+                if len(pending) >= concurrency:
+                    break
+            if not pending:
+                break
+
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                player = task.result()
+                if player is not None:
+                    yield player
+    finally:
+        for task in pending:
+            task.cancel()
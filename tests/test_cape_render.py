@@ -0,0 +1,21 @@
+import asyncio
+
+from PIL import Image
+
+import minepi
+
+
+TOP = (0, 255, 0, 255)
+OUTSIDE = (255, 0, 0, 255)
+
+
+def test_hd_cape_top_face_is_scaled():
+    # 128x64 is a cape of scale 2, its top face starts at x=2
+    cape = Image.new("RGBA", (128, 64), (0, 0, 255, 255))
+    for x in range(2, 22):
+        cape.putpixel((x, 0), TOP)
+    cape.putpixel((1, 0), OUTSIDE)
+    skin = minepi.Skin(raw_skin=Image.new("RGBA", (64, 64), (128, 128, 128, 255)), raw_cape=cape)
+
+    asyncio.run(skin.render_skin(hr=200, vr=-40))
+    assert {color for _, color in skin.opacity_index[("cape", "top")]} == {TOP}
@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+import minepi
+from minepi import player as player_module
+
+
+UUID = "0" * 31 + "1"
+
+
+async def _broken_image(player, client=None):
+    return await minepi.utils._decode_image(b"not an image")
+
+
+async def _bug(player, client=None):
+    return {}["missing"]
+
+
+async def _fetch_all_capes(providers: list) -> dict:
+    async with minepi.MinePIClient() as client:
+        player = minepi.Player(uuid=UUID, name="Steve", client=client)
+        return await player.fetch_all_capes(providers=providers)
+
+
+def test_fetch_all_capes_skips_undecodable_images(monkeypatch):
+    monkeypatch.setitem(player_module._CAPE_PROVIDERS, "optifine", _broken_image)
+    assert asyncio.run(_fetch_all_capes(["optifine"]))["optifine"] is None
+
+
+def test_fetch_all_capes_propagates_bugs(monkeypatch):
+    monkeypatch.setitem(player_module._CAPE_PROVIDERS, "optifine", _bug)
+    with pytest.raises(KeyError):
+        asyncio.run(_fetch_all_capes(["optifine"]))
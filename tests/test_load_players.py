@@ -0,0 +1,35 @@
+import asyncio
+
+import aiohttp
+
+import minepi
+from minepi.fake_server import FakeMojangServer
+
+
+FAILING_UUID = "f" * 32
+
+
+class FailingTransport(minepi.AiohttpTransport):
+    """Lets every request concerning :data:`FAILING_UUID` fail like a broken connection"""
+
+    async def request(self, method: str, url: str, **kwargs):
+        if FAILING_UUID in url:
+            raise aiohttp.ClientConnectionError("connection reset")
+        return await super().request(method, url, **kwargs)
+
+
+async def _load(uuids: list) -> list:
+    async with FakeMojangServer() as server:
+        async with minepi.MinePIClient(endpoints=server.endpoints, transport=FailingTransport()) as client:
+            return [player async for player in minepi.load_players(uuids, client=client, concurrency=2)]
+
+
+def test_load_players_skips_malformed_and_failing_uuids():
+    minepi.profile_cache.clear()
+    valid = [f"{i:032x}" for i in range(1, 5)]
+    uuids = valid[:2] + ["not-a-uuid", FAILING_UUID] + valid[2:]
+
+    players = asyncio.run(_load(uuids))
+
+    assert sorted(player.uuid for player in players) == valid
+    assert all(player.skin is not None for player in players)
@@ -0,0 +1,54 @@
+import pytest
+from PIL import Image
+
+import minepi
+
+
+def _skin() -> minepi.Skin:
+    skin = Image.new("RGBA", (64, 64), (200, 100, 50, 255))
+    cape = Image.new("RGBA", (64, 32), (10, 20, 30, 255))
+    return minepi.Skin(raw_skin=skin, raw_cape=cape, raw_skin_url="http://example.com/skin", name="Steve")
+
+
+def _decode(data):
+    """Decodes eagerly and lazily, forcing the lazy skin to touch its pixel data"""
+    minepi.Skin.decode(data)
+    minepi.LazySkin(data).raw_skin
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_decode_truncated(compress):
+    data = _skin().encode(compress=compress)
+    for length in (4, 10, 20, len(data) // 2, len(data) - 1):
+        with pytest.raises(ValueError):
+            _decode(data[:length])
+
+
+def test_decode_bit_flipped():
+    data = bytearray(_skin().encode(compress=True))
+    data[-10] ^= 0x40  # inside the compressed cape plane, caught by the zlib checksum
+    with pytest.raises(ValueError):
+        _decode(bytes(data))
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_decode_never_leaks_other_errors(compress):
+    data = _skin().encode(compress=compress)
+    for i in range(0, len(data), max(1, len(data) // 200)):
+        corrupt = bytearray(data)
+        corrupt[i] ^= 0xff
+        for sample in (bytes(corrupt), data[:i]):
+            try:
+                _decode(sample)
+            except ValueError:
+                pass
+
+
+def test_decodeb64_corrupt():
+    b64 = _skin().encodeb64()
+    with pytest.raises(ValueError):
+        minepi.Skin.decodeb64(b64[:len(b64) // 2])
+    with pytest.raises(ValueError):
+        minepi.Skin.decodeb64("bm90IGFuIGltYWdl")  # "not an image"
+    with pytest.raises(ValueError):
+        minepi.LazySkin(b64[:len(b64) // 2]).raw_skin